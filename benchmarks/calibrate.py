@@ -0,0 +1,126 @@
+"""
+Калибровка генератора нагрузки: максимальный RPS одного процесса Locust (одного ядра) для сценария.
+
+Запуск: python -m benchmarks.calibrate ./scenarios/http/gateway/existing_user_get_operations/v1.0.conf
+        [--users 50] [--run-time 30s] [--target-rps 3000]
+
+Сценарий запускается одним процессом Locust в закрытой модели без пауз против stand-in серверов
+без задержки (STAND_IN.HOST, STAND_IN.HTTP_PORT / STAND_IN.GRPC_PORT), так что узким местом
+становится сам генератор. Контроль насыщения (tools/locust/saturation.py) считает запросы
+и процессорное время процесса; RPS на ядро = запросы / CPU-секунды.
+
+С --target-rps выводится, сколько воркеров нужно для целевой частоты, если держать каждый
+не выше --headroom от его предела (запас на задержку цикла gevent и коррекцию времени ответа).
+
+Сидинг сценария выполняется заново во временном каталоге дампов (SEEDS.CACHE=false,
+SEEDS.DUMPS_DIR), поэтому данные stand-in не попадают в ./dumps. Если запросов не было или
+Locust завершился с ошибкой (неуспешные запросы, исключения в задачах), калибровка
+считается недействительной и команда завершается с ненулевым кодом.
+"""
+import argparse
+import glob
+import json
+import math
+import os
+import subprocess
+import sys
+import tempfile
+
+from config import settings
+from servers.launcher import run_stand_in_servers
+
+
+def build_locust_command(path: str, users: int, run_time: str, html: str) -> list[str]:
+    """
+    Команда запуска сценария: путь к v1.0.conf или к файлу сценария; параметры калибровки заменяют заданные в конфиге.
+    """
+    source = ["--config", path] if path.endswith(".conf") else ["-f", path]
+    return [
+        sys.executable, "-m", "locust", *source,
+        "--headless",
+        "--users", str(users),
+        "--spawn-rate", str(users),
+        "--run-time", run_time,
+        "--only-summary",
+        "--exit-code-on-error", "1",
+        "--html", html,
+    ]
+
+
+def build_locust_env(work_dir: str) -> dict[str, str]:
+    """
+    Окружение процесса Locust: клиенты направлены на stand-in, паузы выключены, контроль насыщения включён,
+    отчёт насыщения и дампы сидинга пишутся во временный каталог work_dir.
+    """
+    host = settings.stand_in.host
+    return {
+        **os.environ,
+        "GATEWAY_HTTP_CLIENT.URL": f"http://{host}:{settings.stand_in.http_port}",
+        "GATEWAY_GRPC_CLIENT.HOST": host,
+        "GATEWAY_GRPC_CLIENT.PORT": str(settings.stand_in.grpc_port),
+        "LOCUST_USER.LOAD_MODEL": "closed",
+        "LOCUST_USER.WAIT_TIME_MIN": "0",
+        "LOCUST_USER.WAIT_TIME_MAX": "0",
+        "SATURATION.GUARD": "true",
+        "SATURATION.ACTION": "flag",
+        "SATURATION.REPORT_DIR": work_dir,
+        "SEEDS.CACHE": "false",
+        "SEEDS.DUMPS_DIR": os.path.join(work_dir, "dumps"),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", help="v1.0.conf сценария или файл scenario.py")
+    parser.add_argument("--users", type=int, default=50, help="Количество виртуальных пользователей")
+    parser.add_argument("--run-time", default="30s", help="Длительность замера (формат Locust: 30s, 2m)")
+    parser.add_argument("--target-rps", type=float, help="Целевая частота запросов всего теста")
+    parser.add_argument("--headroom", type=float, default=0.7, help="Доля предела, до которой загружается воркер")
+    parser.add_argument("--external", action="store_true", help="Не запускать stand-in серверы, использовать запущенные")
+    args = parser.parse_args()
+
+    stand_in = settings.stand_in
+    stand_ins = run_stand_in_servers(
+        http_address=None if args.external else (stand_in.host, stand_in.http_port),
+        grpc_address=None if args.external else (stand_in.host, stand_in.grpc_port)
+    )
+
+    with tempfile.TemporaryDirectory() as work_dir, stand_ins:
+        process = subprocess.run(
+            build_locust_command(args.path, args.users, args.run_time, os.path.join(work_dir, "report.html")),
+            env=build_locust_env(work_dir)
+        )
+        reports = sorted(glob.glob(os.path.join(work_dir, "*.json")))
+        if not reports:
+            sys.exit(f"Locust exited with code {process.returncode} without a saturation report")
+
+        with open(reports[-1], encoding="utf-8") as file:
+            report = json.load(file)
+            total = report["total"]
+
+    print(f"\nCalibration of {args.path} ({args.users} users, {args.run_time}, one process)")
+    print(f"Requests:           {total['requests']}")
+    print(f"CPU seconds:        {total['cpu_seconds']:.1f}")
+    print(f"Max CPU:            {total['cpu_max']:.0f}%")
+    print(f"Max gevent lag:     {total['loop_lag_max']:.1f} ms")
+    print(f"RPS per core:       {total['rps_per_core']:.0f}")
+
+    if total["requests"] == 0:
+        sys.exit("Calibration failed: no requests were made, check the scenario output above")
+    if process.returncode != 0:
+        sys.exit(
+            f"Calibration failed: Locust exited with code {process.returncode} (failed requests or task errors), "
+            f"the measured rate does not reflect the scenario"
+        )
+
+    if not report["saturated"]:
+        print("Note: the process stayed below the saturation thresholds; increase --users for a tighter estimate")
+
+    if args.target_rps:
+        capacity = total["rps_per_core"] * args.headroom
+        workers = math.ceil(args.target_rps / capacity) if capacity else 0
+        print(f"Workers for {args.target_rps:.0f} RPS at {args.headroom:.0%} load: {workers}")
+
+
+if __name__ == "__main__":
+    main()
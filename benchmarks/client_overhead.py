@@ -0,0 +1,418 @@
+"""
+Накладные расходы клиентского стека на каждый метод *GatewayHTTPClient и *GatewayGRPCClient.
+
+Запуск: python -m benchmarks.client_overhead [--number 2000] [--save PATH] [--baseline PATH]
+
+Методы вызываются так же, как в нагрузочных сценариях (Locust-клиенты с хуками и интерцептором,
+статистика Locust включена), против stand-in серверов без задержки и ошибок. Stand-in серверы
+запускаются отдельными процессами на адресах GATEWAY_HTTP_CLIENT.URL и GATEWAY_GRPC_CLIENT.HOST/PORT,
+поэтому их CPU не попадает в замер (--external — использовать уже запущенные).
+
+Для каждого метода выводятся:
+- wall и cpu ns/op — время вызова и процессорное время процесса бенчмарка на вызов;
+- RPS/core — сколько вызовов в секунду генерирует одно ядро (1e9 / cpu ns/op);
+- alloc — пиковый объём памяти, выделяемой за вызов (tracemalloc);
+- разбивка по слоям в ns/op:
+  build — остаток: построение схем/сообщений запроса, httpx.Request (разбор URL) и диспетчеризация httpx и клиента;
+  dump  — сериализация тела запроса (codec.dump_model / SerializeToString);
+  call  — транспорт: отправка, ожидание ответа stand-in сервера и чтение тела ответа;
+  hooks — event hooks httpx и отправка событий Locust / интерцептор Locust;
+  parse — валидация ответа (validator.parse) / разбор protobuf (FromString).
+
+--save сохраняет результаты вместе с ревизией git, --baseline сравнивает с сохранёнными
+и завершается с кодом 1, если cpu ns/op какого-либо метода вырос больше порога.
+"""
+import argparse
+import inspect
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterator
+
+import httpcore  # noqa: F401 — импорт до locust, иначе gevent monkey patching ломает httpcore
+from grpc import insecure_channel
+from httpx import Request, Response, SyncByteStream
+from locust.env import Environment
+
+# Инициализирует gevent в gRPC так же, как в нагрузочных сценариях
+from clients.grpc.client import GRPCClient
+from clients.grpc.gateway.accounts.client import AccountsGatewayGRPCClient
+from clients.grpc.gateway.cards.client import CardsGatewayGRPCClient
+from clients.grpc.gateway.documents.client import DocumentsGatewayGRPCClient
+from clients.grpc.gateway.operations.client import OperationsGatewayGRPCClient
+from clients.grpc.gateway.users.client import UsersGatewayGRPCClient
+from clients.grpc.interceptors.locust_interceptor import LocustInterceptor, intercept_locust_channel
+from clients.http.client import HTTPClient
+from clients.http.gateway.accounts.client import build_accounts_gateway_locust_http_client
+from clients.http.gateway.cards.client import build_cards_gateway_locust_http_client
+from clients.http.gateway.client import build_gateway_locust_http_client
+from clients.http.gateway.documents.client import build_documents_gateway_locust_http_client
+from clients.http.gateway.operations.client import build_operations_gateway_locust_http_client
+from clients.http.gateway.users.client import build_users_gateway_locust_http_client
+from config import settings
+from servers.launcher import run_stand_in_servers
+from tools.revision import get_git_revision
+
+HTTP_CLIENT_BUILDERS = [
+    build_users_gateway_locust_http_client,
+    build_accounts_gateway_locust_http_client,
+    build_cards_gateway_locust_http_client,
+    build_documents_gateway_locust_http_client,
+    build_operations_gateway_locust_http_client,
+]
+GRPC_CLIENT_CLASSES = [
+    UsersGatewayGRPCClient,
+    AccountsGatewayGRPCClient,
+    CardsGatewayGRPCClient,
+    DocumentsGatewayGRPCClient,
+    OperationsGatewayGRPCClient,
+]
+
+# Stand-in не проверяет идентификаторы, поэтому все методы получают одни и те же значения
+ARGUMENTS = {name: str(uuid.uuid4()) for name in ("user_id", "account_id", "card_id", "operation_id")}
+
+LAYERS = ("build", "dump", "call", "hooks", "parse")
+
+
+class LayerTimer:
+    """
+    Копит время вызовов обёрнутых функций по слоям клиентского стека.
+
+    Обёртка стоит ~100 нс на вызов; это время попадает в слой build (остаток).
+    """
+
+    def __init__(self):
+        self.totals = dict.fromkeys(LAYERS, 0)
+
+    def reset(self) -> None:
+        self.totals = dict.fromkeys(LAYERS, 0)
+
+    def wrap(self, layer: str, func: Callable) -> Callable:
+        def timed(*args, **kwargs):
+            started_at = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.totals[layer] += time.perf_counter_ns() - started_at
+
+        return timed
+
+
+class TimedByteStream(SyncByteStream):
+    """
+    Поток тела ответа транспорта, относящий чтение тела к слою call.
+
+    handle_request транспорта возвращает ответ сразу после заголовков, а тело httpx читает уже после,
+    поэтому без этой обёртки загрузка тела попадала бы в остаток build.
+    """
+
+    def __init__(self, stream: SyncByteStream, timer: LayerTimer):
+        self.stream = stream
+        self.timer = timer
+
+    def __iter__(self) -> Iterator[bytes]:
+        iterator = iter(self.stream)
+        while True:
+            started_at = time.perf_counter_ns()
+            chunk = next(iterator, None)
+            self.timer.totals["call"] += time.perf_counter_ns() - started_at
+            if chunk is None:
+                return
+            yield chunk
+
+    def close(self) -> None:
+        started_at = time.perf_counter_ns()
+        self.stream.close()
+        self.timer.totals["call"] += time.perf_counter_ns() - started_at
+
+
+class BenchmarkCase:
+    """
+    Один метод клиента: вызов с подготовленными аргументами и расчёт разбивки по слоям.
+    """
+
+    def __init__(self, protocol: str, client: Any, method: str):
+        self.protocol = protocol
+        self.name = f"{type(client).__name__}.{method}"
+        func = getattr(client, method)
+        kwargs = {name: ARGUMENTS[name] for name in inspect.signature(func).parameters}
+        self.call = lambda: func(**kwargs)
+
+    def layers(self, timer: LayerTimer, number: int, total: int) -> dict[str, float]:
+        layers = {layer: timer.totals[layer] / number for layer in LAYERS if layer != "build"}
+        layers["build"] = max(total / number - sum(layers.values()), 0.0)
+        return layers
+
+
+class GRPCBenchmarkCase(BenchmarkCase):
+    """
+    Метод gRPC-клиента. Сериализация и разбор protobuf выполняются внутри вызова канала,
+    поэтому измеряются отдельно на последних запросе и ответе и вычитаются из call.
+    """
+
+    def __init__(self, protocol: str, client: Any, method: str, interceptor: "InstrumentedLocustInterceptor"):
+        super().__init__(protocol, client, method)
+        self.interceptor = interceptor
+
+    def layers(self, timer: LayerTimer, number: int, total: int) -> dict[str, float]:
+        request, response = self.interceptor.last_request, self.interceptor.last_response
+        payload = response.SerializeToString()
+        dump = measure_ns(request.SerializeToString, number)
+        parse = measure_ns(lambda: type(response).FromString(payload), number)
+        call = timer.totals["call"] / number
+        layers = {
+            "dump": dump,
+            "call": max(call - dump - parse, 0.0),
+            # Интерцептор обёрнут целиком, вместе с продолжением вызова
+            "hooks": max(timer.totals["hooks"] / number - call, 0.0),
+            "parse": parse,
+        }
+        layers["build"] = max(total / number - call - layers["hooks"], 0.0)
+        return layers
+
+
+class InstrumentedLocustInterceptor(LocustInterceptor):
+    """
+    LocustInterceptor, замеряющий себя и продолжение вызова и запоминающий последние запрос и ответ.
+    """
+
+    def __init__(self, environment: Environment, timer: LayerTimer):
+        super().__init__(environment)
+        self.timer = timer
+        self.last_request: Any = None
+        self.last_response: Any = None
+        self.intercept_unary_unary = timer.wrap("hooks", self.intercept_unary_unary)
+
+    def start(self, continuation, client_call_details, request):
+        call = self.timer.wrap("call", continuation)
+        outcome, metrics = super().start(call, client_call_details, request)
+        if outcome.exception() is None:
+            self.last_request, self.last_response = request, outcome.result()
+        return outcome, metrics
+
+
+def public_methods(client_class: type) -> list[str]:
+    """
+    Высокоуровневые методы клиента (без низкоуровневых *_api).
+    """
+    return [
+        name for name, value in vars(client_class).items()
+        if inspect.isfunction(value) and not name.startswith("_") and not name.endswith("_api")
+    ]
+
+
+def build_environment() -> Environment:
+    environment = Environment()
+    # Раннер подписывает статистику Locust на events.request, как в реальном запуске
+    environment.create_local_runner()
+    return environment
+
+
+def build_http_cases(timer: LayerTimer) -> list[BenchmarkCase]:
+    environment = build_environment()
+    # Событие оборачивается до создания клиентов: хук ответа запоминает fire при создании
+    environment.events.request.fire = timer.wrap("hooks", environment.events.request.fire)
+
+    client = build_gateway_locust_http_client(environment)
+    client.event_hooks = {
+        name: [timer.wrap("hooks", hook) for hook in hooks]
+        for name, hooks in client.event_hooks.items()
+    }
+    # Публичного способа обернуть транспорт готового httpx.Client нет
+    handle_request = timer.wrap("call", client._transport.handle_request)
+
+    def timed_handle_request(request: Request) -> Response:
+        response = handle_request(request)
+        response.stream = TimedByteStream(response.stream, timer)
+        return response
+
+    client._transport.handle_request = timed_handle_request
+
+    cases = []
+    for builder in HTTP_CLIENT_BUILDERS:
+        gateway_client: HTTPClient = builder(environment, client=client)
+        gateway_client.codec.dump_model = timer.wrap("dump", gateway_client.codec.dump_model)
+        gateway_client.validator.parse = timer.wrap("parse", gateway_client.validator.parse)
+        cases.extend(BenchmarkCase("HTTP", gateway_client, method) for method in public_methods(type(gateway_client)))
+
+    return cases
+
+
+def build_grpc_cases(timer: LayerTimer) -> list[BenchmarkCase]:
+    interceptor = InstrumentedLocustInterceptor(build_environment(), timer)
+    channel = intercept_locust_channel(insecure_channel(settings.gateway_grpc_client.client_url), interceptor)
+
+    cases = []
+    for client_class in GRPC_CLIENT_CLASSES:
+        gateway_client: GRPCClient = client_class(channel)
+        cases.extend(
+            GRPCBenchmarkCase("gRPC", gateway_client, method, interceptor)
+            for method in public_methods(client_class)
+        )
+
+    return cases
+
+
+def measure_ns(func: Callable[[], object], number: int) -> float:
+    started_at = time.perf_counter_ns()
+    for _ in range(number):
+        func()
+    return (time.perf_counter_ns() - started_at) / number
+
+
+def measure_allocations(func: Callable[[], object], number: int) -> float:
+    """
+    Средний пиковый объём памяти (байт), выделяемой за один вызов.
+    """
+    if number <= 0:
+        return 0.0
+
+    tracemalloc.start()
+    try:
+        total = 0
+        for _ in range(number):
+            tracemalloc.reset_peak()
+            current, _ = tracemalloc.get_traced_memory()
+            func()
+            total += tracemalloc.get_traced_memory()[1] - current
+        return total / number
+    finally:
+        tracemalloc.stop()
+
+
+def run_case(case: BenchmarkCase, timer: LayerTimer, number: int, warmup: int, allocations: int) -> dict[str, Any]:
+    for _ in range(warmup):
+        case.call()
+
+    timer.reset()
+    wall_started_at, cpu_started_at = time.perf_counter_ns(), time.process_time_ns()
+    for _ in range(number):
+        case.call()
+    wall, cpu = time.perf_counter_ns() - wall_started_at, time.process_time_ns() - cpu_started_at
+
+    layers = case.layers(timer, number, wall)
+    return {
+        "protocol": case.protocol,
+        "wall_ns": wall / number,
+        "cpu_ns": cpu / number,
+        "rps_per_core": 1e9 * number / cpu if cpu else 0.0,
+        "alloc_bytes": measure_allocations(case.call, allocations),
+        "layers": layers,
+    }
+
+
+def print_results(results: dict[str, dict[str, Any]]) -> None:
+    width = max(map(len, results), default=6)
+    header = f"{'method':<{width}} {'wall ns':>9} {'cpu ns':>9} {'RPS/core':>9} {'alloc KiB':>9}"
+    print(header + "".join(f" {layer:>8}" for layer in LAYERS))
+    for name, result in results.items():
+        print(
+            f"{name:<{width}} {result['wall_ns']:>9.0f} {result['cpu_ns']:>9.0f} "
+            f"{result['rps_per_core']:>9.0f} {result['alloc_bytes'] / 1024:>9.1f}"
+            + "".join(f" {result['layers'][layer]:>8.0f}" for layer in LAYERS)
+        )
+
+    for protocol in sorted({result["protocol"] for result in results.values()}):
+        rps = {name: result["rps_per_core"] for name, result in results.items() if result["protocol"] == protocol}
+        slowest = min(rps, key=rps.get)
+        print(
+            f"\n{protocol}: median {statistics.median(rps.values()):.0f} RPS/core, "
+            f"slowest {slowest} {rps[slowest]:.0f} RPS/core"
+        )
+
+
+def compare_results(results: dict[str, dict[str, Any]], baseline: dict[str, Any], threshold: float) -> bool:
+    """
+    Сравнивает cpu ns/op с сохранёнными результатами.
+
+    :return: True, если ни один метод не стал медленнее больше чем на threshold процентов.
+    """
+    meta = baseline["meta"]
+    print(f"\nCompared with {meta['revision']} ({meta['created_at']}), threshold {threshold:.0f}%")
+    width = max(map(len, results), default=6)
+    print(f"{'method':<{width}} {'base ns':>9} {'cpu ns':>9} {'delta':>8}")
+
+    passed = True
+    for name, result in results.items():
+        base = baseline["results"].get(name)
+        if base is None:
+            print(f"{name:<{width}} {'-':>9} {result['cpu_ns']:>9.0f} {'new':>8}")
+            continue
+
+        delta = (result["cpu_ns"] / base["cpu_ns"] - 1) * 100
+        regression = delta > threshold
+        passed = passed and not regression
+        print(
+            f"{name:<{width}} {base['cpu_ns']:>9.0f} {result['cpu_ns']:>9.0f} {delta:>+7.1f}%"
+            + ("  REGRESSION" if regression else "")
+        )
+
+    return passed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=2_000, help="Количество вызовов каждого метода")
+    parser.add_argument("--warmup", type=int, default=200, help="Количество вызовов для прогрева")
+    parser.add_argument("--allocations", type=int, default=200, help="Количество вызовов под tracemalloc (0 — не мерить)")
+    parser.add_argument("--protocol", choices=("all", "http", "grpc"), default="all", help="Какие клиенты измерять")
+    parser.add_argument("--filter", default="", help="Измерять только методы, в имени которых есть подстрока")
+    parser.add_argument("--external", action="store_true", help="Не запускать stand-in серверы, использовать запущенные")
+    parser.add_argument("--save", help="Сохранить результаты в JSON-файл (baseline)")
+    parser.add_argument("--baseline", help="Сравнить с ранее сохранёнными результатами")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Допустимый рост cpu ns/op, %%")
+    args = parser.parse_args()
+
+    protocols = ["HTTP", "gRPC"] if args.protocol == "all" else ["HTTP" if args.protocol == "http" else "gRPC"]
+    timer = LayerTimer()
+    results: dict[str, dict[str, Any]] = {}
+
+    http_url, grpc_config = settings.gateway_http_client.url, settings.gateway_grpc_client
+    stand_ins = run_stand_in_servers(
+        http_address=(http_url.host, http_url.port) if "HTTP" in protocols and not args.external else None,
+        grpc_address=(grpc_config.host, grpc_config.port) if "gRPC" in protocols and not args.external else None
+    )
+    with stand_ins:
+        cases = []
+        if "HTTP" in protocols:
+            cases.extend(build_http_cases(timer))
+        if "gRPC" in protocols:
+            cases.extend(build_grpc_cases(timer))
+
+        for case in cases:
+            if args.filter in case.name:
+                key = f"{case.protocol} {case.name}"
+                results[key] = run_case(case, timer, args.number, args.warmup, args.allocations)
+
+    print_results(results)
+
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+        with open(args.save, "w", encoding="utf-8") as file:
+            json.dump({
+                "meta": {
+                    "revision": get_git_revision(),
+                    "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "number": args.number,
+                },
+                "results": results,
+            }, file, indent=2)
+        print(f"\nSaved to {args.save}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+        if not compare_results(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
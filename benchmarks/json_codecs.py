@@ -0,0 +1,101 @@
+"""
+Сравнение путей сериализации тел запросов и разбора ответов HTTP API клиентов.
+
+Запуск: python -m benchmarks.json_codecs [--number 20000]
+
+Для запросов измеряется полный путь до готового httpx.Request (как в HTTPClient.post),
+для ответов — разбор тела GetOperationsResponseSchema со списком операций.
+"""
+import argparse
+import json
+import timeit
+from typing import Callable
+
+from httpx import Request
+
+from clients.http.codecs import JSON_HEADERS, build_json_codec
+from clients.http.gateway.operations.schema import GetOperationsResponseSchema, MakePurchaseOperationRequestSchema
+from clients.http.validation import build_response_validator
+from tools.config.http import JSONCodecBackend, ResponseValidation
+
+URL = "http://localhost:8003/api/v1/operations/make-purchase-operation"
+
+
+def build_operations_body(count: int) -> bytes:
+    operation = {
+        "id": "3fa85f64-5717-4562-b3fc-2c963f66afa6",
+        "type": "PURCHASE",
+        "status": "COMPLETED",
+        "amount": 125.5,
+        "cardId": "3fa85f64-5717-4562-b3fc-2c963f66afa6",
+        "category": "supermarkets",
+        "createdAt": "2025-01-01T10:00:00Z",
+        "accountId": "3fa85f64-5717-4562-b3fc-2c963f66afa6",
+    }
+    return json.dumps({"operations": [operation] * count}).encode()
+
+
+def measure(name: str, func: Callable[[], object], number: int) -> None:
+    seconds = min(timeit.repeat(func, number=number, repeat=3))
+    print(f"{name:<48} {seconds / number * 1_000_000:>9.2f} us")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=20_000, help="Количество повторов для запросов")
+    parser.add_argument("--operations", type=int, default=200, help="Количество операций в ответе")
+    args = parser.parse_args()
+
+    request = MakePurchaseOperationRequestSchema(
+        card_id="3fa85f64-5717-4562-b3fc-2c963f66afa6",
+        account_id="3fa85f64-5717-4562-b3fc-2c963f66afa6"
+    )
+    pydantic_codec = build_json_codec(JSONCodecBackend.PYDANTIC)
+    orjson_codec = build_json_codec(JSONCodecBackend.ORJSON)
+
+    print("Request body -> httpx.Request")
+    measure(
+        "model_dump() + httpx json= (previous path)",
+        lambda: Request("POST", URL, json=request.model_dump(by_alias=True)),
+        args.number
+    )
+    measure(
+        "model_dump_json() + content=",
+        lambda: Request("POST", URL, content=request.model_dump_json(by_alias=True).encode(), headers=JSON_HEADERS),
+        args.number
+    )
+    measure(
+        "codec.dump_model() + content=",
+        lambda: Request("POST", URL, content=pydantic_codec.dump_model(request), headers=JSON_HEADERS),
+        args.number
+    )
+    measure(
+        f"{type(orjson_codec).__name__}.dumps(model_dump()) + content=",
+        lambda: Request("POST", URL, content=orjson_codec.dumps(request.model_dump(by_alias=True)), headers=JSON_HEADERS),
+        args.number
+    )
+
+    body = build_operations_body(args.operations)
+    number = max(args.number // args.operations, 10)
+    print(f"\nResponse body ({len(body)} bytes, {args.operations} operations)")
+    measure(
+        "model_validate_json(text) (previous path)",
+        lambda: GetOperationsResponseSchema.model_validate_json(body.decode()),
+        number
+    )
+    measure(
+        "model_validate_json(content) (full)",
+        lambda: GetOperationsResponseSchema.model_validate_json(body),
+        number
+    )
+    for codec in (pydantic_codec, orjson_codec):
+        validator = build_response_validator(ResponseValidation.STRUCTURAL, codec=codec)
+        measure(
+            f"structural, {type(codec).__name__}",
+            lambda: validator.parse(GetOperationsResponseSchema, body),
+            number
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+from grpc.aio import Channel
+
+
+class AsyncGRPCClient:
+    """
+    Базовый класс асинхронного gRPC-клиента.
+
+    Хранит grpc.aio-канал, через который выполняются вызовы из asyncio-кода.
+    В отличие от GRPCClient, модуль не инициализирует gevent: grpc.aio
+    не работает в процессе, где включена поддержка gevent или импортирован locust.
+    """
+
+    def __init__(self, channel: Channel):
+        """
+        Конструктор базового асинхронного клиента.
+
+        :param channel: grpc.aio-канал, через который происходит подключение к серверу.
+        """
+        self.channel = channel
+
+    async def close(self) -> None:
+        """
+        Закрывает канал клиента.
+        """
+        await self.channel.close()
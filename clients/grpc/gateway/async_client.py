@@ -0,0 +1,29 @@
+from typing import Any
+
+from grpc.aio import Channel, insecure_channel
+
+from clients.grpc.interceptors.async_locust_interceptor import build_async_locust_interceptors
+from clients.grpc.interceptors.metrics import MeteredAsyncChannel
+from config import settings
+
+
+def build_gateway_async_grpc_client(environment: Any | None = None) -> Channel:
+    """
+    Фабричная функция для создания grpc.aio-канала к сервису grpc-gateway.
+
+    Модуль намеренно не импортирует locust и clients.grpc.client:
+    gevent monkey patching и init_gevent() ломают работу grpc.aio.
+
+    :param environment: Среда с событиями сбора метрик (events.request, как у locust.env.Environment).
+        Если передана, вызовы канала регистрируются асинхронными интерцепторами Locust.
+    :return: Асинхронный gRPC-канал, настроенный на адрес из настроек.
+    """
+    if environment is None:
+        return insecure_channel(settings.gateway_grpc_client.client_url)
+
+    return MeteredAsyncChannel(
+        insecure_channel(
+            settings.gateway_grpc_client.client_url,
+            interceptors=build_async_locust_interceptors(environment)
+        )
+    )
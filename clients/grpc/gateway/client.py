@@ -1,8 +1,11 @@
-from grpc import Channel, insecure_channel, intercept_channel
+import threading
+
+from grpc import Channel, insecure_channel
 from locust.env import Environment
 
-from clients.grpc.interceptors.locust_interceptor import LocustInterceptor
+from clients.grpc.interceptors.locust_interceptor import LocustInterceptor, intercept_locust_channel
 from config import settings
+from tools.config.grpc import GRPCChannelPoolStrategy
 
 
 def build_gateway_grpc_client() -> Channel:
@@ -14,15 +17,104 @@ def build_gateway_grpc_client() -> Channel:
     return insecure_channel(settings.gateway_grpc_client.client_url)
 
 
+class GRPCChannelPool:
+    """
+    Пул gRPC-каналов к grpc-gateway, общий для всех виртуальных пользователей процесса Locust.
+
+    Каждый канал — отдельное HTTP/2-соединение, по которому мультиплексируются вызовы
+    многих клиентов. Все каналы обёрнуты одним экземпляром LocustInterceptor.
+    """
+
+    def __init__(self, environment: Environment, size: int, strategy: GRPCChannelPoolStrategy):
+        """
+        :param environment: Среда выполнения Locust (необходима для отправки событий).
+        :param size: Количество каналов в пуле.
+        :param strategy: Стратегия выбора канала для нового клиента.
+        """
+        self.strategy = strategy
+        self.interceptor = LocustInterceptor(environment=environment)
+        self.channels = [
+            intercept_locust_channel(
+                # Локальный пул сабканалов: без него каналы с одинаковым адресом
+                # делят одно TCP-соединение, и размер пула теряет смысл
+                insecure_channel(settings.gateway_grpc_client.client_url, options=[("grpc.use_local_subchannel_pool", 1)]),
+                self.interceptor
+            )
+            for _ in range(size)
+        ]
+        # Сколько клиентов сейчас использует каждый канал
+        self.leases = [0] * size
+        self.cursor = 0
+        self.lock = threading.Lock()
+
+    def acquire(self) -> Channel:
+        """
+        Выдаёт канал для нового клиента согласно стратегии пула.
+
+        :return: gRPC-канал с интерцептором Locust.
+        """
+        with self.lock:
+            if self.strategy == GRPCChannelPoolStrategy.LEAST_LOADED:
+                index = min(range(len(self.channels)), key=self.leases.__getitem__)
+            else:
+                index = self.cursor
+                self.cursor = (self.cursor + 1) % len(self.channels)
+
+            self.leases[index] += 1
+            return self.channels[index]
+
+    def release(self, channel: Channel) -> None:
+        """
+        Сообщает пулу, что клиент больше не использует канал. Сам канал не закрывается.
+
+        :param channel: Канал, ранее выданный через acquire().
+        """
+        with self.lock:
+            for index, pooled in enumerate(self.channels):
+                if pooled is channel and self.leases[index] > 0:
+                    self.leases[index] -= 1
+                    return
+
+    def close(self) -> None:
+        for channel in self.channels:
+            channel.close()
+
+
+def get_gateway_grpc_channel_pool(environment: Environment) -> GRPCChannelPool:
+    """
+    Возвращает пул каналов процесса (создаёт его при первом обращении и закрывает при завершении Locust).
+
+    :param environment: Среда выполнения Locust.
+    :return: Общий GRPCChannelPool.
+    """
+    pool = getattr(environment, "grpc_channel_pool", None)
+    if pool is None:
+        pool = GRPCChannelPool(
+            environment=environment,
+            size=settings.gateway_grpc_client.channel_pool_size,
+            strategy=settings.gateway_grpc_client.channel_pool_strategy
+        )
+        environment.grpc_channel_pool = pool
+        environment.events.quitting.add_listener(lambda **kwargs: pool.close())
+
+    return pool
+
+
 def build_gateway_locust_grpc_client(environment: Environment) -> Channel:
     """
     Фабричная функция для создания gRPC-канала, адаптированного для Locust.
     В канал автоматически встраивается интерцептор LocustInterceptor,
     который регистрирует вызовы в системе метрик Locust.
 
+    Если задан GATEWAY_GRPC_CLIENT.CHANNEL_POOL_SIZE, канал берётся из общего пула процесса,
+    а не открывается заново для каждого клиента.
+
     :param environment: Среда выполнения Locust (необходима для отправки событий).
     :return: gRPC-канал с интерцептором, пригодный для нагрузочного тестирования.
     """
+    if settings.gateway_grpc_client.channel_pool_size > 0:
+        return get_gateway_grpc_channel_pool(environment).acquire()
+
     # Создаём экземпляр интерцептора, передаём в него окружение Locust
     locust_interceptor = LocustInterceptor(environment=environment)
 
@@ -30,5 +122,20 @@ def build_gateway_locust_grpc_client(environment: Environment) -> Channel:
     channel = insecure_channel(settings.gateway_grpc_client.client_url)
 
     # Оборачиваем канал интерцептором, чтобы все запросы проходили через него
-    return intercept_channel(channel, locust_interceptor)
+    return intercept_locust_channel(channel, locust_interceptor)
+
+
+def release_gateway_locust_grpc_client(environment: Environment, channel: Channel) -> None:
+    """
+    Возвращает канал, полученный из build_gateway_locust_grpc_client.
+
+    Для пула уменьшает счётчик клиентов канала, собственный канал клиента закрывает.
 
+    :param environment: Среда выполнения Locust.
+    :param channel: Канал клиента.
+    """
+    pool = getattr(environment, "grpc_channel_pool", None)
+    if pool is not None and settings.gateway_grpc_client.channel_pool_size > 0:
+        pool.release(channel)
+    else:
+        channel.close()
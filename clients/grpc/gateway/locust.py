@@ -12,6 +12,7 @@ from clients.grpc.gateway.operations.client import (
     build_operations_gateway_locust_grpc_client
 )
 from clients.grpc.gateway.users.client import UsersGatewayGRPCClient, build_users_gateway_locust_grpc_client
+from clients.grpc.gateway.client import release_gateway_locust_grpc_client
 
 
 class GatewayGRPCTaskSet(TaskSet):
@@ -40,6 +41,19 @@ class GatewayGRPCTaskSet(TaskSet):
         self.documents_gateway_client = build_documents_gateway_locust_grpc_client(self.user.environment)
         self.operations_gateway_client = build_operations_gateway_locust_grpc_client(self.user.environment)
 
+    def on_stop(self) -> None:
+        """
+        Возвращает каналы клиентов в общий пул (или закрывает их, если пул выключен).
+        """
+        for client in (
+                self.users_gateway_client,
+                self.cards_gateway_client,
+                self.accounts_gateway_client,
+                self.documents_gateway_client,
+                self.operations_gateway_client
+        ):
+            release_gateway_locust_grpc_client(self.user.environment, client.channel)
+
 
 class GatewayGRPCSequentialTaskSet(SequentialTaskSet):
     """
@@ -63,3 +77,16 @@ class GatewayGRPCSequentialTaskSet(SequentialTaskSet):
         self.accounts_gateway_client = build_accounts_gateway_locust_grpc_client(self.user.environment)
         self.documents_gateway_client = build_documents_gateway_locust_grpc_client(self.user.environment)
         self.operations_gateway_client = build_operations_gateway_locust_grpc_client(self.user.environment)
+
+    def on_stop(self) -> None:
+        """
+        Возвращает каналы клиентов в общий пул (или закрывает их, если пул выключен).
+        """
+        for client in (
+                self.users_gateway_client,
+                self.cards_gateway_client,
+                self.accounts_gateway_client,
+                self.documents_gateway_client,
+                self.operations_gateway_client
+        ):
+            release_gateway_locust_grpc_client(self.user.environment, client.channel)
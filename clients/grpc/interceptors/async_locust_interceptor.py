@@ -0,0 +1,145 @@
+import asyncio
+from typing import Any, AsyncIterator
+
+from grpc.aio import (
+    EOF,
+    AioRpcError,
+    Call,
+    ClientInterceptor,
+    StreamStreamClientInterceptor,
+    StreamUnaryClientInterceptor,
+    UnaryStreamClientInterceptor,
+    UnaryUnaryClientInterceptor
+)
+
+from clients.grpc.interceptors.metrics import CURRENT_CALL_METRICS, CallMetrics
+
+
+class AsyncLocustInterceptor(ClientInterceptor):
+    """
+    Базовый grpc.aio-интерцептор для сбора метрик Locust.
+
+    Модуль не импортирует locust (grpc.aio несовместим с gevent): environment — любой объект
+    с событием events.request, совместимым с locust.env.Environment.
+
+    Как и синхронный LocustInterceptor, не ждёт ответа внутри интерцептора: вызовы с одиночным
+    ответом регистрируются по завершении, потоки ответов — по мере их чтения. Размер ответа
+    считается по байтам с провода, если канал обёрнут MeteredAsyncChannel.
+    """
+
+    def __init__(self, environment: Any):
+        """
+        :param environment: Среда с событиями сбора метрик (events.request.fire).
+        """
+        self.environment = environment
+
+    async def start(self, continuation, client_call_details, request) -> tuple[Call, CallMetrics]:
+        metrics = CallMetrics(client_call_details.method)
+        # Задача вызова создаётся внутри continuation и наследует контекст с метриками
+        token = CURRENT_CALL_METRICS.set(metrics)
+        try:
+            return await continuation(client_call_details, request), metrics
+        finally:
+            CURRENT_CALL_METRICS.reset(token)
+
+    def report(self, metrics: CallMetrics, response: Any, exception: BaseException | None) -> None:
+        if metrics.reported:
+            return
+
+        metrics.reported = True
+        metrics.finish()
+        self.environment.events.request.fire(
+            name=metrics.method,
+            context={"launch_lag": metrics.launch_lag},
+            response=response,
+            exception=exception,
+            request_type="gRPC",
+            response_time=metrics.response_time,
+            response_length=metrics.response_length,
+        )
+
+    async def report_call(self, metrics: CallMetrics, call: Call) -> None:
+        exception = None
+        try:
+            await call
+        except (AioRpcError, asyncio.CancelledError) as error:
+            exception = error
+
+        self.report(metrics, call, exception)
+
+    async def intercept_unary(self, continuation, client_call_details, request):
+        call, metrics = await self.start(continuation, client_call_details, request)
+
+        def on_done(done_call: Call) -> None:
+            # Время фиксируется в момент завершения, статус забирается отдельной задачей:
+            # в callback нельзя дождаться code()/результата
+            metrics.finish()
+            asyncio.get_running_loop().create_task(self.report_call(metrics, done_call))
+
+        call.add_done_callback(on_done)
+        return call
+
+    async def intercept_stream(self, continuation, client_call_details, request):
+        call, metrics = await self.start(continuation, client_call_details, request)
+        return self.iterate(call, metrics)
+
+    async def iterate(self, call: Call, metrics: CallMetrics) -> AsyncIterator[Any]:
+        """
+        Поток ответов, регистрирующий вызов, когда он дочитан или завершился ошибкой.
+
+        Сообщения читаются в задаче потребителя, поэтому метрики вызова выставляются
+        текущими на время каждого чтения.
+        """
+        while True:
+            token = CURRENT_CALL_METRICS.set(metrics)
+            try:
+                message = await call.read()
+            except (AioRpcError, asyncio.CancelledError) as error:
+                self.report(metrics, call, error)
+                raise
+            finally:
+                CURRENT_CALL_METRICS.reset(token)
+
+            if message is EOF:
+                self.report(metrics, call, None)
+                return
+
+            yield message
+
+
+class AsyncLocustUnaryUnaryInterceptor(AsyncLocustInterceptor, UnaryUnaryClientInterceptor):
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        return await self.intercept_unary(continuation, client_call_details, request)
+
+
+class AsyncLocustStreamUnaryInterceptor(AsyncLocustInterceptor, StreamUnaryClientInterceptor):
+    async def intercept_stream_unary(self, continuation, client_call_details, request_iterator):
+        return await self.intercept_unary(continuation, client_call_details, request_iterator)
+
+
+class AsyncLocustUnaryStreamInterceptor(AsyncLocustInterceptor, UnaryStreamClientInterceptor):
+    async def intercept_unary_stream(self, continuation, client_call_details, request):
+        return await self.intercept_stream(continuation, client_call_details, request)
+
+
+class AsyncLocustStreamStreamInterceptor(AsyncLocustInterceptor, StreamStreamClientInterceptor):
+    async def intercept_stream_stream(self, continuation, client_call_details, request_iterator):
+        return await self.intercept_stream(continuation, client_call_details, request_iterator)
+
+
+def build_async_locust_interceptors(environment: Any) -> list[AsyncLocustInterceptor]:
+    """
+    Создаёт набор grpc.aio-интерцепторов Locust для всех типов вызовов.
+
+    grpc.aio относит интерцептор только к одному типу вызовов (по первому совпавшему базовому классу),
+    поэтому вместо одного класса, как в синхронном API, используется по экземпляру на каждый тип.
+
+    :param environment: Среда с событиями сбора метрик (events.request.fire).
+    :return: Список интерцепторов для grpc.aio.insecure_channel(interceptors=...).
+    """
+    return [
+        AsyncLocustUnaryUnaryInterceptor(environment),
+        AsyncLocustUnaryStreamInterceptor(environment),
+        AsyncLocustStreamUnaryInterceptor(environment),
+        AsyncLocustStreamStreamInterceptor(environment),
+    ]
@@ -1,13 +1,66 @@
-import time
+from typing import Any, Iterator
 
-from grpc import RpcError, UnaryUnaryClientInterceptor
+from grpc import (
+    Channel,
+    Future,
+    FutureCancelledError,
+    RpcError,
+    StreamStreamClientInterceptor,
+    StreamUnaryClientInterceptor,
+    UnaryStreamClientInterceptor,
+    UnaryUnaryClientInterceptor,
+    intercept_channel
+)
 from locust.env import Environment
 
+from clients.grpc.interceptors.metrics import CURRENT_CALL_METRICS, CallMetrics, MeteredChannel
 
-class LocustInterceptor(UnaryUnaryClientInterceptor):
+
+class LocustResponseIterator:
+    """
+    Обёртка потока ответов (unary-stream, stream-stream), регистрирующая вызов в Locust,
+    когда поток дочитан до конца или завершился ошибкой.
+
+    Остальные атрибуты (code(), details(), cancel(), add_done_callback() и т.д.)
+    делегируются исходному вызову.
+    """
+
+    def __init__(self, call: Any, interceptor: "LocustInterceptor", metrics: CallMetrics):
+        self.call = call
+        self.interceptor = interceptor
+        self.metrics = metrics
+
+    def __iter__(self) -> Iterator[Any]:
+        return self
+
+    def __next__(self) -> Any:
+        try:
+            return next(self.call)
+        except StopIteration:
+            self.interceptor.report(self.metrics, self.call, None)
+            raise
+        except RpcError as error:
+            self.interceptor.report(self.metrics, self.call, error)
+            raise
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.call, name)
+
+
+class LocustInterceptor(
+    UnaryUnaryClientInterceptor,
+    UnaryStreamClientInterceptor,
+    StreamUnaryClientInterceptor,
+    StreamStreamClientInterceptor
+):
     """
     gRPC-интерцептор для сбора метрик Locust.
     Используется для измерения времени выполнения вызовов и регистрации успехов/ошибок.
+
+    Интерцептор не дожидается ответа: вызовы с одиночным ответом регистрируются из callback
+    завершения future, поэтому `.future()` и `with_call` остаются неблокирующими, а потоки
+    ответов — по мере их чтения (LocustResponseIterator). Размер ответа считается по байтам
+    с провода, если канал обёрнут MeteredChannel (см. intercept_locust_channel).
     """
 
     def __init__(self, environment: Environment):
@@ -16,40 +69,83 @@ class LocustInterceptor(UnaryUnaryClientInterceptor):
         """
         self.environment = environment
 
-    def intercept_unary_unary(self, continuation, client_call_details, request):
+    def start(self, continuation, client_call_details, request) -> tuple[Any, CallMetrics]:
         """
-        Метод-перехватчик для unary-unary gRPC вызовов.
+        Запускает вызов, сделав его метрики текущими, чтобы MeteredChannel привязал к ним десериализатор.
 
         :param continuation: Функция, вызывающая фактический gRPC метод.
         :param client_call_details: Детали запроса (метод, метаданные, таймаут и т.д.).
-        :param request: Объект запроса, отправляемый на сервер.
-        :return: gRPC response (future объект).
+        :param request: Объект запроса или итератор запросов.
+        :return: Объект вызова и его метрики.
         """
-        response = None
-        exception: RpcError | None = None
-        start_time = time.perf_counter()  # Засекаем время начала запроса
-        response_length = 0
-
+        metrics = CallMetrics(client_call_details.method)
+        token = CURRENT_CALL_METRICS.set(metrics)
         try:
-            # Выполняем gRPC вызов и получаем response future
-            response = continuation(client_call_details, request)
+            return continuation(client_call_details, request), metrics
+        finally:
+            CURRENT_CALL_METRICS.reset(token)
 
-            # Получаем размер ответа, если он уже доступен (для метрик)
-            response_length = response.result().ByteSize()
-        except RpcError as error:
-            # В случае ошибки сохраняем исключение для метрик
-            exception = error
+    def report(self, metrics: CallMetrics, response: Any, exception: Exception | None) -> None:
+        """
+        Регистрирует вызов в системе метрик Locust (однократно).
+        """
+        if metrics.reported:
+            return
 
-        # Регистрируем вызов в системе метрик Locust
+        metrics.reported = True
+        metrics.finish()
         self.environment.events.request.fire(
-            name=client_call_details.method,  # Имя метода (например, "/users.UsersService/CreateUser")
-            context=None,  # Можно использовать для передачи кастомных данных
-            response=response,  # Объект ответа (если нужен для контекста)
+            name=metrics.method,  # Имя метода (например, "/users.UsersService/CreateUser")
+            context={"launch_lag": metrics.launch_lag},  # Кастомные данные: опоздание запуска в мс
+            response=response,  # Объект вызова (future или поток ответов)
             exception=exception,  # Если произошла ошибка — передаём её сюда
             request_type="gRPC",  # Тип запроса (например, "HTTP", "gRPC")
-            response_time=(time.perf_counter() - start_time) * 1000,  # Время выполнения в миллисекундах
-            response_length=response_length,  # Размер ответа в байтах
+            response_time=metrics.response_time,  # Время выполнения в миллисекундах
+            response_length=metrics.response_length,  # Размер ответа в байтах
         )
 
-        # Возвращаем результат вызова (future-объект)
-        return response
+    def report_future(self, metrics: CallMetrics, future: Future) -> None:
+        exception = FutureCancelledError() if future.cancelled() else future.exception()
+        self.report(metrics, future, exception)
+
+    def intercept_unary(self, continuation, client_call_details, request):
+        call, metrics = self.start(continuation, client_call_details, request)
+        # Для блокирующих вызовов future уже завершён, и callback срабатывает сразу
+        call.add_done_callback(lambda future: self.report_future(metrics, future))
+        return call
+
+    def intercept_stream(self, continuation, client_call_details, request):
+        call, metrics = self.start(continuation, client_call_details, request)
+        return LocustResponseIterator(call, self, metrics)
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        """
+        Метод-перехватчик для unary-unary gRPC вызовов.
+
+        :param continuation: Функция, вызывающая фактический gRPC метод.
+        :param client_call_details: Детали запроса (метод, метаданные, таймаут и т.д.).
+        :param request: Объект запроса, отправляемый на сервер.
+        :return: gRPC response (future объект).
+        """
+        return self.intercept_unary(continuation, client_call_details, request)
+
+    def intercept_stream_unary(self, continuation, client_call_details, request_iterator):
+        return self.intercept_unary(continuation, client_call_details, request_iterator)
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        return self.intercept_stream(continuation, client_call_details, request)
+
+    def intercept_stream_stream(self, continuation, client_call_details, request_iterator):
+        return self.intercept_stream(continuation, client_call_details, request_iterator)
+
+
+def intercept_locust_channel(channel: Channel, interceptor: LocustInterceptor) -> Channel:
+    """
+    Оборачивает канал интерцептором Locust поверх MeteredChannel,
+    чтобы размер ответов измерялся по сериализованным байтам.
+
+    :param channel: Обычный gRPC-канал.
+    :param interceptor: Интерцептор Locust.
+    :return: Канал, все вызовы которого регистрируются в Locust.
+    """
+    return intercept_channel(MeteredChannel(channel), interceptor)
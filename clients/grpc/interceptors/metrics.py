@@ -0,0 +1,188 @@
+import time
+from contextvars import ContextVar
+from typing import Any, Callable
+
+import grpc
+from grpc import aio
+
+from tools.latency import LAUNCH_LAG
+
+DeserializingFunction = Callable[[bytes], Any]
+
+
+class CallMetrics:
+    """
+    Метрики одного gRPC-вызова: момент старта, опоздание запуска, размер и число сообщений ответа.
+
+    Размер ответа — это длина сериализованных байт, полученных с провода: её считает обёртка
+    десериализатора (measure_deserializer), поэтому сообщение не нужно повторно обходить через ByteSize().
+    """
+    __slots__ = ("method", "started_at", "finished_at", "launch_lag", "response_length", "messages", "reported")
+
+    def __init__(self, method: str | bytes):
+        self.method = method.decode() if isinstance(method, bytes) else method
+        self.started_at = time.perf_counter()
+        self.finished_at: float | None = None
+        # Опоздание запуска задачи в открытой модели — для коррекции coordinated omission
+        self.launch_lag = LAUNCH_LAG.get()
+        self.response_length = 0
+        self.messages = 0
+        self.reported = False
+
+    def add_response(self, data: bytes) -> None:
+        self.response_length += len(data)
+        self.messages += 1
+
+    def finish(self) -> None:
+        if self.finished_at is None:
+            self.finished_at = time.perf_counter()
+
+    @property
+    def response_time(self) -> float:
+        """
+        Время вызова в миллисекундах (до момента завершения или до текущего момента).
+        """
+        return ((self.finished_at or time.perf_counter()) - self.started_at) * 1000
+
+
+# Метрики вызова, который сейчас запускает интерцептор. Синхронный MeteredChannel читает их
+# при создании multicallable внутри continuation, асинхронный — в момент десериализации ответа.
+CURRENT_CALL_METRICS: ContextVar[CallMetrics | None] = ContextVar("current_call_metrics", default=None)
+
+
+def measure_deserializer(
+        deserializer: DeserializingFunction | None,
+        metrics: CallMetrics
+) -> DeserializingFunction:
+    """
+    Оборачивает десериализатор ответа так, что длина каждого полученного сообщения
+    добавляется в метрики вызова.
+    """
+
+    def deserialize(data: bytes) -> Any:
+        metrics.add_response(data)
+        return deserializer(data) if deserializer is not None else data
+
+    return deserialize
+
+
+def measure_deserializer_in_context(deserializer: DeserializingFunction | None) -> DeserializingFunction:
+    """
+    Как measure_deserializer, но метрики берутся из CURRENT_CALL_METRICS в момент десериализации.
+    Нужен для grpc.aio, где multicallable создаётся один раз при создании стаба.
+    """
+
+    def deserialize(data: bytes) -> Any:
+        metrics = CURRENT_CALL_METRICS.get()
+        if metrics is not None:
+            metrics.add_response(data)
+        return deserializer(data) if deserializer is not None else data
+
+    return deserialize
+
+
+class MeteredChannel(grpc.Channel):
+    """
+    Обёртка синхронного gRPC-канала, измеряющая размер ответов по сериализованным байтам.
+
+    Располагается под интерцептором (intercept_channel(MeteredChannel(channel), interceptor)):
+    grpc создаёт multicallable нижележащего канала на каждый вызов внутри continuation,
+    поэтому десериализатор привязывается к метрикам именно этого вызова, даже если
+    ответ затем разбирается в другом потоке (future) или по мере чтения потока.
+    """
+
+    def __init__(self, channel: grpc.Channel):
+        self.channel = channel
+
+    def wrap(self, response_deserializer: DeserializingFunction | None) -> DeserializingFunction | None:
+        metrics = CURRENT_CALL_METRICS.get()
+        if metrics is None:
+            return response_deserializer
+
+        return measure_deserializer(response_deserializer, metrics)
+
+    def unary_unary(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        return self.channel.unary_unary(
+            method, request_serializer, self.wrap(response_deserializer), _registered_method
+        )
+
+    def unary_stream(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        return self.channel.unary_stream(
+            method, request_serializer, self.wrap(response_deserializer), _registered_method
+        )
+
+    def stream_unary(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        return self.channel.stream_unary(
+            method, request_serializer, self.wrap(response_deserializer), _registered_method
+        )
+
+    def stream_stream(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        return self.channel.stream_stream(
+            method, request_serializer, self.wrap(response_deserializer), _registered_method
+        )
+
+    def subscribe(self, callback, try_to_connect=False):
+        self.channel.subscribe(callback, try_to_connect=try_to_connect)
+
+    def unsubscribe(self, callback):
+        self.channel.unsubscribe(callback)
+
+    def close(self):
+        self.channel.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.channel.close()
+        return False
+
+
+class MeteredAsyncChannel(aio.Channel):
+    """
+    Обёртка grpc.aio-канала, измеряющая размер ответов по сериализованным байтам.
+
+    Десериализаторы стаба оборачиваются один раз, а метрики вызова берутся из CURRENT_CALL_METRICS,
+    который выставляют асинхронные интерцепторы Locust: задача вызова наследует их контекст.
+    """
+
+    def __init__(self, channel: aio.Channel):
+        self.channel = channel
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.channel.close()
+
+    async def close(self, grace: float | None = None):
+        await self.channel.close(grace)
+
+    def get_state(self, try_to_connect: bool = False) -> grpc.ChannelConnectivity:
+        return self.channel.get_state(try_to_connect)
+
+    async def wait_for_state_change(self, last_observed_state: grpc.ChannelConnectivity) -> None:
+        await self.channel.wait_for_state_change(last_observed_state)
+
+    async def channel_ready(self) -> None:
+        await self.channel.channel_ready()
+
+    def unary_unary(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        return self.channel.unary_unary(
+            method, request_serializer, measure_deserializer_in_context(response_deserializer), _registered_method
+        )
+
+    def unary_stream(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        return self.channel.unary_stream(
+            method, request_serializer, measure_deserializer_in_context(response_deserializer), _registered_method
+        )
+
+    def stream_unary(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        return self.channel.stream_unary(
+            method, request_serializer, measure_deserializer_in_context(response_deserializer), _registered_method
+        )
+
+    def stream_stream(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        return self.channel.stream_stream(
+            method, request_serializer, measure_deserializer_in_context(response_deserializer), _registered_method
+        )
@@ -0,0 +1,84 @@
+from typing import Any
+
+from httpx import AsyncClient, Response, QueryParams, URL
+
+from clients.http.client import HTTPClientExtensions, SchemaT
+from clients.http.codecs import JSON_HEADERS, JSONCodec, build_json_codec
+from clients.http.validation import ResponseValidator, build_response_validator
+
+
+class AsyncHTTPClient:
+    """
+    Базовый асинхронный HTTP API клиент, принимающий объект httpx.AsyncClient.
+
+    Асинхронные клиенты используются вне Locust (например, для сидинга):
+    модули с ними не должны импортировать locust, так как gevent monkey patching
+    ломает работу asyncio-цикла.
+
+    :param client: экземпляр httpx.AsyncClient для выполнения HTTP-запросов
+    :param validator: политика разбора ответов (по умолчанию — полная валидация)
+    :param codec: кодек JSON для тел запросов (по умолчанию — pydantic-core)
+    """
+
+    def __init__(
+            self,
+            client: AsyncClient,
+            validator: ResponseValidator | None = None,
+            codec: JSONCodec | None = None
+    ) -> None:
+        self.client = client
+        self.codec = codec or build_json_codec()
+        self.validator = validator or build_response_validator(codec=self.codec)
+
+    async def close(self) -> None:
+        """
+        Закрывает httpx.AsyncClient вместе с его соединениями.
+        """
+        await self.client.aclose()
+
+    def parse_response(self, schema: type[SchemaT], response: Response) -> SchemaT:
+        """
+        Разбирает тело ответа в схему согласно политике валидации клиента.
+
+        :param schema: Pydantic-схема ответа.
+        :param response: Ответ httpx.
+        :return: Разобранный ответ.
+        """
+        return self.validator.parse(schema, response.content)
+
+    async def get(
+            self,
+            url: str | URL,
+            params: QueryParams | None = None,
+            extensions: HTTPClientExtensions | None = None
+    ) -> Response:
+        """
+        Выполняет асинхронный GET-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param params: GET-параметры запроса (например, ?key=value).
+        :param extensions: Дополнительные данные, передаваемые через HTTPX extensions.
+        :return: Объект Response с данными ответа.
+        """
+        return await self.client.get(url=url, params=params, extensions=extensions)
+
+    async def post(
+            self,
+            url: str | URL,
+            json: Any | None = None,
+            content: bytes | None = None,
+            extensions: HTTPClientExtensions | None = None
+    ) -> Response:
+        """
+        Выполняет асинхронный POST-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param json: Данные в формате JSON (сериализуются httpx).
+        :param content: Уже сериализованное JSON-тело запроса (например, из codec.dump_model).
+        :param extensions: Дополнительные данные, передаваемые через HTTPX extensions.
+        :return: Объект Response с данными ответа.
+        """
+        if content is not None:
+            return await self.client.post(url=url, content=content, headers=JSON_HEADERS, extensions=extensions)
+
+        return await self.client.post(url=url, json=json, extensions=extensions)
@@ -1,6 +1,12 @@
-from typing import Any, TypedDict
+from typing import Any, TypedDict, TypeVar
 
 from httpx import Client, Response, QueryParams, URL
+from pydantic import BaseModel
+
+from clients.http.codecs import JSON_HEADERS, JSONCodec, build_json_codec
+from clients.http.validation import ResponseValidator, StructuralView, build_response_validator
+
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
 
 
 # Тип расширений, которые можно передать в запрос
@@ -14,10 +20,32 @@ class HTTPClient:
     Базовый HTTP API клиент, принимающий объект httpx.Client.
 
     :param client: экземпляр httpx.Client для выполнения HTTP-запросов
+    :param validator: политика разбора ответов (по умолчанию — полная валидация)
+    :param codec: кодек JSON для тел запросов (по умолчанию — pydantic-core)
     """
 
-    def __init__(self, client: Client) -> None:
+    def __init__(
+            self,
+            client: Client,
+            validator: ResponseValidator | None = None,
+            codec: JSONCodec | None = None
+    ) -> None:
         self.client = client
+        self.codec = codec or build_json_codec()
+        self.validator = validator or build_response_validator(codec=self.codec)
+
+    def parse_response(self, schema: type[SchemaT], response: Response) -> SchemaT | StructuralView:
+        """
+        Разбирает тело ответа в схему согласно политике валидации клиента.
+
+        Для уровней sampled, structural и none вместо модели может вернуться StructuralView
+        с тем же доступом к полям, но без приведения типов.
+
+        :param schema: Pydantic-схема ответа.
+        :param response: Ответ httpx.
+        :return: Разобранный ответ.
+        """
+        return self.validator.parse(schema, response.content)
 
     def get(
             self,
@@ -39,14 +67,19 @@ class HTTPClient:
             self,
             url: str | URL,
             json: Any | None = None,
+            content: bytes | None = None,
             extensions: HTTPClientExtensions | None = None  # Поддержка extensions для POST-запросов
     ) -> Response:
         """
         Выполняет POST-запрос.
 
         :param url: URL-адрес эндпоинта.
-        :param json: Данные в формате JSON.
+        :param json: Данные в формате JSON (сериализуются httpx).
+        :param content: Уже сериализованное JSON-тело запроса (например, из codec.dump_model).
         :param extensions: Дополнительные данные, передаваемые через HTTPX extensions.
         :return: Объект Response с данными ответа.
         """
+        if content is not None:
+            return self.client.post(url=url, content=content, headers=JSON_HEADERS, extensions=extensions)
+
         return self.client.post(url=url, json=json, extensions=extensions)  # extensions передаётся в httpx.Client
@@ -0,0 +1,71 @@
+from typing import Any
+
+from pydantic import BaseModel
+from pydantic_core import from_json, to_json
+
+from logger import get_logger
+from tools.config.http import JSONCodecBackend
+
+try:
+    import orjson
+except ImportError:  # orjson — необязательная зависимость
+    orjson = None
+
+logger = get_logger("HTTP_JSON_CODEC")
+
+# Заголовки для запросов, тело которых уже сериализовано в JSON
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+class JSONCodec:
+    """
+    Кодек JSON для HTTP API клиентов на базе pydantic-core (Rust).
+
+    Тела запросов сериализуются сериализатором самой Pydantic-модели сразу в bytes:
+    без промежуточного словаря model_dump() и повторного кодирования stdlib json внутри httpx.
+    """
+
+    def dump_model(self, model: BaseModel) -> bytes:
+        """
+        Сериализует модель запроса в JSON (с alias полей).
+
+        :param model: Pydantic-модель тела запроса.
+        :return: Тело запроса в байтах.
+        """
+        return model.__pydantic_serializer__.to_json(model, by_alias=True)
+
+    def dumps(self, value: Any) -> bytes:
+        return to_json(value)
+
+    def loads(self, content: bytes) -> Any:
+        return from_json(content)
+
+
+class ORJSONCodec(JSONCodec):
+    """
+    Кодек на orjson для произвольных значений и разбора ответов без полной валидации.
+
+    Модели по-прежнему сериализуются своим сериализатором: это быстрее, чем orjson поверх model_dump().
+    """
+
+    def dumps(self, value: Any) -> bytes:
+        return orjson.dumps(value)
+
+    def loads(self, content: bytes) -> Any:
+        return orjson.loads(content)
+
+
+def build_json_codec(backend: JSONCodecBackend = JSONCodecBackend.PYDANTIC) -> JSONCodec:
+    """
+    Создаёт кодек JSON. Если orjson не установлен, используется кодек pydantic-core.
+
+    :param backend: Выбранная реализация.
+    :return: JSONCodec.
+    """
+    if backend == JSONCodecBackend.ORJSON:
+        if orjson is not None:
+            return ORJSONCodec()
+
+        logger.warning("orjson is not installed, falling back to pydantic-core JSON codec")
+
+    return JSONCodec()
@@ -1,32 +1,169 @@
 import time
+from typing import Any, Callable, Iterator
 
-from httpx import Request, Response, HTTPStatusError, HTTPError
+import gevent
+from httpx import Request, Response, HTTPStatusError, HTTPError, SyncByteStream
 from locust.env import Environment
 
+from tools.latency import LAUNCH_LAG
+from tools.routes import normalize_route
+
+# События httpcore trace, между которыми измеряются фазы установки соединения и ожидания пула
+CONNECT_TRACE_EVENTS = {
+    "connection.connect_tcp.started": "connect_started",
+    "connection.connect_tcp.complete": "connect_complete",
+    "connection.start_tls.complete": "connect_complete",
+    "http11.send_request_headers.started": "send_started",
+    "http2.send_request_headers.started": "send_started",
+}
+
 
 def locust_request_event_hook(request: Request) -> None:
     """
     HTTPX event hook, вызываемый перед отправкой запроса.
 
-    Сохраняет текущее время в `request.extensions["start_time"]`,
-    чтобы потом использовать его для расчёта времени ответа.
+    Сохраняет монотонное время высокого разрешения в `request.extensions["start_time"]`
+    (наносекунды `time.perf_counter_ns()`), чтобы потом использовать его для расчёта времени ответа,
+    и опоздание запуска задачи в открытой модели (`launch_lag`, мс).
+    """
+    request.extensions["start_time"] = time.perf_counter_ns()
+    request.extensions["launch_lag"] = LAUNCH_LAG.get()
+
+
+def locust_trace_event_hook(request: Request) -> None:
+    """
+    HTTPX event hook, включающий трассировку httpcore для запроса.
+
+    Отметки времени установки TCP/TLS-соединения и начала отправки запроса сохраняются
+    в `request.extensions["phases"]`. Если соединение взято из пула, фаза connect отсутствует (равна 0).
+    """
+    phases: dict[str, int] = {}
+
+    def trace(event_name: str, info: dict[str, Any]) -> None:
+        phase = CONNECT_TRACE_EVENTS.get(event_name)
+        if phase is not None:
+            phases[phase] = time.perf_counter_ns()
+
+    request.extensions["phases"] = phases
+    request.extensions["trace"] = trace
+
+
+class LocustResponseStream(SyncByteStream):
+    """
+    Обёртка над потоком тела ответа, считающая байты по мере чтения.
+
+    httpx закрывает поток сразу после того, как тело прочитано (или при ошибке),
+    поэтому метрику можно отправить в close() — без повторного чтения тела в хуке.
+    Ошибка чтения тела (таймаут, обрыв соединения) запоминается и передаётся в close(),
+    иначе запрос с оборванным телом попал бы в статистику как успешный.
+    """
+
+    def __init__(self, stream: SyncByteStream, on_close: Callable[[int, Exception | None], None]):
+        self.stream = stream
+        self.on_close = on_close
+        self.length = 0
+        self.error: Exception | None = None
+        self.closed = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        try:
+            for chunk in self.stream:
+                self.length += len(chunk)
+                yield chunk
+        except Exception as error:
+            self.error = error
+            raise
+
+    def close(self) -> None:
+        if self.closed:
+            return
+
+        self.closed = True
+        self.stream.close()
+        self.on_close(self.length, self.error)
+
+
+class LocustRequestEventBatcher:
+    """
+    Копит события запросов и отправляет их в `environment.events.request` пачками.
+
+    Отправка выполняется при заполнении пачки или фоновой greenlet раз в flush_interval секунд,
+    а также при остановке теста. Так агрегация статистики Locust не выполняется
+    на пути каждого запроса виртуального пользователя.
+    """
+
+    def __init__(self, environment: Environment, batch_size: int, flush_interval: float):
+        self.environment = environment
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.events: list[dict[str, Any]] = []
+        self.flusher: gevent.Greenlet | None = None
+
+        environment.events.test_stop.add_listener(lambda **kwargs: self.flush())
+        environment.events.quitting.add_listener(lambda **kwargs: self.flush())
+
+    def add(self, **event: Any) -> None:
+        self.events.append(event)
+
+        if self.flusher is None:
+            self.flusher = gevent.spawn(self.run)
+        if len(self.events) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        # Забираем пачку целиком до отправки, чтобы новые события шли уже в следующую
+        events, self.events = self.events, []
+        for event in events:
+            self.environment.events.request.fire(**event)
+
+    def run(self) -> None:
+        while True:
+            gevent.sleep(self.flush_interval)
+            self.flush()
+
+
+def get_locust_request_event_batcher(
+        environment: Environment,
+        batch_size: int,
+        flush_interval: float
+) -> LocustRequestEventBatcher:
     """
-    request.extensions["start_time"] = time.time()
+    Возвращает общий для окружения батчер событий (создаёт при первом обращении).
+    """
+    batcher = getattr(environment, "http_request_event_batcher", None)
+    if batcher is None:
+        batcher = LocustRequestEventBatcher(environment, batch_size=batch_size, flush_interval=flush_interval)
+        environment.http_request_event_batcher = batcher
+
+    return batcher
 
 
-def locust_response_event_hook(environment: Environment):
+def locust_response_event_hook(environment: Environment, batch_size: int = 0, flush_interval: float = 1.0):
     """
-    Возвращает HTTPX event hook, вызываемый после получения ответа.
+    Возвращает HTTPX event hook, вызываемый после получения заголовков ответа.
 
-    Использует `request.extensions["start_time"]` для вычисления времени отклика.
-    Извлекает route из `request.extensions["route"]`, если задан.
-    Отправляет собранные метрики в `environment.events.request`, чтобы Locust мог агрегировать статистику.
+    Хук срабатывает до чтения тела, поэтому в нём фиксируется время до первого байта (TTFB).
+    Сама метрика отправляется, когда httpx дочитает и закроет поток тела:
+    - response_time — полное время запроса в мс (по `time.perf_counter_ns()`);
+    - response_length — количество фактически прочитанных байт тела (до распаковки Content-Encoding);
+    - exception — ошибка статуса ответа или ошибка чтения тела;
+    - context — фазы запроса в мс: pool_wait и connect (если включена трассировка), ttfb и download,
+      а также опоздание запуска задачи launch_lag (для коррекции coordinated omission).
+
+    Все отметки относятся к конкретному запросу, поэтому при HTTP/2 время считается
+    для каждого потока отдельно, даже если потоки мультиплексируются в одном соединении.
 
     :param environment: Объект окружения Locust, через который отправляются метрики.
+    :param batch_size: Размер пачки событий; 0 — отправлять каждое событие сразу.
+    :param flush_interval: Как часто (в секундах) отправлять неполную пачку.
     :return: Функция-хук для HTTPX response event hook.
     """
+    fire = environment.events.request.fire
+    if batch_size > 0:
+        fire = get_locust_request_event_batcher(environment, batch_size, flush_interval).add
 
     def inner(response: Response) -> None:
+        headers_time = time.perf_counter_ns()
         exception: HTTPError | HTTPStatusError | None = None
 
         try:
@@ -37,24 +174,41 @@ def locust_response_event_hook(environment: Environment):
 
         request = response.request
 
-        # Получаем route, если он был передан через extensions, иначе используем raw path
-        route = request.extensions.get("route", request.url.path)
+        # Получаем route, если он был передан через extensions, иначе используем raw path.
+        # В обоих случаях приводим его к шаблону, чтобы идентификаторы не плодили строки статистики.
+        route = normalize_route(request.extensions.get("route", request.url.path))
         # Время начала запроса, установленное в request event hook
-        start_time = request.extensions.get("start_time", time.time())
-        # Вычисляем длительность запроса в миллисекундах
-        response_time = (time.time() - start_time) * 1000
-        # Определяем размер тела ответа (можно заменить на 0, если не нужно)
-        response_length = len(response.read())
-
-        # Отправляем событие в Locust
-        environment.events.request.fire(
-            name=f"{request.method} {route}",  # Имя запроса (метод + логическое имя маршрута)
-            context=None,  # Контекст (опционально, можно использовать для расширений)
-            response=response,  # Объект ответа (опционально)
-            exception=exception,  # Исключение, если оно произошло
-            request_type="HTTP",  # Тип запроса (может быть любым: HTTP, gRPC, DB и т.д.)
-            response_time=response_time,  # Время выполнения запроса в мс
-            response_length=response_length,  # Размер тела ответа
-        )
+        start_time = request.extensions.get("start_time", headers_time)
+
+        def on_close(read_length: int, read_error: Exception | None) -> None:
+            end_time = time.perf_counter_ns()
+
+            context = {
+                "ttfb": (headers_time - start_time) / 1_000_000,
+                "download": (end_time - headers_time) / 1_000_000,
+                "launch_lag": request.extensions.get("launch_lag", 0.0),
+            }
+            phases = request.extensions.get("phases")
+            if phases is not None:
+                connect = phases.get("connect_complete", 0) - phases.get("connect_started", 0)
+                context["connect"] = connect / 1_000_000
+                # Ожидание свободного соединения пула (и подготовка запроса httpx) до установки соединения
+                # или, для соединения из пула, до отправки заголовков
+                acquired = phases.get("connect_started", phases.get("send_started", start_time))
+                context["pool_wait"] = (acquired - start_time) / 1_000_000
+
+            # Отправляем событие в Locust
+            fire(
+                name=f"{request.method} {route}",  # Имя запроса (метод + логическое имя маршрута)
+                context=context,  # Фазы запроса в мс
+                response=response,  # Объект ответа (опционально)
+                exception=read_error or exception,  # Исключение, если оно произошло
+                # Тип запроса: HTTP/2-потоки учитываются отдельно от HTTP/1.1, чтобы режимы можно было сравнить
+                request_type="HTTP/2" if response.http_version == "HTTP/2" else "HTTP",
+                response_time=(end_time - start_time) / 1_000_000,  # Время выполнения запроса в мс
+                response_length=read_length,  # Размер фактически прочитанного тела ответа
+            )
+
+        response.stream = LocustResponseStream(response.stream, on_close)
 
     return inner
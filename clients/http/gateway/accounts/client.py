@@ -1,4 +1,4 @@
-from httpx import Response, QueryParams
+from httpx import Response, QueryParams, Client
 from locust.env import Environment
 
 from clients.http.client import HTTPClient, HTTPClientExtensions
@@ -16,9 +16,13 @@ from clients.http.gateway.accounts.schema import (
 )
 from clients.http.gateway.client import (
     build_gateway_http_client,
-    build_gateway_locust_http_client
+    build_gateway_locust_http_client,
+    build_gateway_locust_json_codec,
+    build_gateway_locust_response_validator
 )
-from tools.routes import APIRoutes  # Импортируем enum APIRoutes
+from clients.http.validation import StructuralView
+from tools.config.http import ResponseValidation
+from tools.routes import APIRouteTemplates  # Импортируем реестр шаблонов маршрутов
 
 
 class AccountsGatewayHTTPClient(HTTPClient):
@@ -33,11 +37,11 @@ class AccountsGatewayHTTPClient(HTTPClient):
         :param query: Pydantic-модель с параметрами запроса, например: {'userId': '123'}.
         :return: Объект httpx.Response с данными о счетах.
         """
-        # Вместо /api/v1/accounts используем APIRoutes.ACCOUNTS
+        # Вместо /api/v1/accounts используем шаблон из APIRouteTemplates
         return self.get(
-            APIRoutes.ACCOUNTS,
+            APIRouteTemplates.ACCOUNTS,
             params=QueryParams(**query.model_dump(by_alias=True)),
-            extensions=HTTPClientExtensions(route=APIRoutes.ACCOUNTS)
+            extensions=HTTPClientExtensions(route=APIRouteTemplates.ACCOUNTS)
         )
 
     def open_deposit_account_api(self, request: OpenDepositAccountRequestSchema) -> Response:
@@ -47,10 +51,11 @@ class AccountsGatewayHTTPClient(HTTPClient):
         :param request: Pydantic-модель с userId.
         :return: Объект httpx.Response с результатом операции.
         """
-        # Вместо /api/v1/accounts используем APIRoutes.ACCOUNTS
+        # Вместо /api/v1/accounts используем шаблон из APIRouteTemplates
         return self.post(
-            f"{APIRoutes.ACCOUNTS}/open-deposit-account",
-            json=request.model_dump(by_alias=True)
+            APIRouteTemplates.OPEN_DEPOSIT_ACCOUNT,
+            content=self.codec.dump_model(request),
+            extensions=HTTPClientExtensions(route=APIRouteTemplates.OPEN_DEPOSIT_ACCOUNT)
         )
 
     def open_savings_account_api(self, request: OpenSavingsAccountRequestSchema) -> Response:
@@ -60,10 +65,11 @@ class AccountsGatewayHTTPClient(HTTPClient):
         :param request: Pydantic-модель с userId.
         :return: Объект httpx.Response.
         """
-        # Вместо /api/v1/accounts используем APIRoutes.ACCOUNTS
+        # Вместо /api/v1/accounts используем шаблон из APIRouteTemplates
         return self.post(
-            f"{APIRoutes.ACCOUNTS}/open-savings-account",
-            json=request.model_dump(by_alias=True)
+            APIRouteTemplates.OPEN_SAVINGS_ACCOUNT,
+            content=self.codec.dump_model(request),
+            extensions=HTTPClientExtensions(route=APIRouteTemplates.OPEN_SAVINGS_ACCOUNT)
         )
 
     def open_debit_card_account_api(self, request: OpenDebitCardAccountRequestSchema) -> Response:
@@ -73,10 +79,11 @@ class AccountsGatewayHTTPClient(HTTPClient):
         :param request: Pydantic-модель с userId.
         :return: Объект httpx.Response.
         """
-        # Вместо /api/v1/accounts используем APIRoutes.ACCOUNTS
+        # Вместо /api/v1/accounts используем шаблон из APIRouteTemplates
         return self.post(
-            f"{APIRoutes.ACCOUNTS}/open-debit-card-account",
-            json=request.model_dump(by_alias=True)
+            APIRouteTemplates.OPEN_DEBIT_CARD_ACCOUNT,
+            content=self.codec.dump_model(request),
+            extensions=HTTPClientExtensions(route=APIRouteTemplates.OPEN_DEBIT_CARD_ACCOUNT)
         )
 
     def open_credit_card_account_api(self, request: OpenCreditCardAccountRequestSchema) -> Response:
@@ -86,36 +93,37 @@ class AccountsGatewayHTTPClient(HTTPClient):
         :param request: Pydantic-модель с userId.
         :return: Объект httpx.Response.
         """
-        # Вместо /api/v1/accounts используем APIRoutes.ACCOUNTS
+        # Вместо /api/v1/accounts используем шаблон из APIRouteTemplates
         return self.post(
-            f"{APIRoutes.ACCOUNTS}/open-credit-card-account",
-            json=request.model_dump(by_alias=True)
+            APIRouteTemplates.OPEN_CREDIT_CARD_ACCOUNT,
+            content=self.codec.dump_model(request),
+            extensions=HTTPClientExtensions(route=APIRouteTemplates.OPEN_CREDIT_CARD_ACCOUNT)
         )
 
-    def get_accounts(self, user_id: str) -> GetAccountsResponseSchema:
+    def get_accounts(self, user_id: str) -> GetAccountsResponseSchema | StructuralView:
         query = GetAccountsQuerySchema(user_id=user_id)
         response = self.get_accounts_api(query)
-        return GetAccountsResponseSchema.model_validate_json(response.text)
+        return self.parse_response(GetAccountsResponseSchema, response)
 
-    def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponseSchema:
+    def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponseSchema | StructuralView:
         request = OpenDepositAccountRequestSchema(user_id=user_id)
         response = self.open_deposit_account_api(request)
-        return OpenDepositAccountResponseSchema.model_validate_json(response.text)
+        return self.parse_response(OpenDepositAccountResponseSchema, response)
 
-    def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponseSchema:
+    def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponseSchema | StructuralView:
         request = OpenSavingsAccountRequestSchema(user_id=user_id)
         response = self.open_savings_account_api(request)
-        return OpenSavingsAccountResponseSchema.model_validate_json(response.text)
+        return self.parse_response(OpenSavingsAccountResponseSchema, response)
 
-    def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponseSchema:
+    def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponseSchema | StructuralView:
         request = OpenDebitCardAccountRequestSchema(user_id=user_id)
         response = self.open_debit_card_account_api(request)
-        return OpenDebitCardAccountResponseSchema.model_validate_json(response.text)
+        return self.parse_response(OpenDebitCardAccountResponseSchema, response)
 
-    def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponseSchema:
+    def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponseSchema | StructuralView:
         request = OpenCreditCardAccountRequestSchema(user_id=user_id)
         response = self.open_credit_card_account_api(request)
-        return OpenCreditCardAccountResponseSchema.model_validate_json(response.text)
+        return self.parse_response(OpenCreditCardAccountResponseSchema, response)
 
 
 def build_accounts_gateway_http_client() -> AccountsGatewayHTTPClient:
@@ -128,7 +136,11 @@ def build_accounts_gateway_http_client() -> AccountsGatewayHTTPClient:
 
 
 # Новый билдер для нагрузочного тестирования
-def build_accounts_gateway_locust_http_client(environment: Environment) -> AccountsGatewayHTTPClient:
+def build_accounts_gateway_locust_http_client(
+        environment: Environment,
+        client: Client | None = None,
+        validation: ResponseValidation | None = None
+) -> AccountsGatewayHTTPClient:
     """
     Функция создаёт экземпляр AccountsGatewayHTTPClient адаптированного под Locust.
 
@@ -136,6 +148,12 @@ def build_accounts_gateway_locust_http_client(environment: Environment) -> Accou
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param client: готовый httpx.Client (например, общий для всех клиентов виртуального пользователя).
+    :param validation: уровень валидации ответов сценария (по умолчанию — GATEWAY_HTTP_CLIENT.RESPONSE_VALIDATION).
     :return: экземпляр AccountsGatewayHTTPClient с хуками сбора метрик.
     """
-    return AccountsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
\ No newline at end of file
+    return AccountsGatewayHTTPClient(
+        client=client or build_gateway_locust_http_client(environment),
+        validator=build_gateway_locust_response_validator(validation),
+        codec=build_gateway_locust_json_codec()
+    )
\ No newline at end of file
@@ -0,0 +1,20 @@
+from httpx import AsyncClient
+
+from config import settings
+
+
+def build_gateway_async_http_client() -> AsyncClient:
+    """
+    Функция создаёт экземпляр httpx.AsyncClient с базовыми настройками для сервиса http-gateway.
+
+    Модуль намеренно не импортирует locust: асинхронные клиенты работают в обычном
+    asyncio-цикле, который несовместим с gevent monkey patching.
+
+    :return: Готовый к использованию объект httpx.AsyncClient.
+    """
+    return AsyncClient(
+        timeout=settings.gateway_http_client.timeout,
+        base_url=settings.gateway_http_client.client_url,
+        http1=settings.gateway_http_client.http1,
+        http2=settings.gateway_http_client.http2
+    )
@@ -0,0 +1,63 @@
+from httpx import Response
+
+from clients.http.async_client import AsyncHTTPClient
+from clients.http.client import HTTPClientExtensions
+from clients.http.gateway.async_client import build_gateway_async_http_client
+from clients.http.gateway.cards.schema import (
+    IssueVirtualCardRequestSchema,
+    IssueVirtualCardResponseSchema,
+    IssuePhysicalCardRequestSchema,
+    IssuePhysicalCardResponseSchema
+)
+from tools.routes import APIRouteTemplates
+
+
+class AsyncCardsGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/cards сервиса http-gateway.
+    """
+
+    async def issue_virtual_card_api(self, request: IssueVirtualCardRequestSchema) -> Response:
+        """
+        Выпуск виртуальной карты.
+
+        :param request: Pydantic-модель с данными для выпуска виртуальной карты.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post(
+            APIRouteTemplates.ISSUE_VIRTUAL_CARD,
+            content=self.codec.dump_model(request),
+            extensions=HTTPClientExtensions(route=APIRouteTemplates.ISSUE_VIRTUAL_CARD)
+        )
+
+    async def issue_physical_card_api(self, request: IssuePhysicalCardRequestSchema) -> Response:
+        """
+        Выпуск физической карты.
+
+        :param request: Pydantic-модель с данными для выпуска физической карты.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post(
+            APIRouteTemplates.ISSUE_PHYSICAL_CARD,
+            content=self.codec.dump_model(request),
+            extensions=HTTPClientExtensions(route=APIRouteTemplates.ISSUE_PHYSICAL_CARD)
+        )
+
+    async def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponseSchema:
+        request = IssueVirtualCardRequestSchema(user_id=user_id, account_id=account_id)
+        response = await self.issue_virtual_card_api(request)
+        return self.parse_response(IssueVirtualCardResponseSchema, response)
+
+    async def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponseSchema:
+        request = IssuePhysicalCardRequestSchema(user_id=user_id, account_id=account_id)
+        response = await self.issue_physical_card_api(request)
+        return self.parse_response(IssuePhysicalCardResponseSchema, response)
+
+
+def build_cards_gateway_async_http_client() -> AsyncCardsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncCardsGatewayHTTPClient с уже настроенным HTTP-клиентом.
+
+    :return: Готовый к использованию AsyncCardsGatewayHTTPClient.
+    """
+    return AsyncCardsGatewayHTTPClient(client=build_gateway_async_http_client())
@@ -1,7 +1,7 @@
-from httpx import Response
+from httpx import Response, Client
 from locust.env import Environment
 
-from clients.http.client import HTTPClient
+from clients.http.client import HTTPClient, HTTPClientExtensions
 from clients.http.gateway.cards.schema import (
     IssueVirtualCardRequestSchema,
     IssueVirtualCardResponseSchema,
@@ -10,9 +10,13 @@ from clients.http.gateway.cards.schema import (
 )
 from clients.http.gateway.client import (
     build_gateway_http_client,
-    build_gateway_locust_http_client
+    build_gateway_locust_http_client,
+    build_gateway_locust_json_codec,
+    build_gateway_locust_response_validator
 )
-from tools.routes import APIRoutes  # Импортируем enum APIRoutes
+from clients.http.validation import StructuralView
+from tools.config.http import ResponseValidation
+from tools.routes import APIRouteTemplates  # Импортируем реестр шаблонов маршрутов
 
 
 class CardsGatewayHTTPClient(HTTPClient):
@@ -27,10 +31,11 @@ class CardsGatewayHTTPClient(HTTPClient):
         :param request: Pydantic-модель с данными для выпуска виртуальной карты.
         :return: Ответ от сервера (объект httpx.Response).
         """
-        # Вместо /api/v1/cards используем APIRoutes.CARDS
+        # Вместо /api/v1/cards используем шаблон из APIRouteTemplates
         return self.post(
-            f"{APIRoutes.CARDS}/issue-virtual-card",
-            json=request.model_dump(by_alias=True)
+            APIRouteTemplates.ISSUE_VIRTUAL_CARD,
+            content=self.codec.dump_model(request),
+            extensions=HTTPClientExtensions(route=APIRouteTemplates.ISSUE_VIRTUAL_CARD)
         )
 
     def issue_physical_card_api(self, request: IssuePhysicalCardRequestSchema) -> Response:
@@ -40,21 +45,22 @@ class CardsGatewayHTTPClient(HTTPClient):
         :param request: Pydantic-модель с данными для выпуска физической карты.
         :return: Ответ от сервера (объект httpx.Response).
         """
-        # Вместо /api/v1/cards используем APIRoutes.CARDS
+        # Вместо /api/v1/cards используем шаблон из APIRouteTemplates
         return self.post(
-            f"{APIRoutes.CARDS}/issue-physical-card",
-            json=request.model_dump(by_alias=True)
+            APIRouteTemplates.ISSUE_PHYSICAL_CARD,
+            content=self.codec.dump_model(request),
+            extensions=HTTPClientExtensions(route=APIRouteTemplates.ISSUE_PHYSICAL_CARD)
         )
 
-    def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponseSchema:
+    def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponseSchema | StructuralView:
         request = IssueVirtualCardRequestSchema(user_id=user_id, account_id=account_id)
         response = self.issue_virtual_card_api(request)
-        return IssueVirtualCardResponseSchema.model_validate_json(response.text)
+        return self.parse_response(IssueVirtualCardResponseSchema, response)
 
-    def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponseSchema:
+    def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponseSchema | StructuralView:
         request = IssuePhysicalCardRequestSchema(user_id=user_id, account_id=account_id)
         response = self.issue_physical_card_api(request)
-        return IssuePhysicalCardResponseSchema.model_validate_json(response.text)
+        return self.parse_response(IssuePhysicalCardResponseSchema, response)
 
 
 def build_cards_gateway_http_client() -> CardsGatewayHTTPClient:
@@ -67,7 +73,11 @@ def build_cards_gateway_http_client() -> CardsGatewayHTTPClient:
 
 
 # Новый билдер для нагрузочного тестирования
-def build_cards_gateway_locust_http_client(environment: Environment) -> CardsGatewayHTTPClient:
+def build_cards_gateway_locust_http_client(
+        environment: Environment,
+        client: Client | None = None,
+        validation: ResponseValidation | None = None
+) -> CardsGatewayHTTPClient:
     """
     Функция создаёт экземпляр CardsGatewayHTTPClient адаптированного под Locust.
 
@@ -75,6 +85,12 @@ def build_cards_gateway_locust_http_client(environment: Environment) -> CardsGat
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param client: готовый httpx.Client (например, общий для всех клиентов виртуального пользователя).
+    :param validation: уровень валидации ответов сценария (по умолчанию — GATEWAY_HTTP_CLIENT.RESPONSE_VALIDATION).
     :return: экземпляр CardsGatewayHTTPClient с хуками сбора метрик.
     """
-    return CardsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
\ No newline at end of file
+    return CardsGatewayHTTPClient(
+        client=client or build_gateway_locust_http_client(environment),
+        validator=build_gateway_locust_response_validator(validation),
+        codec=build_gateway_locust_json_codec()
+    )
\ No newline at end of file
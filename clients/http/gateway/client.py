@@ -1,13 +1,22 @@
 import logging
+from functools import lru_cache
 
-from httpx import Client
+from httpx import BaseTransport, Client, Limits, Timeout
 from locust.env import Environment  # Импорт окружения Locust для передачи в хуки
 
 from clients.http.event_hooks.locust_event_hook import (
     locust_request_event_hook,  # Хук для отслеживания начала запроса
+    locust_trace_event_hook,  # Хук для трассировки установки соединения
     locust_response_event_hook  # Хук для сбора метрик по завершении запроса
 )
+from clients.http.codecs import JSONCodec, build_json_codec
+from clients.http.transports.gevent_transport import GeventHTTPTransport
+from clients.http.validation import ResponseValidator, build_response_validator
 from config import settings
+from logger import get_logger
+from tools.config.http import HTTPConnectionModel, HTTPTransportBackend, ResponseValidation
+
+logger = get_logger("GATEWAY_HTTP_CLIENT")
 
 
 def build_gateway_http_client() -> Client:
@@ -19,14 +28,66 @@ def build_gateway_http_client() -> Client:
     return Client(timeout=100, base_url="http://localhost:8003")
 
 
-def build_gateway_locust_http_client(environment: Environment) -> Client:
+def build_gateway_locust_http_limits() -> Limits:
+    """
+    Лимиты пула соединений нагрузочного клиента из настроек GATEWAY_HTTP_CLIENT.
+    """
+    config = settings.gateway_http_client
+    return Limits(
+        max_connections=config.max_connections,
+        max_keepalive_connections=config.max_keepalive_connections,
+        keepalive_expiry=config.keepalive_expiry
+    )
+
+
+@lru_cache(maxsize=None)
+def warn_gevent_transport_ignored_settings() -> None:
+    """
+    Один раз на процесс сообщает, какие настройки GATEWAY_HTTP_CLIENT не действуют с TRANSPORT=gevent.
+    """
+    config = settings.gateway_http_client
+    ignored = ["MAX_KEEPALIVE_CONNECTIONS", "KEEPALIVE_EXPIRY"]
+    if config.trace_phases:
+        ignored.append("TRACE_PHASES")
+
+    logger.warning(f"GATEWAY_HTTP_CLIENT.TRANSPORT=gevent ignores {', '.join(ignored)}")
+
+
+def build_gateway_locust_http_transport() -> BaseTransport | None:
+    """
+    Создаёт транспорт нагрузочного клиента согласно GATEWAY_HTTP_CLIENT.TRANSPORT.
+
+    С собственным транспортом httpx не применяет http2 и limits клиента, поэтому для geventhttpclient
+    лимит соединений и ожидание свободного соединения передаются в сам транспорт, а HTTP/2
+    запрещён на уровне настроек.
+
+    :return: Транспорт geventhttpclient или None (тогда httpx создаёт стандартный HTTPTransport).
+    """
+    config = settings.gateway_http_client
+    if config.transport == HTTPTransportBackend.GEVENT:
+        warn_gevent_transport_ignored_settings()
+        return GeventHTTPTransport(
+            limits=build_gateway_locust_http_limits(),
+            pool_timeout=config.pool_timeout,
+            connection_timeout=config.timeout,
+            network_timeout=config.timeout
+        )
+
+    return None
+
+
+def create_gateway_locust_http_client(environment: Environment) -> Client:
     """
     HTTP-клиент, предназначенный специально для нагрузочного тестирования с помощью Locust.
 
     Отличается от обычного клиента тем, что:
     - добавляет хук `locust_request_event_hook` для фиксации времени начала запроса,
     - добавляет хук `locust_response_event_hook`, который вычисляет метрики
-    (время ответа, длину ответа и т.д.) и отправляет их в Locust через `environment.events.request`.
+    (время ответа, длину ответа и т.д.) и отправляет их в Locust через `environment.events.request`,
+    когда тело ответа дочитано (сразу или пачками, см. metrics_batch_size),
+    - при включённом trace_phases добавляет хук `locust_trace_event_hook` для измерения фазы connect,
+    - при включённом http2 работает по HTTP/2, и запросы попадают в статистику с типом "HTTP/2",
+    - при TRANSPORT=gevent отправляет запросы через geventhttpclient; хуки и метрики остаются теми же.
 
     Таким образом, данный клиент автоматически репортит статистику в Locust
     при каждом выполненном HTTP-запросе.
@@ -38,11 +99,113 @@ def build_gateway_locust_http_client(environment: Environment) -> Client:
     # Это избавляет консоль от лишнего вывода при высоконагруженных тестах
     logging.getLogger("httpx").setLevel(logging.WARNING)
 
+    config = settings.gateway_http_client
+    request_hooks = [locust_request_event_hook]  # Отмечаем время начала запроса
+    if config.trace_phases:
+        request_hooks.append(locust_trace_event_hook)  # Отмечаем установку соединения
+
+    transport = build_gateway_locust_http_transport()
+    if transport is None:
+        transport_options = {
+            # HTTP/2 (нужен пакет h2): при включении все запросы процесса идут потоками по нескольким соединениям
+            "http1": config.http1,
+            "http2": config.http2,
+            # Лимиты пула соединений делают модель соединений генератора явной и настраиваемой
+            "limits": build_gateway_locust_http_limits()
+        }
+    else:
+        # Собственный транспорт сам отвечает за протокол и лимиты, httpx эти параметры игнорирует
+        transport_options = {"transport": transport}
+
     return Client(
-        timeout=settings.gateway_http_client.timeout,
-        base_url=settings.gateway_http_client.client_url,
+        # Ожидание соединения пула ограничено отдельно: нехватка соединений генератора видна как PoolTimeout
+        timeout=Timeout(config.timeout, pool=config.pool_timeout),
+        base_url=config.client_url,
+        **transport_options,
         event_hooks={
-            "request": [locust_request_event_hook],  # Отмечаем время начала запроса
-            "response": [locust_response_event_hook(environment)]  # Собираем метрики и передаём их в Locust
+            "request": request_hooks,
+            "response": [
+                # Собираем метрики и передаём их в Locust
+                locust_response_event_hook(
+                    environment,
+                    batch_size=config.metrics_batch_size,
+                    flush_interval=config.metrics_flush_interval
+                )
+            ]
         }
     )
+
+
+def build_gateway_locust_http_client(environment: Environment) -> Client:
+    """
+    Возвращает нагрузочный HTTP-клиент согласно GATEWAY_HTTP_CLIENT.CONNECTION_MODEL.
+
+    - shared: один httpx.Client на процесс Locust — все API-клиенты всех виртуальных пользователей
+      делят один пул соединений, хуки и транспорт; если пользователей процесса больше, чем MAX_CONNECTIONS,
+      при старте выводится предупреждение: запросы будут ждать соединение на генераторе;
+    - per_user: новый httpx.Client на каждый вызов; TaskSet создаёт его один раз и передаёт
+      всем API-клиентам виртуального пользователя (собственные keep-alive соединения на пользователя).
+
+    :param environment: Объект окружения Locust, необходим для генерации событий метрик.
+    :return: httpx.Client с подключёнными хуками под нагрузочное тестирование.
+    """
+    if settings.gateway_http_client.connection_model == HTTPConnectionModel.PER_USER:
+        return create_gateway_locust_http_client(environment)
+
+    client = getattr(environment, "gateway_http_client", None)
+    if client is None:
+        client = create_gateway_locust_http_client(environment)
+        environment.gateway_http_client = client
+        environment.events.quitting.add_listener(lambda **kwargs: client.close())
+        environment.events.spawning_complete.add_listener(warn_shared_pool_exhaustion)
+
+    return client
+
+
+def warn_shared_pool_exhaustion(user_count: int, **kwargs) -> None:
+    """
+    Предупреждает, что общего пула не хватит на всех виртуальных пользователей процесса.
+    """
+    max_connections = settings.gateway_http_client.max_connections
+    if user_count > max_connections:
+        logger.warning(
+            f"{user_count} users share a pool of {max_connections} connections (CONNECTION_MODEL=shared): "
+            f"requests will wait for a free connection on the load generator and the wait counts as response time. "
+            f"Raise GATEWAY_HTTP_CLIENT.MAX_CONNECTIONS or use per_user; enable TRACE_PHASES to see pool_wait"
+        )
+
+
+def release_gateway_locust_http_client(environment: Environment, client: Client) -> None:
+    """
+    Освобождает клиент, полученный из build_gateway_locust_http_client.
+
+    Общий клиент процесса не закрывается, клиент виртуального пользователя закрывается вместе с его соединениями.
+
+    :param environment: Объект окружения Locust.
+    :param client: HTTP-клиент виртуального пользователя.
+    """
+    if client is not getattr(environment, "gateway_http_client", None):
+        client.close()
+
+
+def build_gateway_locust_json_codec() -> JSONCodec:
+    """
+    Создаёт кодек JSON нагрузочных клиентов согласно GATEWAY_HTTP_CLIENT.JSON_CODEC.
+
+    :return: JSONCodec.
+    """
+    return build_json_codec(settings.gateway_http_client.json_codec)
+
+
+def build_gateway_locust_response_validator(validation: ResponseValidation | None = None) -> ResponseValidator:
+    """
+    Создаёт политику разбора ответов для нагрузочных клиентов.
+
+    :param validation: Уровень валидации сценария; None — GATEWAY_HTTP_CLIENT.RESPONSE_VALIDATION.
+    :return: ResponseValidator.
+    """
+    return build_response_validator(
+        validation=validation or settings.gateway_http_client.response_validation,
+        sample_rate=settings.gateway_http_client.response_validation_sample_rate,
+        codec=build_gateway_locust_json_codec()
+    )
@@ -0,0 +1,57 @@
+from httpx import Response
+
+from clients.http.async_client import AsyncHTTPClient
+from clients.http.client import HTTPClientExtensions
+from clients.http.gateway.async_client import build_gateway_async_http_client
+from clients.http.gateway.documents.schema import (
+    GetTariffDocumentResponseSchema,
+    GetContractDocumentResponseSchema
+)
+from tools.routes import APIRouteTemplates
+
+
+class AsyncDocumentsGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/documents сервиса http-gateway.
+    """
+
+    async def get_tariff_document_api(self, account_id: str) -> Response:
+        """
+        Получить тарифа по счету.
+
+        :param account_id: Идентификатор счета.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.get(
+            APIRouteTemplates.TARIFF_DOCUMENT.format(account_id=account_id),
+            extensions=HTTPClientExtensions(route=APIRouteTemplates.TARIFF_DOCUMENT)
+        )
+
+    async def get_contract_document_api(self, account_id: str) -> Response:
+        """
+        Получить контракта по счету.
+
+        :param account_id: Идентификатор счета.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.get(
+            APIRouteTemplates.CONTRACT_DOCUMENT.format(account_id=account_id),
+            extensions=HTTPClientExtensions(route=APIRouteTemplates.CONTRACT_DOCUMENT)
+        )
+
+    async def get_tariff_document(self, account_id: str) -> GetTariffDocumentResponseSchema:
+        response = await self.get_tariff_document_api(account_id)
+        return self.parse_response(GetTariffDocumentResponseSchema, response)
+
+    async def get_contract_document(self, account_id: str) -> GetContractDocumentResponseSchema:
+        response = await self.get_contract_document_api(account_id)
+        return self.parse_response(GetContractDocumentResponseSchema, response)
+
+
+def build_documents_gateway_async_http_client() -> AsyncDocumentsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncDocumentsGatewayHTTPClient с уже настроенным HTTP-клиентом.
+
+    :return: Готовый к использованию AsyncDocumentsGatewayHTTPClient.
+    """
+    return AsyncDocumentsGatewayHTTPClient(client=build_gateway_async_http_client())
@@ -1,13 +1,20 @@
-from httpx import Response
+from httpx import Response, Client
 from locust.env import Environment
 
 from clients.http.client import HTTPClient, HTTPClientExtensions
-from clients.http.gateway.client import build_gateway_http_client, build_gateway_locust_http_client
+from clients.http.gateway.client import (
+    build_gateway_http_client,
+    build_gateway_locust_http_client,
+    build_gateway_locust_json_codec,
+    build_gateway_locust_response_validator
+)
 from clients.http.gateway.documents.schema import (
     GetTariffDocumentResponseSchema,
     GetContractDocumentResponseSchema
 )
-from tools.routes import APIRoutes
+from clients.http.validation import StructuralView
+from tools.config.http import ResponseValidation
+from tools.routes import APIRouteTemplates
 
 
 class DocumentsGatewayHTTPClient(HTTPClient):
@@ -23,8 +30,8 @@ class DocumentsGatewayHTTPClient(HTTPClient):
         :return: Ответ от сервера (объект httpx.Response).
         """
         return self.get(
-            f"{APIRoutes.DOCUMENTS}/tariff-document/{account_id}",
-            extensions=HTTPClientExtensions(route=f"{APIRoutes.DOCUMENTS}/tariff-document/{{account_id}}")
+            APIRouteTemplates.TARIFF_DOCUMENT.format(account_id=account_id),
+            extensions=HTTPClientExtensions(route=APIRouteTemplates.TARIFF_DOCUMENT)
         )
 
     def get_contract_document_api(self, account_id: str) -> Response:
@@ -35,17 +42,17 @@ class DocumentsGatewayHTTPClient(HTTPClient):
         :return: Ответ от сервера (объект httpx.Response).
         """
         return self.get(
-            f"{APIRoutes.DOCUMENTS}/contract-document/{account_id}",
-            extensions=HTTPClientExtensions(route=f"{APIRoutes.DOCUMENTS}/contract-document/{{account_id}}")
+            APIRouteTemplates.CONTRACT_DOCUMENT.format(account_id=account_id),
+            extensions=HTTPClientExtensions(route=APIRouteTemplates.CONTRACT_DOCUMENT)
         )
 
-    def get_tariff_document(self, account_id: str) -> GetTariffDocumentResponseSchema:
+    def get_tariff_document(self, account_id: str) -> GetTariffDocumentResponseSchema | StructuralView:
         response = self.get_tariff_document_api(account_id)
-        return GetTariffDocumentResponseSchema.model_validate_json(response.text)
+        return self.parse_response(GetTariffDocumentResponseSchema, response)
 
-    def get_contract_document(self, account_id: str) -> GetContractDocumentResponseSchema:
+    def get_contract_document(self, account_id: str) -> GetContractDocumentResponseSchema | StructuralView:
         response = self.get_contract_document_api(account_id)
-        return GetContractDocumentResponseSchema.model_validate_json(response.text)
+        return self.parse_response(GetContractDocumentResponseSchema, response)
 
 
 def build_documents_gateway_http_client() -> DocumentsGatewayHTTPClient:
@@ -57,7 +64,11 @@ def build_documents_gateway_http_client() -> DocumentsGatewayHTTPClient:
     return DocumentsGatewayHTTPClient(client=build_gateway_http_client())
 
 
-def build_documents_gateway_locust_http_client(environment: Environment) -> DocumentsGatewayHTTPClient:
+def build_documents_gateway_locust_http_client(
+        environment: Environment,
+        client: Client | None = None,
+        validation: ResponseValidation | None = None
+) -> DocumentsGatewayHTTPClient:
     """
     Функция создаёт экземпляр DocumentsGatewayHTTPClient адаптированного под Locust.
 
@@ -65,6 +76,12 @@ def build_documents_gateway_locust_http_client(environment: Environment) -> Docu
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param client: готовый httpx.Client (например, общий для всех клиентов виртуального пользователя).
+    :param validation: уровень валидации ответов сценария (по умолчанию — GATEWAY_HTTP_CLIENT.RESPONSE_VALIDATION).
     :return: экземпляр DocumentsGatewayHTTPClient с хуками сбора метрик.
     """
-    return DocumentsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return DocumentsGatewayHTTPClient(
+        client=client or build_gateway_locust_http_client(environment),
+        validator=build_gateway_locust_response_validator(validation),
+        codec=build_gateway_locust_json_codec()
+    )
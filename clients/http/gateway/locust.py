@@ -1,3 +1,4 @@
+from httpx import Client
 from locust import TaskSet, SequentialTaskSet
 
 # Импортируем типы и билдеры для построения HTTP API клиентов
@@ -12,6 +13,8 @@ from clients.http.gateway.operations.client import (
     build_operations_gateway_locust_http_client
 )
 from clients.http.gateway.users.client import UsersGatewayHTTPClient, build_users_gateway_locust_http_client
+from clients.http.gateway.client import build_gateway_locust_http_client, release_gateway_locust_http_client
+from tools.config.http import ResponseValidation
 
 
 class GatewayHTTPTaskSet(TaskSet):
@@ -22,7 +25,11 @@ class GatewayHTTPTaskSet(TaskSet):
     Используется, если порядок выполнения задач внутри таск-сета не имеет значения.
     """
 
+    # Уровень валидации ответов для сценария; None — GATEWAY_HTTP_CLIENT.RESPONSE_VALIDATION
+    response_validation: ResponseValidation | None = None
+
     # Аннотации полей с клиентами (появятся в self после on_start)
+    http_client: Client
     users_gateway_client: UsersGatewayHTTPClient
     cards_gateway_client: CardsGatewayHTTPClient
     accounts_gateway_client: AccountsGatewayHTTPClient
@@ -34,11 +41,30 @@ class GatewayHTTPTaskSet(TaskSet):
         Метод вызывается перед запуском задач TaskSet.
         Здесь создаются API клиенты с использованием контекста окружения Locust.
         """
-        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment)
-        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.user.environment)
-        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment)
-        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment)
-        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment)
+        # Один httpx.Client на виртуального пользователя: общий для процесса или собственный (см. CONNECTION_MODEL)
+        self.http_client = build_gateway_locust_http_client(self.user.environment)
+
+        self.users_gateway_client = build_users_gateway_locust_http_client(
+            self.user.environment, self.http_client, self.response_validation
+        )
+        self.cards_gateway_client = build_cards_gateway_locust_http_client(
+            self.user.environment, self.http_client, self.response_validation
+        )
+        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(
+            self.user.environment, self.http_client, self.response_validation
+        )
+        self.documents_gateway_client = build_documents_gateway_locust_http_client(
+            self.user.environment, self.http_client, self.response_validation
+        )
+        self.operations_gateway_client = build_operations_gateway_locust_http_client(
+            self.user.environment, self.http_client, self.response_validation
+        )
+
+    def on_stop(self) -> None:
+        """
+        Закрывает собственный httpx.Client виртуального пользователя (общий клиент процесса остаётся открытым).
+        """
+        release_gateway_locust_http_client(self.user.environment, self.http_client)
 
 
 class GatewayHTTPSequentialTaskSet(SequentialTaskSet):
@@ -49,6 +75,9 @@ class GatewayHTTPSequentialTaskSet(SequentialTaskSet):
     Также здесь инициализируются те же API клиенты, что и в обычном TaskSet.
     """
 
+    response_validation: ResponseValidation | None = None
+
+    http_client: Client
     users_gateway_client: UsersGatewayHTTPClient
     cards_gateway_client: CardsGatewayHTTPClient
     accounts_gateway_client: AccountsGatewayHTTPClient
@@ -59,8 +88,27 @@ class GatewayHTTPSequentialTaskSet(SequentialTaskSet):
         """
         Создание API клиентов для последовательного сценария.
         """
-        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment)
-        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.user.environment)
-        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment)
-        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment)
-        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment)
+        # Один httpx.Client на виртуального пользователя: общий для процесса или собственный (см. CONNECTION_MODEL)
+        self.http_client = build_gateway_locust_http_client(self.user.environment)
+
+        self.users_gateway_client = build_users_gateway_locust_http_client(
+            self.user.environment, self.http_client, self.response_validation
+        )
+        self.cards_gateway_client = build_cards_gateway_locust_http_client(
+            self.user.environment, self.http_client, self.response_validation
+        )
+        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(
+            self.user.environment, self.http_client, self.response_validation
+        )
+        self.documents_gateway_client = build_documents_gateway_locust_http_client(
+            self.user.environment, self.http_client, self.response_validation
+        )
+        self.operations_gateway_client = build_operations_gateway_locust_http_client(
+            self.user.environment, self.http_client, self.response_validation
+        )
+
+    def on_stop(self) -> None:
+        """
+        Закрывает собственный httpx.Client виртуального пользователя (общий клиент процесса остаётся открытым).
+        """
+        release_gateway_locust_http_client(self.user.environment, self.http_client)
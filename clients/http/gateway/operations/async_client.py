@@ -0,0 +1,262 @@
+from httpx import Response, QueryParams
+
+from clients.http.async_client import AsyncHTTPClient
+from clients.http.client import HTTPClientExtensions
+from clients.http.gateway.async_client import build_gateway_async_http_client
+from clients.http.gateway.operations.schema import (
+    GetOperationResponseSchema,
+    GetOperationReceiptResponseSchema,
+    GetOperationsQuerySchema,
+    GetOperationsResponseSchema,
+    GetOperationsSummaryQuerySchema,
+    GetOperationsSummaryResponseSchema,
+    MakeFeeOperationRequestSchema,
+    MakeFeeOperationResponseSchema,
+    MakeTopUpOperationRequestSchema,
+    MakeTopUpOperationResponseSchema,
+    MakeCashbackOperationRequestSchema,
+    MakeCashbackOperationResponseSchema,
+    MakeTransferOperationRequestSchema,
+    MakeTransferOperationResponseSchema,
+    MakePurchaseOperationRequestSchema,
+    MakePurchaseOperationResponseSchema,
+    MakeBillPaymentOperationRequestSchema,
+    MakeBillPaymentOperationResponseSchema,
+    MakeCashWithdrawalOperationRequestSchema,
+    MakeCashWithdrawalOperationResponseSchema
+)
+from tools.routes import APIRouteTemplates
+
+
+class AsyncOperationsGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/operations сервиса http-gateway.
+    """
+
+    async def get_operation_api(self, operation_id: str) -> Response:
+        """
+        Получает информацию об операции по её идентификатору.
+
+        :param operation_id: Уникальный идентификатор операции.
+        :return: Объект httpx.Response с данными об операции.
+        """
+        return await self.get(
+            APIRouteTemplates.OPERATION.format(operation_id=operation_id),
+            extensions=HTTPClientExtensions(route=APIRouteTemplates.OPERATION)
+        )
+
+    async def get_operation_receipt_api(self, operation_id: str) -> Response:
+        """
+        Получает чек по заданной операции.
+
+        :param operation_id: Уникальный идентификатор операции.
+        :return: Объект httpx.Response с чеком по операции.
+        """
+        return await self.get(
+            APIRouteTemplates.OPERATION_RECEIPT.format(operation_id=operation_id),
+            extensions=HTTPClientExtensions(route=APIRouteTemplates.OPERATION_RECEIPT)
+        )
+
+    async def get_operations_api(self, query: GetOperationsQuerySchema) -> Response:
+        """
+        Получает список операций по счёту.
+
+        :param query: Словарь с параметром accountId.
+        :return: Объект httpx.Response с операциями по счёту.
+        """
+        return await self.get(
+            APIRouteTemplates.OPERATIONS,
+            params=QueryParams(**query.model_dump(by_alias=True)),
+            extensions=HTTPClientExtensions(route=APIRouteTemplates.OPERATIONS)
+        )
+
+    async def get_operations_summary_api(self, query: GetOperationsSummaryQuerySchema) -> Response:
+        """
+        Получает сводную статистику операций по счёту.
+
+        :param query: Словарь с параметром accountId.
+        :return: Объект httpx.Response с агрегированной информацией.
+        """
+        return await self.get(
+            APIRouteTemplates.OPERATIONS_SUMMARY,
+            params=QueryParams(**query.model_dump(by_alias=True)),
+            extensions=HTTPClientExtensions(route=APIRouteTemplates.OPERATIONS_SUMMARY)
+        )
+
+    async def make_fee_operation_api(self, request: MakeFeeOperationRequestSchema) -> Response:
+        """
+        Создаёт операцию комиссии.
+
+        :param request: Тело запроса с параметрами операции.
+        :return: Объект httpx.Response с результатом операции.
+        """
+        return await self.post(
+            APIRouteTemplates.MAKE_FEE_OPERATION,
+            content=self.codec.dump_model(request),
+            extensions=HTTPClientExtensions(route=APIRouteTemplates.MAKE_FEE_OPERATION)
+        )
+
+    async def make_top_up_operation_api(self, request: MakeTopUpOperationRequestSchema) -> Response:
+        """
+        Создаёт операцию пополнения счёта.
+
+        :param request: Тело запроса с параметрами операции.
+        :return: Объект httpx.Response с результатом операции.
+        """
+        return await self.post(
+            APIRouteTemplates.MAKE_TOP_UP_OPERATION,
+            content=self.codec.dump_model(request),
+            extensions=HTTPClientExtensions(route=APIRouteTemplates.MAKE_TOP_UP_OPERATION)
+        )
+
+    async def make_cashback_operation_api(self, request: MakeCashbackOperationRequestSchema) -> Response:
+        """
+        Создаёт операцию начисления кэшбэка.
+
+        :param request: Тело запроса с параметрами операции.
+        :return: Объект httpx.Response с результатом операции.
+        """
+        return await self.post(
+            APIRouteTemplates.MAKE_CASHBACK_OPERATION,
+            content=self.codec.dump_model(request),
+            extensions=HTTPClientExtensions(route=APIRouteTemplates.MAKE_CASHBACK_OPERATION)
+        )
+
+    async def make_transfer_operation_api(self, request: MakeTransferOperationRequestSchema) -> Response:
+        """
+        Создаёт операцию перевода средств.
+
+        :param request: Тело запроса с параметрами операции.
+        :return: Объект httpx.Response с результатом операции.
+        """
+        return await self.post(
+            APIRouteTemplates.MAKE_TRANSFER_OPERATION,
+            content=self.codec.dump_model(request),
+            extensions=HTTPClientExtensions(route=APIRouteTemplates.MAKE_TRANSFER_OPERATION)
+        )
+
+    async def make_purchase_operation_api(self, request: MakePurchaseOperationRequestSchema) -> Response:
+        """
+        Создаёт операцию покупки.
+
+        :param request: Тело запроса с параметрами операции, включая категорию.
+        :return: Объект httpx.Response с результатом операции.
+        """
+        return await self.post(
+            APIRouteTemplates.MAKE_PURCHASE_OPERATION,
+            content=self.codec.dump_model(request),
+            extensions=HTTPClientExtensions(route=APIRouteTemplates.MAKE_PURCHASE_OPERATION)
+        )
+
+    async def make_bill_payment_operation_api(self, request: MakeBillPaymentOperationRequestSchema) -> Response:
+        """
+        Создаёт операцию оплаты счёта.
+
+        :param request: Тело запроса с параметрами операции.
+        :return: Объект httpx.Response с результатом операции.
+        """
+        return await self.post(
+            APIRouteTemplates.MAKE_BILL_PAYMENT_OPERATION,
+            content=self.codec.dump_model(request),
+            extensions=HTTPClientExtensions(route=APIRouteTemplates.MAKE_BILL_PAYMENT_OPERATION)
+        )
+
+    async def make_cash_withdrawal_operation_api(self, request: MakeCashWithdrawalOperationRequestSchema) -> Response:
+        """
+        Создаёт операцию снятия наличных средств.
+
+        :param request: Тело запроса с параметрами операции.
+        :return: Объект httpx.Response с результатом операции.
+        """
+        return await self.post(
+            APIRouteTemplates.MAKE_CASH_WITHDRAWAL_OPERATION,
+            content=self.codec.dump_model(request),
+            extensions=HTTPClientExtensions(route=APIRouteTemplates.MAKE_CASH_WITHDRAWAL_OPERATION)
+        )
+
+    async def get_operation(self, operation_id: str) -> GetOperationResponseSchema:
+        response = await self.get_operation_api(operation_id)
+        return self.parse_response(GetOperationResponseSchema, response)
+
+    async def get_operation_receipt(self, operation_id: str) -> GetOperationReceiptResponseSchema:
+        response = await self.get_operation_receipt_api(operation_id)
+        return self.parse_response(GetOperationReceiptResponseSchema, response)
+
+    async def get_operations(self, account_id: str) -> GetOperationsResponseSchema:
+        query = GetOperationsQuerySchema(account_id=account_id)
+        response = await self.get_operations_api(query)
+        return self.parse_response(GetOperationsResponseSchema, response)
+
+    async def get_operations_summary(self, account_id: str) -> GetOperationsSummaryResponseSchema:
+        query = GetOperationsSummaryQuerySchema(account_id=account_id)
+        response = await self.get_operations_summary_api(query)
+        return self.parse_response(GetOperationsSummaryResponseSchema, response)
+
+    async def make_fee_operation(self, card_id: str, account_id: str) -> MakeFeeOperationResponseSchema:
+        request = MakeFeeOperationRequestSchema(
+            card_id=card_id,
+            account_id=account_id
+        )
+        response = await self.make_fee_operation_api(request)
+        return self.parse_response(MakeFeeOperationResponseSchema, response)
+
+    async def make_top_up_operation(self, card_id: str, account_id: str) -> MakeTopUpOperationResponseSchema:
+        request = MakeTopUpOperationRequestSchema(
+            card_id=card_id,
+            account_id=account_id
+        )
+        response = await self.make_top_up_operation_api(request)
+        return self.parse_response(MakeTopUpOperationResponseSchema, response)
+
+    async def make_cashback_operation(self, card_id: str, account_id: str) -> MakeCashbackOperationResponseSchema:
+        request = MakeCashbackOperationRequestSchema(
+            card_id=card_id,
+            account_id=account_id
+        )
+        response = await self.make_cashback_operation_api(request)
+        return self.parse_response(MakeCashbackOperationResponseSchema, response)
+
+    async def make_transfer_operation(self, card_id: str, account_id: str) -> MakeTransferOperationResponseSchema:
+        request = MakeTransferOperationRequestSchema(
+            card_id=card_id,
+            account_id=account_id
+        )
+        response = await self.make_transfer_operation_api(request)
+        return self.parse_response(MakeTransferOperationResponseSchema, response)
+
+    async def make_purchase_operation(self, card_id: str, account_id: str) -> MakePurchaseOperationResponseSchema:
+        request = MakePurchaseOperationRequestSchema(
+            card_id=card_id,
+            account_id=account_id
+        )
+        response = await self.make_purchase_operation_api(request)
+        return self.parse_response(MakePurchaseOperationResponseSchema, response)
+
+    async def make_bill_payment_operation(self, card_id: str, account_id: str) -> MakeBillPaymentOperationResponseSchema:
+        request = MakeBillPaymentOperationRequestSchema(
+            card_id=card_id,
+            account_id=account_id
+        )
+        response = await self.make_bill_payment_operation_api(request)
+        return self.parse_response(MakeBillPaymentOperationResponseSchema, response)
+
+    async def make_cash_withdrawal_operation(
+            self,
+            card_id: str,
+            account_id: str
+    ) -> MakeCashWithdrawalOperationResponseSchema:
+        request = MakeCashWithdrawalOperationRequestSchema(
+            card_id=card_id,
+            account_id=account_id
+        )
+        response = await self.make_cash_withdrawal_operation_api(request)
+        return self.parse_response(MakeCashWithdrawalOperationResponseSchema, response)
+
+
+def build_operations_gateway_async_http_client() -> AsyncOperationsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncOperationsGatewayHTTPClient с уже настроенным HTTP-клиентом.
+
+    :return: Готовый к использованию AsyncOperationsGatewayHTTPClient.
+    """
+    return AsyncOperationsGatewayHTTPClient(client=build_gateway_async_http_client())
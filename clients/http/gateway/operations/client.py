@@ -1,10 +1,12 @@
-from httpx import Response, QueryParams
+from httpx import Response, QueryParams, Client
 from locust.env import Environment  # Импорт окружения Locust
 
 from clients.http.client import HTTPClient, HTTPClientExtensions  # Импортируем тип extensions
 from clients.http.gateway.client import (
     build_gateway_http_client,
-    build_gateway_locust_http_client  # Импорт билдера для нагрузочного тестирования
+    build_gateway_locust_http_client,  # Импорт билдера для нагрузочного тестирования
+    build_gateway_locust_json_codec,
+    build_gateway_locust_response_validator
 )
 from clients.http.gateway.operations.schema import (
     GetOperationResponseSchema,
@@ -29,7 +31,9 @@ from clients.http.gateway.operations.schema import (
     MakeCashWithdrawalOperationResponseSchema
 )
 
-from tools.routes import APIRoutes  # Импортируем enum APIRoutes
+from clients.http.validation import StructuralView
+from tools.config.http import ResponseValidation
+from tools.routes import APIRouteTemplates  # Импортируем реестр шаблонов маршрутов
 
 class OperationsGatewayHTTPClient(HTTPClient):
     """
@@ -44,9 +48,9 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :return: Объект httpx.Response с данными об операции.
         """
         return self.get(
-            f"{APIRoutes.OPERATIONS}/{operation_id}",
+            APIRouteTemplates.OPERATION.format(operation_id=operation_id),
             # Явно передаём логическое имя маршрута
-            extensions=HTTPClientExtensions(route=f"{APIRoutes.OPERATIONS}/{operation_id}")
+            extensions=HTTPClientExtensions(route=APIRouteTemplates.OPERATION)
         )
 
     def get_operation_receipt_api(self, operation_id: str) -> Response:
@@ -57,9 +61,9 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :return: Объект httpx.Response с чеком по операции.
         """
         return self.get(
-            f"{APIRoutes.OPERATIONS}/operation-receipt/{operation_id}",
+            APIRouteTemplates.OPERATION_RECEIPT.format(operation_id=operation_id),
             # Явно передаём логическое имя маршрута
-            extensions=HTTPClientExtensions(route=f"{APIRoutes.OPERATIONS}/operation-receipt/{operation_id}")
+            extensions=HTTPClientExtensions(route=APIRouteTemplates.OPERATION_RECEIPT)
         )
 
     def get_operations_api(self, query: GetOperationsQuerySchema) -> Response:
@@ -70,10 +74,10 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :return: Объект httpx.Response с операциями по счёту.
         """
         return self.get(
-            f"{APIRoutes.OPERATIONS}",
+            APIRouteTemplates.OPERATIONS,
             params=QueryParams(**query.model_dump(by_alias=True)),
             # Явно передаём логическое имя маршрута
-            extensions=HTTPClientExtensions(route=f"{APIRoutes.OPERATIONS}")
+            extensions=HTTPClientExtensions(route=APIRouteTemplates.OPERATIONS)
         )
 
     def get_operations_summary_api(self, query: GetOperationsSummaryQuerySchema) -> Response:
@@ -84,10 +88,10 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :return: Объект httpx.Response с агрегированной информацией.
         """
         return self.get(
-            f"{APIRoutes.OPERATIONS}/operations-summary",
+            APIRouteTemplates.OPERATIONS_SUMMARY,
             params=QueryParams(**query.model_dump(by_alias=True)),
             # Явно передаём логическое имя маршрута
-            extensions=HTTPClientExtensions(route=f"{APIRoutes.OPERATIONS}/operations-summary")
+            extensions=HTTPClientExtensions(route=APIRouteTemplates.OPERATIONS_SUMMARY)
         )
 
 # Остальной код без изменений
@@ -100,8 +104,9 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :return: Объект httpx.Response с результатом операции.
         """
         return self.post(
-            f"{APIRoutes.OPERATIONS}/make-fee-operation",
-            json=request.model_dump(by_alias=True)
+            APIRouteTemplates.MAKE_FEE_OPERATION,
+            content=self.codec.dump_model(request),
+            extensions=HTTPClientExtensions(route=APIRouteTemplates.MAKE_FEE_OPERATION)
         )
 
     def make_top_up_operation_api(self, request: MakeTopUpOperationRequestSchema) -> Response:
@@ -112,8 +117,9 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :return: Объект httpx.Response с результатом операции.
         """
         return self.post(
-            f"{APIRoutes.OPERATIONS}/make-top-up-operation",
-            json=request.model_dump(by_alias=True)
+            APIRouteTemplates.MAKE_TOP_UP_OPERATION,
+            content=self.codec.dump_model(request),
+            extensions=HTTPClientExtensions(route=APIRouteTemplates.MAKE_TOP_UP_OPERATION)
         )
 
     def make_cashback_operation_api(self, request: MakeCashbackOperationRequestSchema) -> Response:
@@ -124,8 +130,9 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :return: Объект httpx.Response с результатом операции.
         """
         return self.post(
-            f"{APIRoutes.OPERATIONS}/make-cashback-operation",
-            json=request.model_dump(by_alias=True)
+            APIRouteTemplates.MAKE_CASHBACK_OPERATION,
+            content=self.codec.dump_model(request),
+            extensions=HTTPClientExtensions(route=APIRouteTemplates.MAKE_CASHBACK_OPERATION)
         )
 
     def make_transfer_operation_api(self, request: MakeTransferOperationRequestSchema) -> Response:
@@ -136,8 +143,9 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :return: Объект httpx.Response с результатом операции.
         """
         return self.post(
-            f"{APIRoutes.OPERATIONS}/make-transfer-operation",
-            json=request.model_dump(by_alias=True)
+            APIRouteTemplates.MAKE_TRANSFER_OPERATION,
+            content=self.codec.dump_model(request),
+            extensions=HTTPClientExtensions(route=APIRouteTemplates.MAKE_TRANSFER_OPERATION)
         )
 
     def make_purchase_operation_api(self, request: MakePurchaseOperationRequestSchema) -> Response:
@@ -148,8 +156,9 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :return: Объект httpx.Response с результатом операции.
         """
         return self.post(
-            f"{APIRoutes.OPERATIONS}/make-purchase-operation",
-            json=request.model_dump(by_alias=True)
+            APIRouteTemplates.MAKE_PURCHASE_OPERATION,
+            content=self.codec.dump_model(request),
+            extensions=HTTPClientExtensions(route=APIRouteTemplates.MAKE_PURCHASE_OPERATION)
         )
 
     def make_bill_payment_operation_api(self, request: MakeBillPaymentOperationRequestSchema) -> Response:
@@ -160,8 +169,9 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :return: Объект httpx.Response с результатом операции.
         """
         return self.post(
-            f"{APIRoutes.OPERATIONS}/make-bill-payment-operation",
-            json=request.model_dump(by_alias=True)
+            APIRouteTemplates.MAKE_BILL_PAYMENT_OPERATION,
+            content=self.codec.dump_model(request),
+            extensions=HTTPClientExtensions(route=APIRouteTemplates.MAKE_BILL_PAYMENT_OPERATION)
         )
 
     def make_cash_withdrawal_operation_api(self, request: MakeCashWithdrawalOperationRequestSchema) -> Response:
@@ -172,87 +182,88 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :return: Объект httpx.Response с результатом операции.
         """
         return self.post(
-            f"{APIRoutes.OPERATIONS}/make-cash-withdrawal-operation",
-            json=request.model_dump(by_alias=True)
+            APIRouteTemplates.MAKE_CASH_WITHDRAWAL_OPERATION,
+            content=self.codec.dump_model(request),
+            extensions=HTTPClientExtensions(route=APIRouteTemplates.MAKE_CASH_WITHDRAWAL_OPERATION)
         )
 
-    def get_operation(self, operation_id: str) -> GetOperationResponseSchema:
+    def get_operation(self, operation_id: str) -> GetOperationResponseSchema | StructuralView:
         response = self.get_operation_api(operation_id)
-        return GetOperationResponseSchema.model_validate_json(response.text)
+        return self.parse_response(GetOperationResponseSchema, response)
 
-    def get_operation_receipt(self, operation_id: str) -> GetOperationReceiptResponseSchema:
+    def get_operation_receipt(self, operation_id: str) -> GetOperationReceiptResponseSchema | StructuralView:
         response = self.get_operation_receipt_api(operation_id)
-        return GetOperationReceiptResponseSchema.model_validate_json(response.text)
+        return self.parse_response(GetOperationReceiptResponseSchema, response)
 
-    def get_operations(self, account_id: str) -> GetOperationsResponseSchema:
+    def get_operations(self, account_id: str) -> GetOperationsResponseSchema | StructuralView:
         query = GetOperationsQuerySchema(account_id=account_id)
         response = self.get_operations_api(query)
-        return GetOperationsResponseSchema.model_validate_json(response.text)
+        return self.parse_response(GetOperationsResponseSchema, response)
 
-    def get_operations_summary(self, account_id: str) -> GetOperationsSummaryResponseSchema:
+    def get_operations_summary(self, account_id: str) -> GetOperationsSummaryResponseSchema | StructuralView:
         query = GetOperationsSummaryQuerySchema(account_id=account_id)
         response = self.get_operations_summary_api(query)
-        return GetOperationsSummaryResponseSchema.model_validate_json(response.text)
+        return self.parse_response(GetOperationsSummaryResponseSchema, response)
 
-    def make_fee_operation(self, card_id: str, account_id: str) -> MakeFeeOperationResponseSchema:
+    def make_fee_operation(self, card_id: str, account_id: str) -> MakeFeeOperationResponseSchema | StructuralView:
         request = MakeFeeOperationRequestSchema(
             card_id=card_id,
             account_id=account_id
         )
         response = self.make_fee_operation_api(request)
-        return MakeFeeOperationResponseSchema.model_validate_json(response.text)
+        return self.parse_response(MakeFeeOperationResponseSchema, response)
 
-    def make_top_up_operation(self, card_id: str, account_id: str) -> MakeTopUpOperationResponseSchema:
+    def make_top_up_operation(self, card_id: str, account_id: str) -> MakeTopUpOperationResponseSchema | StructuralView:
         request = MakeTopUpOperationRequestSchema(
             card_id=card_id,
             account_id=account_id
         )
         response = self.make_top_up_operation_api(request)
-        return MakeTopUpOperationResponseSchema.model_validate_json(response.text)
+        return self.parse_response(MakeTopUpOperationResponseSchema, response)
 
-    def make_cashback_operation(self, card_id: str, account_id: str) -> MakeCashbackOperationResponseSchema:
+    def make_cashback_operation(self, card_id: str, account_id: str) -> MakeCashbackOperationResponseSchema | StructuralView:
         request = MakeCashbackOperationRequestSchema(
             card_id=card_id,
             account_id=account_id
         )
         response = self.make_cashback_operation_api(request)
-        return MakeCashbackOperationResponseSchema.model_validate_json(response.text)
+        return self.parse_response(MakeCashbackOperationResponseSchema, response)
 
-    def make_transfer_operation(self, card_id: str, account_id: str) -> MakeTransferOperationResponseSchema:
+    def make_transfer_operation(self, card_id: str, account_id: str) -> MakeTransferOperationResponseSchema | StructuralView:
         request = MakeTransferOperationRequestSchema(
             card_id=card_id,
             account_id=account_id
         )
         response = self.make_transfer_operation_api(request)
-        return MakeTransferOperationResponseSchema.model_validate_json(response.text)
+        return self.parse_response(MakeTransferOperationResponseSchema, response)
 
-    def make_purchase_operation(self, card_id: str, account_id: str) -> MakePurchaseOperationResponseSchema:
+    def make_purchase_operation(self, card_id: str, account_id: str) -> MakePurchaseOperationResponseSchema | StructuralView:
         request = MakePurchaseOperationRequestSchema(
             card_id=card_id,
             account_id=account_id
         )
         response = self.make_purchase_operation_api(request)
-        return MakePurchaseOperationResponseSchema.model_validate_json(response.text)
+        return self.parse_response(MakePurchaseOperationResponseSchema, response)
 
-    def make_bill_payment_operation(self, card_id: str, account_id: str) -> MakeBillPaymentOperationResponseSchema:
+    def make_bill_payment_operation(self, card_id: str, account_id: str) -> MakeBillPaymentOperationResponseSchema | StructuralView:
         request = MakeBillPaymentOperationRequestSchema(
             card_id=card_id,
             account_id=account_id
         )
         response = self.make_bill_payment_operation_api(request)
-        return MakeBillPaymentOperationResponseSchema.model_validate_json(response.text)
+        return self.parse_response(MakeBillPaymentOperationResponseSchema, response)
 
     def make_cash_withdrawal_operation(
             self,
             card_id: str,
             account_id: str
-    ) -> MakeCashWithdrawalOperationResponseSchema:
+    ) -> MakeCashWithdrawalOperationResponseSchema | StructuralView:
         request = MakeCashWithdrawalOperationRequestSchema(
             card_id=card_id,
             account_id=account_id
         )
         response = self.make_cash_withdrawal_operation_api(request)
-        return MakeCashWithdrawalOperationResponseSchema.model_validate_json(response.text)
+        return self.parse_response(MakeCashWithdrawalOperationResponseSchema, response)
 
 
 def build_operations_gateway_http_client() -> OperationsGatewayHTTPClient:
@@ -263,7 +274,11 @@ def build_operations_gateway_http_client() -> OperationsGatewayHTTPClient:
     """
     return OperationsGatewayHTTPClient(client=build_gateway_http_client())
 
-def build_operations_gateway_locust_http_client(environment: Environment) -> OperationsGatewayHTTPClient:
+def build_operations_gateway_locust_http_client(
+        environment: Environment,
+        client: Client | None = None,
+        validation: ResponseValidation | None = None
+) -> OperationsGatewayHTTPClient:
     """
     Функция создаёт экземпляр OperationsGatewayHTTPClient адаптированного под Locust.
 
@@ -271,8 +286,14 @@ def build_operations_gateway_locust_http_client(environment: Environment) -> Ope
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param client: готовый httpx.Client (например, общий для всех клиентов виртуального пользователя).
+    :param validation: уровень валидации ответов сценария (по умолчанию — GATEWAY_HTTP_CLIENT.RESPONSE_VALIDATION).
     :return: экземпляр OperationsGatewayHTTPClient с хуками сбора метрик.
     """
-    return OperationsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return OperationsGatewayHTTPClient(
+        client=client or build_gateway_locust_http_client(environment),
+        validator=build_gateway_locust_response_validator(validation),
+        codec=build_gateway_locust_json_codec()
+    )
 
 
@@ -1,17 +1,21 @@
-from httpx import Response
+from httpx import Response, Client
 from locust.env import Environment
 
 from clients.http.client import HTTPClient, HTTPClientExtensions
 from clients.http.gateway.client import (
     build_gateway_http_client,
-    build_gateway_locust_http_client
+    build_gateway_locust_http_client,
+    build_gateway_locust_json_codec,
+    build_gateway_locust_response_validator
 )
 from clients.http.gateway.users.schema import (
     GetUserResponseSchema,
     CreateUserRequestSchema,
     CreateUserResponseSchema
 )
-from tools.routes import APIRoutes  # Импортируем enum APIRoutes
+from clients.http.validation import StructuralView
+from tools.config.http import ResponseValidation
+from tools.routes import APIRouteTemplates  # Импортируем реестр шаблонов маршрутов
 
 
 class UsersGatewayHTTPClient(HTTPClient):
@@ -26,10 +30,10 @@ class UsersGatewayHTTPClient(HTTPClient):
         :param user_id: Идентификатор пользователя.
         :return: Ответ от сервера (объект httpx.Response).
         """
-        # Вместо /api/v1/users используем APIRoutes.USERS
+        # Вместо /api/v1/users используем шаблон из APIRouteTemplates
         return self.get(
-            f"{APIRoutes.USERS}/{user_id}",
-            extensions=HTTPClientExtensions(route=f"{APIRoutes.USERS}/{{user_id}}")
+            APIRouteTemplates.USER.format(user_id=user_id),
+            extensions=HTTPClientExtensions(route=APIRouteTemplates.USER)
         )
 
     def create_user_api(self, request: CreateUserRequestSchema) -> Response:
@@ -39,21 +43,25 @@ class UsersGatewayHTTPClient(HTTPClient):
         :param request: Pydantic-модель с данными нового пользователя.
         :return: Ответ от сервера (объект httpx.Response).
         """
-        # Вместо /api/v1/users используем APIRoutes.USERS
-        return self.post(APIRoutes.USERS, json=request.model_dump(by_alias=True))
+        # Вместо /api/v1/users используем шаблон из APIRouteTemplates
+        return self.post(
+            APIRouteTemplates.USERS,
+            content=self.codec.dump_model(request),
+            extensions=HTTPClientExtensions(route=APIRouteTemplates.USERS)
+        )
 
 
-    def get_user(self, user_id: str) -> GetUserResponseSchema:
+    def get_user(self, user_id: str) -> GetUserResponseSchema | StructuralView:
         response = self.get_user_api(user_id)
         # Инициализируем модель через валидацию JSON строки
-        return GetUserResponseSchema.model_validate_json(response.text)
+        return self.parse_response(GetUserResponseSchema, response)
 
     # Теперь используем pydantic-модель для аннотации
-    def create_user(self) -> CreateUserResponseSchema:
+    def create_user(self) -> CreateUserResponseSchema | StructuralView:
         # Генерация данных теперь происходит внутри схемы запроса
         request = CreateUserRequestSchema()
         response = self.create_user_api(request)
-        return CreateUserResponseSchema.model_validate_json(response.text)
+        return self.parse_response(CreateUserResponseSchema, response)
 
 
 def build_users_gateway_http_client() -> UsersGatewayHTTPClient:
@@ -66,7 +74,11 @@ def build_users_gateway_http_client() -> UsersGatewayHTTPClient:
 
 
 # Новый билдер для нагрузочного тестирования
-def build_users_gateway_locust_http_client(environment: Environment) -> UsersGatewayHTTPClient:
+def build_users_gateway_locust_http_client(
+        environment: Environment,
+        client: Client | None = None,
+        validation: ResponseValidation | None = None
+) -> UsersGatewayHTTPClient:
     """
     Функция создаёт экземпляр UsersGatewayHTTPClient адаптированного под Locust.
 
@@ -74,6 +86,12 @@ def build_users_gateway_locust_http_client(environment: Environment) -> UsersGat
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param client: готовый httpx.Client (например, общий для всех клиентов виртуального пользователя).
+    :param validation: уровень валидации ответов сценария (по умолчанию — GATEWAY_HTTP_CLIENT.RESPONSE_VALIDATION).
     :return: экземпляр UsersGatewayHTTPClient с хуками сбора метрик.
     """
-    return UsersGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return UsersGatewayHTTPClient(
+        client=client or build_gateway_locust_http_client(environment),
+        validator=build_gateway_locust_response_validator(validation),
+        codec=build_gateway_locust_json_codec()
+    )
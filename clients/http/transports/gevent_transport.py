@@ -0,0 +1,171 @@
+from typing import Callable, Iterator
+
+from gevent.lock import BoundedSemaphore
+from geventhttpclient import HTTPClient as GeventHTTPClient
+from geventhttpclient.response import HTTPSocketPoolResponse
+from httpx import (
+    BaseTransport,
+    ConnectError,
+    Limits,
+    PoolTimeout,
+    ReadTimeout,
+    RemoteProtocolError,
+    Request,
+    Response,
+    SyncByteStream,
+    TransportError
+)
+
+
+class GeventResponseStream(SyncByteStream):
+    """
+    Поток тела ответа geventhttpclient в формате httpx.
+
+    Тело читается блоками по мере итерации, соединение возвращается в пул в close().
+    """
+
+    def __init__(self, response: HTTPSocketPoolResponse, request: Request, release: Callable[[], None]):
+        """
+        :param response: Ответ geventhttpclient.
+        :param request: Запрос httpx (для исключений).
+        :param release: Освобождает место в лимите соединений транспорта.
+        """
+        self.response = response
+        self.request = request
+        self.release = release
+
+    def __iter__(self) -> Iterator[bytes]:
+        try:
+            yield from self.response
+        except TimeoutError as error:
+            raise ReadTimeout(str(error), request=self.request) from error
+        except OSError as error:
+            raise RemoteProtocolError(str(error), request=self.request) from error
+
+    def close(self) -> None:
+        try:
+            self.response.release()
+        finally:
+            self.release()
+
+
+class GeventHTTPTransport(BaseTransport):
+    """
+    Транспорт httpx поверх geventhttpclient (той же библиотеки, что использует FastHttpUser в Locust).
+
+    Разбор HTTP выполняется на C (http-parser), а сокеты — нативно gevent-овские, поэтому
+    запрос обходится заметно дешевле по CPU, чем через httpcore. httpx.Client поверх транспорта
+    остаётся прежним: event hooks, extensions, Response и высокоуровневые методы клиентов не меняются.
+
+    Лимит max_connections действует, как в httpx: на все хосты транспорта вместе, а запрос, не дождавшийся
+    свободного соединения за pool_timeout, падает с PoolTimeout.
+
+    Ограничения: только HTTP/1.1, нет событий трассировки httpcore (фаза connect не измеряется),
+    max_keepalive_connections и keepalive_expiry не применяются — простаивающие соединения
+    geventhttpclient держит открытыми, пока их не закроет сервер.
+    """
+
+    def __init__(
+            self,
+            limits: Limits = Limits(max_connections=10),
+            pool_timeout: float | None = None,
+            connection_timeout: float = 10,
+            network_timeout: float = 100
+    ):
+        """
+        :param limits: Лимиты пула; используется max_connections (None — без ограничения).
+        :param pool_timeout: Сколько секунд ждать свободное соединение (None — без ограничения).
+        :param connection_timeout: Таймаут установки соединения в секундах.
+        :param network_timeout: Таймаут чтения/записи в секундах.
+        """
+        self.max_connections = limits.max_connections
+        self.pool_timeout = pool_timeout
+        self.connection_timeout = connection_timeout
+        self.network_timeout = network_timeout
+        self.semaphore = BoundedSemaphore(limits.max_connections) if limits.max_connections else None
+        self.clients: dict[tuple[bytes, bytes, int | None], GeventHTTPClient] = {}
+
+    def get_client(self, request: Request) -> GeventHTTPClient:
+        scheme, host, port = request.url.raw_scheme, request.url.raw_host, request.url.port
+        key = (scheme, host, port)
+        client = self.clients.get(key)
+        if client is None:
+            client = self.clients[key] = GeventHTTPClient(
+                host.decode("ascii"),
+                port=port,
+                ssl=scheme == b"https",
+                # Общий лимит соединений держит semaphore, пул хоста не должен ограничивать сильнее
+                concurrency=self.max_connections or 1_000_000,
+                connection_timeout=self.connection_timeout,
+                network_timeout=self.network_timeout,
+                # Заголовки целиком формирует httpx, свои по умолчанию не добавляем
+                headers={}
+            )
+
+        return client
+
+    def acquire(self, request: Request) -> Callable[[], None]:
+        """
+        Занимает место в лимите соединений транспорта.
+
+        :return: Функция, освобождающая место (повторные вызовы ничего не делают).
+        :raises httpx.PoolTimeout: Если соединение не освободилось за pool_timeout.
+        """
+        semaphore = self.semaphore
+        if semaphore is None:
+            return lambda: None
+
+        if not semaphore.acquire(timeout=self.pool_timeout):
+            raise PoolTimeout(f"No free connection within {self.pool_timeout}s", request=request)
+
+        released = False
+
+        def release() -> None:
+            nonlocal released
+            if not released:
+                released = True
+                semaphore.release()
+
+        return release
+
+    @staticmethod
+    def send(client: GeventHTTPClient, request: Request, body: bytes) -> HTTPSocketPoolResponse:
+        """
+        Выполняет запрос через geventhttpclient, переводя его ошибки в исключения httpx.
+        """
+        try:
+            return client.request(
+                request.method,
+                request.url.raw_path.decode("ascii"),
+                body=body,
+                headers=request.headers.multi_items()
+            )
+        except TimeoutError as error:
+            raise ReadTimeout(str(error), request=request) from error
+        except ConnectionError as error:
+            raise ConnectError(str(error), request=request) from error
+        except OSError as error:
+            raise TransportError(str(error)) from error
+
+    def handle_request(self, request: Request) -> Response:
+        client = self.get_client(request)
+        body = request.read()
+
+        release = self.acquire(request)
+        try:
+            response = self.send(client, request, body)
+        except BaseException:
+            release()
+            raise
+
+        return Response(
+            status_code=response.status_code,
+            headers=list(response.headers),
+            stream=GeventResponseStream(response, request, release),
+            extensions={"http_version": b"HTTP/1.1", "reason_phrase": (response.status_message or "").encode()}
+        )
+
+    def close(self) -> None:
+        for client in self.clients.values():
+            client.close()
+        self.clients.clear()
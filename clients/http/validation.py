@@ -0,0 +1,180 @@
+import itertools
+import types
+import typing
+from functools import lru_cache
+from typing import Any, Callable, TypeVar
+
+from pydantic import BaseModel
+
+from clients.http.codecs import JSONCodec, build_json_codec
+from tools.config.http import ResponseValidation
+
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
+
+
+class StructuralView:
+    """
+    Представление разобранного JSON с интерфейсом Pydantic-модели (доступ к полям по атрибутам).
+
+    Значения не приводятся к типам схемы: даты, URL и enum остаются строками из JSON.
+    Вложенные модели оборачиваются в StructuralView только при обращении к полю,
+    поэтому стоимость ответа — это разбор JSON плюс обращения, которые реально делает сценарий.
+    """
+    __slots__ = ("schema", "data")
+
+    def __init__(self, schema: type[BaseModel], data: dict[str, Any] | None):
+        self.schema = schema
+        self.data = data
+
+    def __getattr__(self, name: str) -> Any:
+        accessor = get_structural_accessors(self.schema).get(name)
+        if accessor is None:
+            raise AttributeError(f"{self.schema.__name__} has no field {name!r}")
+
+        key, wrap = accessor
+        return wrap(self.data[key])
+
+    def __repr__(self) -> str:
+        return f"{self.schema.__name__}Structure({self.data!r})"
+
+
+class DeferredStructuralView(StructuralView):
+    """
+    StructuralView, который разбирает тело ответа только при первом обращении к полю.
+
+    Если сценарий не использует ответ, JSON не разбирается вовсе; если использует — поля
+    доступны так же, как у StructuralView, а ошибки разбора возникают в месте обращения.
+    """
+    __slots__ = ("validator", "content")
+
+    def __init__(self, schema: type[BaseModel], content: bytes, validator: "ResponseValidator"):
+        super().__init__(schema, None)
+        self.validator = validator
+        self.content = content
+
+    def __getattr__(self, name: str) -> Any:
+        if self.data is None:
+            self.data = self.validator.parse_structural(self.schema, self.content).data
+
+        return super().__getattr__(name)
+
+    def __repr__(self) -> str:
+        if self.data is None:
+            return f"{self.schema.__name__}Structure(<not parsed, {len(self.content)} bytes>)"
+
+        return super().__repr__()
+
+
+def build_structural_wrapper(annotation: Any) -> Callable[[Any], Any]:
+    """
+    Возвращает функцию, оборачивающую значение поля по его аннотации:
+    модели — в StructuralView, списки моделей — в списки StructuralView, остальное — как есть.
+    """
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return lambda value: value if value is None else StructuralView(annotation, value)
+
+    origin = typing.get_origin(annotation)
+    if origin is list:
+        (item,) = typing.get_args(annotation) or (Any,)
+        wrap = build_structural_wrapper(item)
+        return lambda value: value if value is None else [wrap(element) for element in value]
+    if origin in (typing.Union, types.UnionType):
+        # Optional[Model] и подобные: оборачиваем по первой модели в объединении
+        for argument in typing.get_args(annotation):
+            if argument is not type(None):
+                return build_structural_wrapper(argument)
+
+    return lambda value: value
+
+
+@lru_cache(maxsize=None)
+def get_structural_accessors(schema: type[BaseModel]) -> dict[str, tuple[str, Callable[[Any], Any]]]:
+    """
+    Таблица полей схемы: имя атрибута -> (ключ в JSON с учётом alias, обёртка значения).
+    Строится один раз на схему.
+    """
+    return {
+        name: (field.alias or name, build_structural_wrapper(field.annotation))
+        for name, field in schema.model_fields.items()
+    }
+
+
+@lru_cache(maxsize=None)
+def get_required_keys(schema: type[BaseModel]) -> tuple[str, ...]:
+    return tuple(field.alias or name for name, field in schema.model_fields.items() if field.is_required())
+
+
+class ResponseValidator:
+    """
+    Политика разбора ответов высокоуровневых методов HTTP API клиентов.
+
+    Тело всегда разбирается напрямую из байт `response.content`, без декодирования в str:
+    - full — полная валидация Pydantic-моделью (как раньше);
+    - sampled — полная валидация каждого sample_rate-го ответа, остальные — structural;
+    - structural — только разбор JSON и проверка обязательных полей верхнего уровня, результат — StructuralView;
+    - none — разбор откладывается до первого обращения к полю ответа (DeferredStructuralView):
+      сценарии, не использующие ответы, не платят за JSON, а использующие продолжают работать.
+    """
+
+    def __init__(
+            self,
+            validation: ResponseValidation = ResponseValidation.FULL,
+            sample_rate: int = 10,
+            codec: JSONCodec | None = None
+    ):
+        """
+        :param validation: Уровень валидации.
+        :param sample_rate: Для sampled — полностью валидируется 1 ответ из sample_rate.
+        :param codec: Кодек JSON для разбора ответов уровня structural.
+        """
+        self.validation = validation
+        self.codec = codec or build_json_codec()
+        self.sample_rate = max(sample_rate, 1)
+        self.counter = itertools.count()
+
+    def parse(self, schema: type[SchemaT], content: bytes) -> SchemaT | StructuralView:
+        """
+        Разбирает тело ответа согласно политике.
+
+        :param schema: Pydantic-схема ответа.
+        :param content: Тело ответа в байтах.
+        :return: Модель схемы или StructuralView (для none — ещё не разобранный).
+        :raises pydantic.ValidationError: Если ответ не прошёл полную валидацию.
+        :raises ValueError: Если ответ не JSON или в нём нет обязательных полей (structural).
+        """
+        match self.validation:
+            case ResponseValidation.NONE:
+                return DeferredStructuralView(schema, content, self)
+            case ResponseValidation.STRUCTURAL:
+                return self.parse_structural(schema, content)
+            case ResponseValidation.SAMPLED if next(self.counter) % self.sample_rate:
+                return self.parse_structural(schema, content)
+            case _:
+                return schema.model_validate_json(content)
+
+    def parse_structural(self, schema: type[SchemaT], content: bytes) -> StructuralView:
+        data = self.codec.loads(content)
+        if not isinstance(data, dict):
+            raise ValueError(f"{schema.__name__}: expected JSON object, got {type(data).__name__}")
+
+        missing = [key for key in get_required_keys(schema) if key not in data]
+        if missing:
+            raise ValueError(f"{schema.__name__}: missing required fields {missing}")
+
+        return StructuralView(schema, data)
+
+
+def build_response_validator(
+        validation: ResponseValidation = ResponseValidation.FULL,
+        sample_rate: int = 10,
+        codec: JSONCodec | None = None
+) -> ResponseValidator:
+    """
+    Фабричная функция для создания политики разбора ответов.
+
+    :param validation: Уровень валидации.
+    :param sample_rate: Частота полной валидации для уровня sampled.
+    :param codec: Кодек JSON для уровня structural.
+    :return: ResponseValidator.
+    """
+    return ResponseValidator(validation=validation, sample_rate=sample_rate, codec=codec)
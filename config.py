@@ -1,9 +1,17 @@
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 # Импортируем вложенные модели
+from tools.config.fakers import FakersConfig
 from tools.config.grpc import GRPCClientConfig
 from tools.config.http import HTTPClientConfig
+from tools.config.latency import LatencyConfig
 from tools.config.locust import LocustUserConfig
+from tools.config.results import ResultsConfig
+from tools.config.saturation import SaturationConfig
+from tools.config.seeds import SeedsConfig
+from tools.config.stand_in import StandInConfig
+from tools.config.unique import UniqueConfig
 
 
 class Settings(BaseSettings):
@@ -19,6 +27,13 @@ class Settings(BaseSettings):
     locust_user: LocustUserConfig  # Настройки виртуального пользователя
     gateway_http_client: HTTPClientConfig  # Настройки HTTP-клиента
     gateway_grpc_client: GRPCClientConfig  # Настройки gRPC-клиента
+    seeds: SeedsConfig = Field(default_factory=SeedsConfig)  # Настройки сидинга
+    fakers: FakersConfig = Field(default_factory=FakersConfig)  # Настройки генерации тестовых данных
+    unique: UniqueConfig = Field(default_factory=UniqueConfig)  # Настройки генератора уникальных ключей
+    latency: LatencyConfig = Field(default_factory=LatencyConfig)  # Настройки HDR-гистограмм времени ответа
+    saturation: SaturationConfig = Field(default_factory=SaturationConfig)  # Настройки контроля насыщения генератора нагрузки
+    results: ResultsConfig = Field(default_factory=ResultsConfig)  # Настройки базы результатов запусков
+    stand_in: StandInConfig = Field(default_factory=StandInConfig)  # Настройки stand-in серверов gateway
 
 
 # Глобальный объект настроек — его можно импортировать в любом месте проекта
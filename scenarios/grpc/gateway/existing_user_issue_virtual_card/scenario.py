@@ -4,18 +4,15 @@ from locust.env import Environment
 from clients.grpc.gateway.locust import GatewayGRPCTaskSet
 from seeds.scenarios.existing_user_issue_virtual_card import ExistingUserIssueVirtualCardSeedsScenario
 from seeds.schema.result import SeedUserResult
+from tools.locust.seeds import setup_seeds
 from tools.locust.user import LocustBaseUser
 
 
 # Хук инициализации — вызывается перед началом запуска нагрузки
+# В распределённом запуске сидинг выполняется только на мастере, а воркеры получают непересекающиеся шарды.
 @events.init.add_listener
 def init(environment: Environment, **kwargs):
-    # Выполняем сидинг
-    seeds_scenario = ExistingUserIssueVirtualCardSeedsScenario()
-    seeds_scenario.build()  # создаём пользователей, счета, карты и операции
-
-    # Загружаем результат сидинга (из файла JSON)
-    environment.seeds = seeds_scenario.load()
+    setup_seeds(environment, ExistingUserIssueVirtualCardSeedsScenario())
 
 
 # TaskSet — сценарий пользователя. Каждый виртуальный пользователь выполняет эти задачи
@@ -24,8 +21,13 @@ class IssueVirtualCardTaskSet(GatewayGRPCTaskSet):
 
     def on_start(self) -> None:
         super().on_start()
-        # Получаем случайного пользователя из подготовленного списка
-        self.seed_user = self.user.environment.seeds.get_random_user()
+        # Получаем пользователя сидинга через раздатчик (стратегия задаётся в SEEDS.DISPENSER)
+        self.seed_user = self.user.environment.seeds_dispenser.acquire(key=self.user)
+
+    def on_stop(self) -> None:
+        # Возвращаем пользователя сидинга (актуально для стратегии exclusive)
+        self.user.environment.seeds_dispenser.release(key=self.user)
+        super().on_stop()
 
 
     @task(4)
@@ -4,21 +4,17 @@ from locust.env import Environment
 from clients.http.gateway.locust import GatewayHTTPTaskSet
 from seeds.scenarios.existing_user_get_documents import ExistingUserGetDocumentsSeedsScenario
 from seeds.schema.result import SeedUserResult
+from tools.config.seeds import SeedsDispenserStrategy
+from tools.locust.seeds import setup_seeds
 from tools.locust.user import LocustBaseUser
 
 
 # Этот хук выполняется один раз при инициализации теста (до старта пользователей).
 # Мы используем его, чтобы заранее прогнать сидинг и загрузить пользователей в память.
+# В распределённом запуске сидинг выполняется только на мастере, а воркеры получают непересекающиеся шарды.
 @events.init.add_listener
 def init(environment: Environment, **kwargs):
-    # Создаем экземпляр сидинг-сценария
-    seeds_scenario = ExistingUserGetDocumentsSeedsScenario()
-
-    # Выполняем генерацию данных, если они ещё не созданы
-    seeds_scenario.build()
-
-    # Загружаем сгенерированных пользователей в окружение Locust
-    environment.seeds = seeds_scenario.load()
+    setup_seeds(environment, ExistingUserGetDocumentsSeedsScenario(), dispenser=SeedsDispenserStrategy.EXCLUSIVE)
 
 
 # Набор задач (TaskSet), который будет выполняться виртуальными пользователями.
@@ -30,8 +26,13 @@ class GetDocumentsTaskSet(GatewayHTTPTaskSet):
     def on_start(self) -> None:
         super().on_start()
 
-        # Получаем следующего пользователя из списка (по порядку!)
-        self.seed_user = self.user.environment.seeds.get_next_user()
+        # Получаем пользователя в эксклюзивное пользование: другие виртуальные пользователи его не получат
+        self.seed_user = self.user.environment.seeds_dispenser.acquire(key=self.user)
+
+    def on_stop(self) -> None:
+        # Возвращаем пользователя сидинга (актуально для стратегии exclusive)
+        self.user.environment.seeds_dispenser.release(key=self.user)
+        super().on_stop()
 
     @task(1)
     def get_accounts(self):
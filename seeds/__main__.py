@@ -0,0 +1,68 @@
+"""
+Асинхронный сидинг сценария отдельным процессом до запуска Locust.
+
+Все пользователи плана создаются конкурентно через grpc.aio (до SEEDS.CONCURRENCY одновременно),
+а результат сохраняется в тот же дамп, что и при сидинге из Locust: при SEEDS.CACHE=true
+сценарий Locust переиспользует его вместо повторного сидинга.
+
+Запуск: python -m seeds existing_user_get_operations [--force]
+        python -m seeds --list
+"""
+import argparse
+import asyncio
+import importlib
+import inspect
+import logging
+import pkgutil
+import sys
+
+import seeds.scenarios
+from seeds.async_builder import build_async_grpc_seeds_builder
+from seeds.scenario import SeedsScenario
+
+
+def get_seeds_scenarios() -> dict[str, type[SeedsScenario]]:
+    """
+    Сценарии сидинга из пакета seeds.scenarios: имя модуля -> класс сценария.
+    """
+    scenarios = {}
+    for module_info in pkgutil.iter_modules(seeds.scenarios.__path__):
+        module = importlib.import_module(f"{seeds.scenarios.__name__}.{module_info.name}")
+        for _, value in inspect.getmembers(module, inspect.isclass):
+            if issubclass(value, SeedsScenario) and not inspect.isabstract(value) and value.__module__ == module.__name__:
+                scenarios[module_info.name] = value
+
+    return scenarios
+
+
+async def build_seeds(scenario: SeedsScenario, force: bool) -> None:
+    # Билдер закрывает свои каналы по выходу из блока, в том числе при ошибке сидинга
+    async with build_async_grpc_seeds_builder() as builder:
+        await scenario.build_async(builder, force=force)
+
+
+def main():
+    scenarios = get_seeds_scenarios()
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("scenario", nargs="?", choices=sorted(scenarios), help="Сценарий сидинга")
+    parser.add_argument("--force", action="store_true", help="Выполнить сидинг, даже если есть актуальный дамп")
+    parser.add_argument("--list", action="store_true", help="Вывести доступные сценарии")
+    args = parser.parse_args()
+
+    if args.list:
+        print("\n".join(sorted(scenarios)))
+        return
+    if args.scenario is None:
+        parser.error("scenario is required")
+
+    # Вне Locust логи сидинга некому настроить: выводим их в том же формате, что и get_logger
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(name)s | %(levelname)s | %(message)s")
+    try:
+        asyncio.run(build_seeds(scenarios[args.scenario](), force=args.force))
+    except KeyboardInterrupt:
+        sys.exit("Seeding interrupted, it will resume from the checkpoint on the next run")
+
+
+if __name__ == "__main__":
+    main()
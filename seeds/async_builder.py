@@ -0,0 +1,264 @@
+import asyncio
+from typing import Callable
+
+from clients.grpc.gateway.accounts.async_client import (
+    build_accounts_gateway_async_grpc_client,
+    AsyncAccountsGatewayGRPCClient
+)
+from clients.grpc.gateway.cards.async_client import build_cards_gateway_async_grpc_client, AsyncCardsGatewayGRPCClient
+from clients.grpc.gateway.operations.async_client import (
+    build_operations_gateway_async_grpc_client,
+    AsyncOperationsGatewayGRPCClient
+)
+from clients.grpc.gateway.users.async_client import build_users_gateway_async_grpc_client, AsyncUsersGatewayGRPCClient
+from clients.http.gateway.accounts.async_client import AsyncAccountsGatewayHTTPClient
+from clients.http.gateway.cards.async_client import AsyncCardsGatewayHTTPClient
+from clients.http.gateway.operations.async_client import AsyncOperationsGatewayHTTPClient
+from clients.http.gateway.users.async_client import AsyncUsersGatewayHTTPClient
+from config import settings
+from seeds.schema.plan import (
+    SeedsPlan,
+    SeedUsersPlan,
+    SeedAccountsPlan,
+)
+from seeds.schema.result import (
+    SeedsResult,
+    SeedUserResult,
+    SeedCardResult,
+    SeedAccountResult,
+    SeedOperationResult
+)
+
+
+class AsyncSeedsBuilder:
+    """
+    AsyncSeedsBuilder — асинхронный аналог SeedsBuilder.
+
+    Все пользователи плана запускаются одновременно через asyncio.gather,
+    а семафор ограничивает количество пользователей, создаваемых параллельно.
+    Цепочка user -> account -> cards -> operations внутри пользователя остаётся последовательной.
+
+    Модуль не импортирует locust и seeds.builder: asyncio несовместим с gevent monkey patching,
+    поэтому асинхронный сидинг запускается отдельным процессом до старта Locust (python -m seeds).
+
+    Билдер владеет каналами и HTTP-клиентами своих API-клиентов: используйте его как
+    асинхронный контекстный менеджер (async with), чтобы соединения закрывались по завершении.
+
+    Attributes:
+        users_gateway_client: Асинхронный клиент для работы с пользователями (HTTP или gRPC)
+        cards_gateway_client: Асинхронный клиент для выпуска карт
+        accounts_gateway_client: Асинхронный клиент для открытия счетов
+        operations_gateway_client: Асинхронный клиент для операций
+        concurrency: Сколько пользователей создаётся одновременно
+    """
+
+    def __init__(
+            self,
+            users_gateway_client: AsyncUsersGatewayGRPCClient | AsyncUsersGatewayHTTPClient,
+            cards_gateway_client: AsyncCardsGatewayGRPCClient | AsyncCardsGatewayHTTPClient,
+            accounts_gateway_client: AsyncAccountsGatewayGRPCClient | AsyncAccountsGatewayHTTPClient,
+            operations_gateway_client: AsyncOperationsGatewayGRPCClient | AsyncOperationsGatewayHTTPClient,
+            concurrency: int = 1
+    ):
+        self.users_gateway_client = users_gateway_client
+        self.cards_gateway_client = cards_gateway_client
+        self.accounts_gateway_client = accounts_gateway_client
+        self.operations_gateway_client = operations_gateway_client
+        self.concurrency = concurrency
+
+    async def __aenter__(self) -> "AsyncSeedsBuilder":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Закрывает соединения всех API-клиентов билдера.
+        """
+        await asyncio.gather(
+            self.users_gateway_client.close(),
+            self.cards_gateway_client.close(),
+            self.accounts_gateway_client.close(),
+            self.operations_gateway_client.close()
+        )
+
+    async def build_physical_card_result(self, user_id: str, account_id: str) -> SeedCardResult:
+        response = await self.cards_gateway_client.issue_physical_card(user_id=user_id, account_id=account_id)
+        return SeedCardResult(card_id=response.card.id)
+
+    async def build_virtual_card_result(self, user_id: str, account_id: str) -> SeedCardResult:
+        response = await self.cards_gateway_client.issue_virtual_card(user_id=user_id, account_id=account_id)
+        return SeedCardResult(card_id=response.card.id)
+
+    async def build_top_up_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+        response = await self.operations_gateway_client.make_top_up_operation(card_id=card_id, account_id=account_id)
+        return SeedOperationResult(operation_id=response.operation.id)
+
+    async def build_purchase_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+        response = await self.operations_gateway_client.make_purchase_operation(
+            card_id=card_id,
+            account_id=account_id
+        )
+        return SeedOperationResult(operation_id=response.operation.id)
+
+    async def build_transfer_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+        response = await self.operations_gateway_client.make_transfer_operation(
+            card_id=card_id,
+            account_id=account_id
+        )
+        return SeedOperationResult(operation_id=response.operation.id)
+
+    async def build_cash_withdrawal_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+        response = await self.operations_gateway_client.make_cash_withdrawal_operation(
+            card_id=card_id,
+            account_id=account_id
+        )
+        return SeedOperationResult(operation_id=response.operation.id)
+
+    async def build_savings_account_result(self, user_id: str) -> SeedAccountResult:
+        response = await self.accounts_gateway_client.open_savings_account(user_id=user_id)
+        return SeedAccountResult(account_id=response.account.id)
+
+    async def build_deposit_account_result(self, user_id: str) -> SeedAccountResult:
+        response = await self.accounts_gateway_client.open_deposit_account(user_id=user_id)
+        return SeedAccountResult(account_id=response.account.id)
+
+    async def build_card_account_result(self, response, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
+        """
+        Выпускает карты и выполняет операции по уже открытому карточному (дебетовому или кредитному) счёту.
+
+        Args:
+            response: Ответ на открытие счёта (содержит ID счёта и его первой карты)
+            plan: План создания карточного счёта
+            user_id: Идентификатор пользователя
+
+        Returns:
+            SeedAccountResult: Результат с ID счёта, картами и операциями
+        """
+        card_id = response.account.cards[0].id
+        account_id = response.account.id
+
+        return SeedAccountResult(
+            account_id=account_id,
+            physical_cards=[
+                await self.build_physical_card_result(user_id=user_id, account_id=account_id)
+                for _ in range(plan.physical_cards.count)
+            ],
+            virtual_cards=[
+                await self.build_virtual_card_result(user_id=user_id, account_id=account_id)
+                for _ in range(plan.virtual_cards.count)
+            ],
+            top_up_operations=[
+                await self.build_top_up_operation_result(card_id=card_id, account_id=account_id)
+                for _ in range(plan.top_up_operations.count)
+            ],
+            purchase_operations=[
+                await self.build_purchase_operation_result(card_id=card_id, account_id=account_id)
+                for _ in range(plan.purchase_operations.count)
+            ],
+            transfer_operations=[
+                await self.build_transfer_operation_result(card_id=card_id, account_id=account_id)
+                for _ in range(plan.transfer_operations.count)
+            ],
+            cash_withdrawal_operations=[
+                await self.build_cash_withdrawal_operation_result(card_id=card_id, account_id=account_id)
+                for _ in range(plan.cash_withdrawal_operations.count)
+            ]
+        )
+
+    async def build_debit_card_account_result(self, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
+        response = await self.accounts_gateway_client.open_debit_card_account(user_id=user_id)
+        return await self.build_card_account_result(response=response, plan=plan, user_id=user_id)
+
+    async def build_credit_card_account_result(self, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
+        response = await self.accounts_gateway_client.open_credit_card_account(user_id=user_id)
+        return await self.build_card_account_result(response=response, plan=plan, user_id=user_id)
+
+    async def build_user(self, plan: SeedUsersPlan) -> SeedUserResult:
+        """
+        Создаёт пользователя и все его счета, карты и операции согласно плану.
+
+        Args:
+            plan: План генерации пользователя
+
+        Returns:
+            SeedUserResult: Результат с ID пользователя и всеми созданными сущностями
+        """
+        response = await self.users_gateway_client.create_user()
+        user_id = response.user.id
+
+        return SeedUserResult(
+            user_id=user_id,
+            savings_accounts=[
+                await self.build_savings_account_result(user_id=user_id)
+                for _ in range(plan.savings_accounts.count)
+            ],
+            deposit_accounts=[
+                await self.build_deposit_account_result(user_id=user_id)
+                for _ in range(plan.deposit_accounts.count)
+            ],
+            debit_card_accounts=[
+                await self.build_debit_card_account_result(plan=plan.debit_card_accounts, user_id=user_id)
+                for _ in range(plan.debit_card_accounts.count)
+            ],
+            credit_card_accounts=[
+                await self.build_credit_card_account_result(plan=plan.credit_card_accounts, user_id=user_id)
+                for _ in range(plan.credit_card_accounts.count)
+            ]
+        )
+
+    async def build(
+            self,
+            plan: SeedsPlan,
+            completed: list[SeedUserResult] | None = None,
+            on_user_built: Callable[[SeedUserResult], None] | None = None
+    ) -> SeedsResult:
+        """
+        Генерирует полную структуру данных на основе плана.
+
+        Все пользователи запускаются через asyncio.gather, семафор ограничивает
+        число одновременно создаваемых пользователей значением concurrency.
+
+        Args:
+            plan: Полный план генерации данных
+            completed: Пользователи, уже созданные в предыдущем (прерванном) запуске
+            on_user_built: Колбэк, вызываемый сразу после создания каждого нового пользователя
+
+        Returns:
+            SeedsResult: Результат с данными всех созданных пользователей
+        """
+        users = list(completed or [])[:plan.users.count]
+        semaphore = asyncio.Semaphore(max(self.concurrency, 1))
+
+        async def build_user_limited() -> SeedUserResult:
+            async with semaphore:
+                user = await self.build_user(plan=plan.users)
+
+            if on_user_built:
+                on_user_built(user)
+            return user
+
+        users.extend(await asyncio.gather(*[
+            build_user_limited() for _ in range(plan.users.count - len(users))
+        ]))
+        return SeedsResult(users=users)
+
+
+def build_async_grpc_seeds_builder() -> AsyncSeedsBuilder:
+    """
+    Фабрика для создания асинхронного сидера с использованием grpc.aio-клиентов.
+
+    Используется в python -m seeds; билдер нужно закрыть (async with или close()).
+
+    Returns:
+        AsyncSeedsBuilder: Инициализированный сидер с асинхронными gRPC-клиентами
+    """
+    return AsyncSeedsBuilder(
+        users_gateway_client=build_users_gateway_async_grpc_client(),
+        cards_gateway_client=build_cards_gateway_async_grpc_client(),
+        accounts_gateway_client=build_accounts_gateway_async_grpc_client(),
+        operations_gateway_client=build_operations_gateway_async_grpc_client(),
+        concurrency=settings.seeds.concurrency
+    )
+
@@ -1,3 +1,7 @@
+from typing import Callable
+
+from gevent.pool import Pool
+
 from clients.grpc.gateway.accounts.client import build_accounts_gateway_grpc_client, AccountsGatewayGRPCClient
 from clients.grpc.gateway.cards.client import build_cards_gateway_grpc_client, CardsGatewayGRPCClient
 from clients.grpc.gateway.operations.client import build_operations_gateway_grpc_client, OperationsGatewayGRPCClient
@@ -6,6 +10,7 @@ from clients.http.gateway.accounts.client import build_accounts_gateway_http_cli
 from clients.http.gateway.cards.client import build_cards_gateway_http_client, CardsGatewayHTTPClient
 from clients.http.gateway.operations.client import build_operations_gateway_http_client, OperationsGatewayHTTPClient
 from clients.http.gateway.users.client import build_users_gateway_http_client, UsersGatewayHTTPClient
+from config import settings
 from seeds.schema.plan import (
     SeedsPlan,
     SeedUsersPlan,
@@ -30,6 +35,7 @@ class SeedsBuilder:
         cards_gateway_client: Клиент для выпуска карт
         accounts_gateway_client: Клиент для открытия счетов
         operations_gateway_client: Клиент для операций (топ-ап, покупки и т.д.)
+        concurrency: Сколько пользователей создаётся одновременно (1 — последовательный режим)
     """
 
     def __init__(
@@ -37,12 +43,14 @@ class SeedsBuilder:
             users_gateway_client: UsersGatewayGRPCClient | UsersGatewayHTTPClient,
             cards_gateway_client: CardsGatewayGRPCClient | CardsGatewayHTTPClient,
             accounts_gateway_client: AccountsGatewayGRPCClient | AccountsGatewayHTTPClient,
-            operations_gateway_client: OperationsGatewayGRPCClient | OperationsGatewayHTTPClient
+            operations_gateway_client: OperationsGatewayGRPCClient | OperationsGatewayHTTPClient,
+            concurrency: int = 1
     ):
         self.users_gateway_client = users_gateway_client
         self.cards_gateway_client = cards_gateway_client
         self.accounts_gateway_client = accounts_gateway_client
         self.operations_gateway_client = operations_gateway_client
+        self.concurrency = concurrency
 
     def build_physical_card_result(self, user_id: str, account_id: str) -> SeedCardResult:
         """
@@ -304,19 +312,48 @@ class SeedsBuilder:
             ]
         )
 
-    def build(self, plan: SeedsPlan) -> SeedsResult:
+    def build(
+            self,
+            plan: SeedsPlan,
+            completed: list[SeedUserResult] | None = None,
+            on_user_built: Callable[[SeedUserResult], None] | None = None
+    ) -> SeedsResult:
         """
         Генерирует полную структуру данных на основе плана:
         - создаёт указанное количество пользователей
         - каждому пользователю присваиваются счета, карты и операции
 
+        Пользователи создаются параллельно в пуле greenlet'ов размером concurrency.
+        Locust (и gRPC через init_gevent) уже работает поверх gevent, поэтому пул
+        не блокирует процесс, а клиенты безопасно разделяются между greenlet'ами.
+        Цепочка user -> account -> cards -> operations внутри одного пользователя
+        по-прежнему выполняется строго по порядку.
+
         Args:
             plan: Полный план генерации данных
+            completed: Пользователи, уже созданные в предыдущем (прерванном) запуске.
+                       Они входят в результат, а создаются только недостающие.
+            on_user_built: Колбэк, вызываемый сразу после создания каждого нового пользователя
+                           (например, для записи чекпоинта). Всегда вызывается из одного greenlet'а.
 
         Returns:
             SeedsResult: Результат с данными всех созданных пользователей
         """
-        return SeedsResult(users=[self.build_user(plan=plan.users) for _ in range(plan.users.count)])
+        users = list(completed or [])[:plan.users.count]
+        remaining = plan.users.count - len(users)
+
+        if self.concurrency <= 1:
+            built_users = (self.build_user(plan=plan.users) for _ in range(remaining))
+        else:
+            pool = Pool(size=self.concurrency)
+            built_users = pool.imap_unordered(lambda _: self.build_user(plan=plan.users), range(remaining))
+
+        for user in built_users:
+            if on_user_built:
+                on_user_built(user)
+            users.append(user)
+
+        return SeedsResult(users=users)
 
 
 def build_grpc_seeds_builder() -> SeedsBuilder:
@@ -330,7 +367,8 @@ def build_grpc_seeds_builder() -> SeedsBuilder:
         users_gateway_client=build_users_gateway_grpc_client(),
         cards_gateway_client=build_cards_gateway_grpc_client(),
         accounts_gateway_client=build_accounts_gateway_grpc_client(),
-        operations_gateway_client=build_operations_gateway_grpc_client()
+        operations_gateway_client=build_operations_gateway_grpc_client(),
+        concurrency=settings.seeds.concurrency
     )
 
 
@@ -345,5 +383,6 @@ def build_http_seeds_builder():
         users_gateway_client=build_users_gateway_http_client(),
         cards_gateway_client=build_cards_gateway_http_client(),
         accounts_gateway_client=build_accounts_gateway_http_client(),
-        operations_gateway_client=build_operations_gateway_http_client()
+        operations_gateway_client=build_operations_gateway_http_client(),
+        concurrency=settings.seeds.concurrency
     )
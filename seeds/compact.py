@@ -0,0 +1,269 @@
+import random
+import sys
+from array import array
+from typing import Any, Iterable
+
+from seeds.schema.result import SeedsResult, SeedUserResult
+
+# Порядок групп счетов у пользователя и групп карт/операций у счёта.
+# По нему строятся таблицы смещений: у пользователя i группа k занимает
+# диапазон offsets[i * len(KINDS) + k] .. offsets[i * len(KINDS) + k + 1].
+ACCOUNT_KINDS = ("deposit_accounts", "savings_accounts", "debit_card_accounts", "credit_card_accounts")
+CARD_KINDS = ("physical_cards", "virtual_cards")
+OPERATION_KINDS = (
+    "top_up_operations",
+    "purchase_operations",
+    "transfer_operations",
+    "cash_withdrawal_operations",
+)
+
+
+class CompactCardView:
+    """
+    Лёгкое представление карты из CompactSeedsResult (аналог SeedCardResult).
+    """
+    __slots__ = ("card_id",)
+
+    def __init__(self, card_id: str):
+        self.card_id = card_id
+
+
+class CompactOperationView:
+    """
+    Лёгкое представление операции из CompactSeedsResult (аналог SeedOperationResult).
+    """
+    __slots__ = ("operation_id",)
+
+    def __init__(self, operation_id: str):
+        self.operation_id = operation_id
+
+
+class CompactAccountView:
+    """
+    Представление счёта поверх плоских массивов CompactSeedsResult (аналог SeedAccountResult).
+
+    Хранит только ссылку на результат и номер счёта; списки карт и операций
+    собираются из таблиц смещений при обращении.
+    """
+    __slots__ = ("result", "index")
+
+    def __init__(self, result: "CompactSeedsResult", index: int):
+        self.result = result
+        self.index = index
+
+    @property
+    def account_id(self) -> str:
+        return self.result.account_ids[self.index]
+
+    def _cards(self, kind: int) -> list[CompactCardView]:
+        position = self.index * len(CARD_KINDS) + kind
+        offsets, card_ids = self.result.card_offsets, self.result.card_ids
+        return [CompactCardView(card_ids[i]) for i in range(offsets[position], offsets[position + 1])]
+
+    def _operations(self, kind: int) -> list[CompactOperationView]:
+        position = self.index * len(OPERATION_KINDS) + kind
+        offsets, operation_ids = self.result.operation_offsets, self.result.operation_ids
+        return [CompactOperationView(operation_ids[i]) for i in range(offsets[position], offsets[position + 1])]
+
+    @property
+    def physical_cards(self) -> list[CompactCardView]:
+        return self._cards(0)
+
+    @property
+    def virtual_cards(self) -> list[CompactCardView]:
+        return self._cards(1)
+
+    @property
+    def top_up_operations(self) -> list[CompactOperationView]:
+        return self._operations(0)
+
+    @property
+    def purchase_operations(self) -> list[CompactOperationView]:
+        return self._operations(1)
+
+    @property
+    def transfer_operations(self) -> list[CompactOperationView]:
+        return self._operations(2)
+
+    @property
+    def cash_withdrawal_operations(self) -> list[CompactOperationView]:
+        return self._operations(3)
+
+
+class CompactUserView:
+    """
+    Представление пользователя поверх плоских массивов CompactSeedsResult (аналог SeedUserResult).
+
+    Виртуальный пользователь Locust держит ссылку только на этот объект из двух слотов,
+    а не на собственное дерево Pydantic-моделей.
+    """
+    __slots__ = ("result", "index")
+
+    def __init__(self, result: "CompactSeedsResult", index: int):
+        self.result = result
+        self.index = index
+
+    @property
+    def user_id(self) -> str:
+        return self.result.user_ids[self.index]
+
+    def _accounts(self, kind: int) -> list[CompactAccountView]:
+        position = self.index * len(ACCOUNT_KINDS) + kind
+        offsets = self.result.account_offsets
+        return [CompactAccountView(self.result, i) for i in range(offsets[position], offsets[position + 1])]
+
+    @property
+    def deposit_accounts(self) -> list[CompactAccountView]:
+        return self._accounts(0)
+
+    @property
+    def savings_accounts(self) -> list[CompactAccountView]:
+        return self._accounts(1)
+
+    @property
+    def debit_card_accounts(self) -> list[CompactAccountView]:
+        return self._accounts(2)
+
+    @property
+    def credit_card_accounts(self) -> list[CompactAccountView]:
+        return self._accounts(3)
+
+    def to_model(self) -> SeedUserResult:
+        """
+        Собирает полноценную модель SeedUserResult (например, для сохранения или отладки).
+        """
+        return SeedUserResult(
+            user_id=self.user_id,
+            **{
+                kind: [
+                    {
+                        "account_id": account.account_id,
+                        **{card_kind: [{"card_id": card.card_id} for card in account._cards(k)]
+                           for k, card_kind in enumerate(CARD_KINDS)},
+                        **{operation_kind: [{"operation_id": operation.operation_id}
+                                            for operation in account._operations(k)]
+                           for k, operation_kind in enumerate(OPERATION_KINDS)},
+                    }
+                    for account in self._accounts(index)
+                ]
+                for index, kind in enumerate(ACCOUNT_KINDS)
+            }
+        )
+
+
+class CompactUsers:
+    """
+    Последовательность CompactUserView с интерфейсом списка (len, индексация, итерация).
+    """
+    __slots__ = ("result",)
+
+    def __init__(self, result: "CompactSeedsResult"):
+        self.result = result
+
+    def __len__(self) -> int:
+        return len(self.result.user_ids)
+
+    def __getitem__(self, index: int) -> CompactUserView:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("seed user index out of range")
+        return CompactUserView(self.result, index)
+
+    def __iter__(self):
+        return (CompactUserView(self.result, index) for index in range(len(self)))
+
+
+class CompactSeedsResult:
+    """
+    Компактное представление результата сидинга.
+
+    Вместо дерева Pydantic-объектов идентификаторы хранятся в плоских списках интернированных
+    строк, а вложенность (пользователь -> счета -> карты/операции) описывается таблицами
+    смещений в array('I'). Объекты-представления с __slots__ создаются только при обращении,
+    поэтому интерфейс (users, credit_card_accounts[0].account_id, get_random_user)
+    остаётся прежним, а память на одного пользователя сокращается в разы.
+    """
+
+    def __init__(self):
+        self.user_ids: list[str] = []
+        self.account_ids: list[str] = []
+        self.card_ids: list[str] = []
+        self.operation_ids: list[str] = []
+        self.account_offsets = array('I', [0])
+        self.card_offsets = array('I', [0])
+        self.operation_offsets = array('I', [0])
+        self.users = CompactUsers(self)
+        self.next_index = 0
+
+    def append_user(self, user: dict[str, Any]):
+        """
+        Добавляет пользователя в сыром виде (словарь из JSON-дампа или model_dump()).
+
+        :param user: Данные пользователя в формате SeedUserResult.
+        """
+        self.user_ids.append(sys.intern(user["user_id"]))
+        for kind in ACCOUNT_KINDS:
+            for account in user.get(kind) or ():
+                self.account_ids.append(sys.intern(account["account_id"]))
+                for card_kind in CARD_KINDS:
+                    self.card_ids.extend(sys.intern(card["card_id"]) for card in account.get(card_kind) or ())
+                    self.card_offsets.append(len(self.card_ids))
+                for operation_kind in OPERATION_KINDS:
+                    self.operation_ids.extend(
+                        sys.intern(operation["operation_id"]) for operation in account.get(operation_kind) or ()
+                    )
+                    self.operation_offsets.append(len(self.operation_ids))
+            self.account_offsets.append(len(self.account_ids))
+
+    @classmethod
+    def from_dicts(cls, users: Iterable[dict[str, Any]]) -> "CompactSeedsResult":
+        """
+        Строит компактный результат напрямую из разобранного JSON, минуя валидацию Pydantic.
+
+        :param users: Итерируемый набор пользователей в формате SeedUserResult.
+        :return: Заполненный CompactSeedsResult.
+        """
+        result = cls()
+        for user in users:
+            result.append_user(user)
+        return result
+
+    @classmethod
+    def from_result(cls, result: SeedsResult) -> "CompactSeedsResult":
+        """
+        Конвертирует обычный SeedsResult в компактное представление.
+
+        :param result: Результат сидинга из билдера.
+        :return: CompactSeedsResult с теми же данными.
+        """
+        return cls.from_dicts(user.model_dump() for user in result.users)
+
+    def to_result(self) -> SeedsResult:
+        """
+        Собирает обратно полноценный SeedsResult.
+        """
+        return SeedsResult(users=[user.to_model() for user in self.users])
+
+    def get_next_user(self) -> CompactUserView:
+        """
+        Возвращает следующего ещё не выданного пользователя.
+
+        Returns:
+            CompactUserView: Следующий пользователь.
+        """
+        if self.next_index >= len(self.users):
+            raise IndexError("no more seed users")
+
+        user = self.users[self.next_index]
+        self.next_index += 1
+        return user
+
+    def get_random_user(self) -> CompactUserView:
+        """
+        Возвращает случайного пользователя без удаления.
+
+        Returns:
+            CompactUserView: Случайный пользователь.
+        """
+        return self.users[random.randrange(len(self.users))]
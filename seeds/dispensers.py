@@ -0,0 +1,241 @@
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, Hashable, Protocol, Sequence
+
+from logger import get_logger
+from tools.config.seeds import SeedsDispenserStrategy
+
+logger = get_logger("SEEDS_DISPENSER")
+
+
+class SeedUsersExhaustedError(Exception):
+    """
+    Свободных пользователей сидинга не осталось: все выданы в эксклюзивное пользование
+    (или пройдены все пользователи при последовательной выдаче).
+    """
+
+
+class SeedsSource(Protocol):
+    """
+    Любой результат сидинга с последовательностью пользователей:
+    SeedsResult, LazySeedsResult или CompactSeedsResult.
+    """
+    users: Sequence[Any]
+
+
+class SeedsDispenser(ABC):
+    """
+    Базовый раздатчик пользователей сидинга виртуальным пользователям Locust.
+
+    Раздатчик работает с номерами пользователей, а не с объектами, поэтому подходит
+    для любого представления результата сидинга. Все операции — O(1) и защищены
+    блокировкой (под gevent-monkey-patching она становится кооперативной).
+
+    Ключ (key) — это идентичность потребителя, обычно объект виртуального пользователя.
+    Он нужен стратегиям, которые помнят, кому что выдано (exclusive, sticky).
+    """
+
+    def __init__(self, source: SeedsSource):
+        self.source = source
+        self.lock = threading.Lock()
+        # Сколько раз раздатчику не хватило пользователей
+        self.exhausted = 0
+
+    @property
+    def size(self) -> int:
+        return len(self.source.users)
+
+    def acquire(self, key: Hashable | None = None) -> Any:
+        """
+        Выдаёт пользователя сидинга потребителю.
+
+        :param key: Идентичность потребителя (например, объект Locust User).
+        :return: Пользователь сидинга.
+        :raises SeedUsersExhaustedError: Если свободных пользователей нет.
+        """
+        if self.size == 0:
+            self.report_exhausted()
+
+        return self.source.users[self.acquire_index(key)]
+
+    def release(self, key: Hashable | None = None) -> None:
+        """
+        Возвращает пользователя, выданного потребителю key. По умолчанию ничего не делает.
+
+        :param key: Идентичность потребителя, переданная в acquire.
+        """
+
+    @abstractmethod
+    def acquire_index(self, key: Hashable | None) -> int:
+        ...
+
+    def report_exhausted(self):
+        self.exhausted += 1
+        logger.warning(f"{type(self).__name__}: no free seed users left (size={self.size}, misses={self.exhausted})")
+        raise SeedUsersExhaustedError(f"All {self.size} seed users are in use")
+
+
+class RandomSeedsDispenser(SeedsDispenser):
+    """
+    Случайный пользователь при каждом запросе (прежнее поведение get_random_user).
+    """
+
+    def acquire_index(self, key: Hashable | None) -> int:
+        return random.randrange(self.size)
+
+
+class RoundRobinSeedsDispenser(SeedsDispenser):
+    """
+    Пользователи выдаются по кругу: нагрузка равномерно распределяется по всем данным.
+    """
+
+    def __init__(self, source: SeedsSource):
+        super().__init__(source)
+        self.cursor = 0
+
+    def acquire_index(self, key: Hashable | None) -> int:
+        with self.lock:
+            index = self.cursor
+            self.cursor = (self.cursor + 1) % self.size
+            return index
+
+
+class ExclusiveSeedsDispenser(SeedsDispenser):
+    """
+    Эксклюзивная выдача: пользователь принадлежит одному потребителю, пока тот его не вернёт.
+
+    Исключает одновременную работу двух виртуальных пользователей с одними и теми же счетами
+    (и, как следствие, конкуренцию за строки на стороне бэкенда). Свободные номера хранятся
+    в deque, выданные — в словаре по ключу потребителя.
+    """
+
+    def __init__(self, source: SeedsSource, timeout: float = 0):
+        """
+        :param source: Результат сидинга.
+        :param timeout: Сколько секунд ждать возврата пользователя, если свободных нет (0 — не ждать).
+        """
+        super().__init__(source)
+        self.timeout = timeout
+        self.free = deque(range(self.size))
+        self.checked_out: dict[Hashable, int] = {}
+        self.condition = threading.Condition(self.lock)
+
+    def acquire_index(self, key: Hashable | None) -> int:
+        with self.condition:
+            if key is not None and key in self.checked_out:
+                return self.checked_out[key]
+
+            deadline = time.monotonic() + self.timeout
+            while not self.free:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self.condition.wait(remaining):
+                    if not self.free:
+                        self.report_exhausted()
+
+            index = self.free.popleft()
+            if key is not None:
+                self.checked_out[key] = index
+            return index
+
+    def release(self, key: Hashable | None = None) -> None:
+        with self.condition:
+            index = self.checked_out.pop(key, None)
+            if index is not None:
+                self.free.append(index)
+                self.condition.notify()
+
+
+class WeightedSeedsDispenser(SeedsDispenser):
+    """
+    Взвешенный случайный выбор: часть пользователей «горячая», как в реальном трафике.
+
+    Веса задаются по номеру пользователя законом Ципфа (1 / (i + 1) ** skew), выбор
+    выполняется alias-методом Уокера за O(1) после O(n) подготовки таблиц.
+    """
+
+    def __init__(self, source: SeedsSource, skew: float = 1.0):
+        """
+        :param source: Результат сидинга.
+        :param skew: Показатель распределения Ципфа (0 — равномерно, больше — сильнее перекос).
+        """
+        super().__init__(source)
+        weights = [1 / (index + 1) ** skew for index in range(self.size)]
+        self.probabilities, self.aliases = self.build_alias_table(weights)
+
+    @staticmethod
+    def build_alias_table(weights: list[float]) -> tuple[list[float], list[int]]:
+        count = len(weights)
+        total = sum(weights)
+        scaled = [weight * count / total for weight in weights]
+        probabilities, aliases = [1.0] * count, list(range(count))
+
+        small = [index for index, weight in enumerate(scaled) if weight < 1]
+        large = [index for index, weight in enumerate(scaled) if weight >= 1]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            probabilities[less], aliases[less] = scaled[less], more
+            scaled[more] -= 1 - scaled[less]
+            (small if scaled[more] < 1 else large).append(more)
+
+        return probabilities, aliases
+
+    def acquire_index(self, key: Hashable | None) -> int:
+        index = random.randrange(self.size)
+        return index if random.random() < self.probabilities[index] else self.aliases[index]
+
+
+class StickySeedsDispenser(RoundRobinSeedsDispenser):
+    """
+    Каждый потребитель закрепляется за одним пользователем на всё время жизни.
+
+    Первый запрос назначает пользователя по кругу, повторные возвращают его же —
+    удобно, когда TaskSet перезапускается, а данные виртуального пользователя должны сохраняться.
+    """
+
+    def __init__(self, source: SeedsSource):
+        super().__init__(source)
+        self.assigned: dict[Hashable, int] = {}
+
+    def acquire_index(self, key: Hashable | None) -> int:
+        if key is None:
+            return super().acquire_index(key)
+
+        index = self.assigned.get(key)
+        if index is None:
+            index = self.assigned[key] = super().acquire_index(key)
+        return index
+
+    def release(self, key: Hashable | None = None) -> None:
+        # Закрепление сохраняется: при повторном acquire потребитель получит того же пользователя
+        pass
+
+
+def build_seeds_dispenser(
+        source: SeedsSource,
+        strategy: SeedsDispenserStrategy = SeedsDispenserStrategy.RANDOM,
+        timeout: float = 0,
+        skew: float = 1.0
+) -> SeedsDispenser:
+    """
+    Создаёт раздатчик пользователей сидинга по выбранной стратегии.
+
+    :param source: Результат сидинга.
+    :param strategy: Стратегия раздачи.
+    :param timeout: Время ожидания свободного пользователя для стратегии exclusive.
+    :param skew: Перекос распределения для стратегии weighted.
+    :return: Готовый SeedsDispenser.
+    """
+    match strategy:
+        case SeedsDispenserStrategy.ROUND_ROBIN:
+            return RoundRobinSeedsDispenser(source)
+        case SeedsDispenserStrategy.EXCLUSIVE:
+            return ExclusiveSeedsDispenser(source, timeout=timeout)
+        case SeedsDispenserStrategy.WEIGHTED:
+            return WeightedSeedsDispenser(source, skew=skew)
+        case SeedsDispenserStrategy.STICKY:
+            return StickySeedsDispenser(source)
+        case _:
+            return RandomSeedsDispenser(source)
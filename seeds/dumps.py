@@ -1,7 +1,14 @@
+import json
+import mmap
 import os
+from array import array
 
+from config import settings
 from logger import get_logger
-from seeds.schema.result import SeedsResult
+from seeds.compact import CompactSeedsResult
+from seeds.lazy import LazySeedsResult, LazySeedUsers
+from seeds.schema.metadata import SeedsMetadata
+from seeds.schema.result import SeedsResult, SeedUserResult
 
 
 logger = get_logger("SEEDS_DUMPS")
@@ -15,13 +22,12 @@ def save_seeds_result(result: SeedsResult, scenario: str):
     :param scenario: Название сценария нагрузки, для которого создаются данные.
                      Используется для генерации имени файла (например, "credit_card_test").
     """
-    seeds_file = f"./dumps/{scenario}_seeds.json"
-    # Убедимся, что папка dumps существует
-    if not os.path.exists("dumps"):
-        os.mkdir("dumps")
+    seeds_file = f"{settings.seeds.dumps_dir}/{scenario}_seeds.json"
+    # Убедимся, что папка дампов (SEEDS.DUMPS_DIR) существует
+    os.makedirs(settings.seeds.dumps_dir, exist_ok=True)
 
     # Сохраняем результат сидинга в файл с именем {scenario}_seeds.json
-    with open(f"./dumps/{scenario}_seeds.json", 'w+', encoding="utf-8") as file:
+    with open(f"{settings.seeds.dumps_dir}/{scenario}_seeds.json", 'w+', encoding="utf-8") as file:
         file.write(result.model_dump_json())
     logger.debug(f"Seeding result saved to file: {seeds_file}")
 
@@ -33,8 +39,231 @@ def load_seeds_result(scenario: str) -> SeedsResult:
     :param scenario: Название сценария нагрузки, данные которого нужно загрузить.
     :return: Объект SeedsResult, восстановленный из файла.
     """
-    seeds_file = f"./dumps/{scenario}_seeds.json"
+    seeds_file = f"{settings.seeds.dumps_dir}/{scenario}_seeds.json"
     # Открываем файл и валидируем его как объект SeedsResult
-    with open(f'./dumps/{scenario}_seeds.json', 'r', encoding="utf-8") as file:
+    with open(f'{settings.seeds.dumps_dir}/{scenario}_seeds.json', 'r', encoding="utf-8") as file:
         logger.debug(f"Seeding result loaded from file: {seeds_file}")
         return SeedsResult.model_validate_json(file.read())
+
+
+def load_compact_seeds_result(scenario: str) -> CompactSeedsResult:
+    """
+    Загружает результат сидинга из JSON-файла сразу в компактное представление.
+
+    JSON разбирается в словари и перекладывается в плоские массивы без создания
+    Pydantic-моделей, поэтому загрузка быстрее, а итоговый объект занимает меньше памяти.
+
+    :param scenario: Название сценария нагрузки, данные которого нужно загрузить.
+    :return: Объект CompactSeedsResult, восстановленный из файла.
+    """
+    seeds_file = f"{settings.seeds.dumps_dir}/{scenario}_seeds.json"
+    with open(seeds_file, 'r', encoding="utf-8") as file:
+        logger.debug(f"Seeding result loaded from file: {seeds_file}")
+        return CompactSeedsResult.from_dicts(json.load(file).get("users", []))
+
+
+def get_seeds_jsonl_file(scenario: str) -> str:
+    """
+    Возвращает путь к построчному дампу сидинга для ленивой загрузки.
+
+    :param scenario: Название сценария нагрузки.
+    :return: Путь к JSONL-файлу.
+    """
+    return f"{settings.seeds.dumps_dir}/{scenario}_seeds.jsonl"
+
+
+def save_seeds_result_jsonl(result: SeedsResult, scenario: str):
+    """
+    Сохраняет результат сидинга в построчном формате для ленивой загрузки.
+
+    Создаются два файла:
+    - <SEEDS.DUMPS_DIR>/{scenario}_seeds.jsonl — по одному SeedUserResult на строку;
+    - <SEEDS.DUMPS_DIR>/{scenario}_seeds.idx — смещения начала строк (uint64), чтобы не сканировать файл при загрузке.
+
+    :param result: Результат сидинга, сгенерированный билдером.
+    :param scenario: Название сценария нагрузки.
+    """
+    os.makedirs(settings.seeds.dumps_dir, exist_ok=True)
+
+    offsets = array('Q', [0])
+    with open(get_seeds_jsonl_file(scenario), 'wb') as file:
+        for user in result.users:
+            line = user.model_dump_json().encode("utf-8") + b"\n"
+            file.write(line)
+            offsets.append(offsets[-1] + len(line))
+
+    with open(f"{settings.seeds.dumps_dir}/{scenario}_seeds.idx", 'wb') as file:
+        offsets.tofile(file)
+    logger.debug(f"Seeding result saved to file: {get_seeds_jsonl_file(scenario)}")
+
+
+def load_lazy_seeds_result(scenario: str) -> LazySeedsResult:
+    """
+    Открывает построчный дамп сидинга через mmap без разбора пользователей.
+
+    Файл отображается в память только для чтения, поэтому страницы разделяются между
+    процессами-воркерами Locust на одной машине, а SeedUserResult создаются только при обращении.
+
+    :param scenario: Название сценария нагрузки.
+    :return: LazySeedsResult с тем же интерфейсом, что у SeedsResult.
+    """
+    seeds_file = get_seeds_jsonl_file(scenario)
+    with open(seeds_file, 'rb') as file:
+        # Пустой файл нельзя отобразить в память
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if os.fstat(file.fileno()).st_size else b""
+
+    offsets = array('Q')
+    with open(f"{settings.seeds.dumps_dir}/{scenario}_seeds.idx", 'rb') as file:
+        offsets.frombytes(file.read())
+
+    logger.debug(f"Seeding result mapped from file: {seeds_file}")
+    return LazySeedsResult(users=LazySeedUsers(buffer=buffer, offsets=offsets))
+
+
+def get_seeds_checkpoint_file(scenario: str) -> str:
+    """
+    Возвращает путь к файлу чекпоинта сидинга для сценария.
+
+    :param scenario: Название сценария нагрузки.
+    :return: Путь вида <SEEDS.DUMPS_DIR>/{scenario}_seeds.checkpoint.jsonl.
+    """
+    return f"{settings.seeds.dumps_dir}/{scenario}_seeds.checkpoint.jsonl"
+
+
+def append_seeds_checkpoint(user: SeedUserResult, scenario: str, fingerprint: str):
+    """
+    Дописывает одного созданного пользователя в append-only чекпоинт (JSONL, одна строка на пользователя).
+
+    Запись выполняется сразу после создания пользователя, поэтому при падении сидинга
+    уже созданные пользователи не теряются и могут быть переиспользованы при перезапуске.
+    Первая строка нового чекпоинта — заголовок с отпечатком сидинга (план и gateway),
+    по которому load_seeds_checkpoint отбрасывает чекпоинт другого плана или стенда.
+
+    :param user: Полностью созданный пользователь со всеми счетами, картами и операциями.
+    :param scenario: Название сценария нагрузки.
+    :param fingerprint: Отпечаток сидинга (SeedsScenario.fingerprint).
+    """
+    os.makedirs(settings.seeds.dumps_dir, exist_ok=True)
+
+    with open(get_seeds_checkpoint_file(scenario), 'a', encoding="utf-8") as file:
+        if file.tell() == 0:
+            file.write(json.dumps({"fingerprint": fingerprint}) + "\n")
+        file.write(user.model_dump_json() + "\n")
+
+
+def load_seeds_checkpoint(scenario: str, fingerprint: str) -> list[SeedUserResult]:
+    """
+    Загружает пользователей из чекпоинта сидинга.
+
+    - Чекпоинт с другим отпечатком (изменились план или gateway) или без заголовка удаляется:
+      его пользователи созданы не по текущему плану или на другом стенде.
+    - Последняя строка может быть записана не полностью (процесс упал во время записи).
+      Если она всё же разбирается, в файл дописывается перевод строки, иначе она отрезается —
+      чтобы следующая запись не склеилась с ней и не потерялась при очередной загрузке.
+
+    :param scenario: Название сценария нагрузки.
+    :param fingerprint: Отпечаток текущего сидинга (SeedsScenario.fingerprint).
+    :return: Список уже созданных пользователей (пустой, если подходящего чекпоинта нет).
+    """
+    checkpoint_file = get_seeds_checkpoint_file(scenario)
+    if not os.path.exists(checkpoint_file):
+        return []
+
+    with open(checkpoint_file, 'r+b') as file:
+        data = file.read()
+        header, _, body = data.partition(b"\n")
+        try:
+            checkpoint_fingerprint = json.loads(header).get("fingerprint")
+        except (ValueError, AttributeError):
+            checkpoint_fingerprint = None
+
+        if checkpoint_fingerprint != fingerprint:
+            file.close()
+            os.remove(checkpoint_file)
+            logger.warning(f"Discarding seeding checkpoint created for another plan or gateway: {checkpoint_file}")
+            return []
+
+        *lines, tail = body.split(b"\n")
+        users: list[SeedUserResult] = []
+        for line in lines:
+            try:
+                users.append(SeedUserResult.model_validate_json(line))
+            except ValueError:
+                logger.warning(f"Skipping corrupted line in seeding checkpoint: {checkpoint_file}")
+
+        if tail:
+            try:
+                users.append(SeedUserResult.model_validate_json(tail))
+                file.write(b"\n")
+            except ValueError:
+                file.truncate(len(data) - len(tail))
+                logger.warning(f"Truncating torn last line of seeding checkpoint: {checkpoint_file}")
+
+    logger.debug(f"Seeding checkpoint loaded from file: {checkpoint_file}")
+    return users
+
+
+def remove_seeds_checkpoint(scenario: str):
+    """
+    Удаляет чекпоинт сидинга после того, как итоговый результат сохранён.
+
+    :param scenario: Название сценария нагрузки.
+    """
+    checkpoint_file = get_seeds_checkpoint_file(scenario)
+    if os.path.exists(checkpoint_file):
+        os.remove(checkpoint_file)
+        logger.debug(f"Seeding checkpoint removed: {checkpoint_file}")
+
+
+def get_seeds_metadata_file(scenario: str) -> str:
+    """
+    Возвращает путь к файлу метаданных дампа сидинга для сценария.
+
+    :param scenario: Название сценария нагрузки.
+    :return: Путь вида <SEEDS.DUMPS_DIR>/{scenario}_seeds.meta.json.
+    """
+    return f"{settings.seeds.dumps_dir}/{scenario}_seeds.meta.json"
+
+
+def save_seeds_metadata(metadata: SeedsMetadata, scenario: str):
+    """
+    Сохраняет метаданные дампа сидинга (отпечаток плана и время создания).
+
+    :param metadata: Метаданные сохранённого результата сидинга.
+    :param scenario: Название сценария нагрузки.
+    """
+    os.makedirs(settings.seeds.dumps_dir, exist_ok=True)
+
+    with open(get_seeds_metadata_file(scenario), 'w+', encoding="utf-8") as file:
+        file.write(metadata.model_dump_json())
+
+
+def load_seeds_metadata(scenario: str) -> SeedsMetadata | None:
+    """
+    Загружает метаданные дампа сидинга.
+
+    :param scenario: Название сценария нагрузки.
+    :return: Метаданные или None, если дампа или его метаданных нет.
+    """
+    metadata_file = get_seeds_metadata_file(scenario)
+    if not (os.path.exists(metadata_file) and os.path.exists(f"{settings.seeds.dumps_dir}/{scenario}_seeds.json")):
+        return None
+
+    with open(metadata_file, 'r', encoding="utf-8") as file:
+        try:
+            return SeedsMetadata.model_validate_json(file.read())
+        except ValueError:
+            logger.warning(f"Skipping corrupted seeding metadata: {metadata_file}")
+            return None
+
+
+def remove_seeds_metadata(scenario: str):
+    """
+    Удаляет метаданные дампа, после чего дамп больше не переиспользуется.
+
+    :param scenario: Название сценария нагрузки.
+    """
+    metadata_file = get_seeds_metadata_file(scenario)
+    if os.path.exists(metadata_file):
+        os.remove(metadata_file)
+        logger.debug(f"Seeding metadata removed: {metadata_file}")
@@ -0,0 +1,82 @@
+import mmap
+import random
+from array import array
+from typing import Sequence, overload
+
+from seeds.schema.result import SeedUserResult
+
+
+class LazySeedUsers(Sequence[SeedUserResult]):
+    """
+    Последовательность пользователей сидинга поверх отображённого в память JSONL-дампа.
+
+    Дамп хранит по одному SeedUserResult на строку, а индекс — смещения начала строк.
+    Поэтому доступ по номеру стоит O(1): из mmap берётся срез байт одной строки
+    и валидируется только он. Остальные пользователи в память процесса не загружаются.
+    """
+
+    def __init__(self, buffer: mmap.mmap, offsets: array):
+        """
+        :param buffer: Отображённый в память JSONL-файл.
+        :param offsets: Смещения начала каждой строки и конец последней (len = количество пользователей + 1).
+        """
+        self.buffer = buffer
+        self.offsets = offsets
+
+    def __len__(self) -> int:
+        return max(len(self.offsets) - 1, 0)
+
+    @overload
+    def __getitem__(self, index: int) -> SeedUserResult:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[SeedUserResult]:
+        ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("seed user index out of range")
+
+        return SeedUserResult.model_validate_json(self.buffer[self.offsets[index]:self.offsets[index + 1]])
+
+
+class LazySeedsResult:
+    """
+    Ленивая замена SeedsResult для очень больших дампов.
+
+    Предоставляет тот же интерфейс (users, get_next_user, get_random_user),
+    но материализует SeedUserResult только при обращении к конкретному пользователю.
+    """
+
+    def __init__(self, users: LazySeedUsers):
+        self.users = users
+        self.next_index = 0
+
+    def get_next_user(self) -> SeedUserResult:
+        """
+        Возвращает следующего ещё не выданного пользователя.
+
+        Returns:
+            SeedUserResult: Следующий пользователь из дампа.
+        """
+        if self.next_index >= len(self.users):
+            raise IndexError("no more seed users")
+
+        user = self.users[self.next_index]
+        self.next_index += 1
+        return user
+
+    def get_random_user(self) -> SeedUserResult:
+        """
+        Возвращает случайного пользователя за O(1), не загружая остальных.
+
+        Returns:
+            SeedUserResult: Случайный пользователь.
+        """
+        return self.users[random.randrange(len(self.users))]
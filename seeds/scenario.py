@@ -1,10 +1,36 @@
+import hashlib
+import os
 from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from functools import cached_property
+from typing import TYPE_CHECKING
 
+from config import settings
+from tools.config.seeds import SeedsLoader
 from logger import get_logger
-from seeds.builder import build_grpc_seeds_builder
-from seeds.dumps import save_seeds_result, load_seeds_result
+from seeds.dumps import (
+    save_seeds_result,
+    load_seeds_result,
+    save_seeds_result_jsonl,
+    get_seeds_jsonl_file,
+    load_lazy_seeds_result,
+    load_compact_seeds_result,
+    load_seeds_checkpoint,
+    append_seeds_checkpoint,
+    remove_seeds_checkpoint,
+    save_seeds_metadata,
+    load_seeds_metadata,
+    remove_seeds_metadata
+)
+from seeds.compact import CompactSeedsResult
+from seeds.lazy import LazySeedsResult
+from seeds.schema.metadata import SeedsMetadata
 from seeds.schema.plan import SeedsPlan
-from seeds.schema.result import SeedsResult
+from seeds.schema.result import SeedsResult, SeedUserResult
+
+if TYPE_CHECKING:
+    from seeds.async_builder import AsyncSeedsBuilder
+    from seeds.builder import SeedsBuilder
 
 
 # Инициализируем логгер с именем SEEDS_SCENARIO
@@ -17,12 +43,16 @@ class SeedsScenario(ABC):
     Этот класс инкапсулирует общую логику генерации, сохранения и загрузки данных для тестов.
     """
 
-    def __init__(self):
+    @cached_property
+    def builder(self) -> "SeedsBuilder":
         """
-        Инициализация класса SeedsScenario.
-        Создаёт экземпляр билдера для генерации сидинговых данных через gRPC.
+        Билдер для генерации сидинговых данных через gRPC, создаётся при первом сидинге.
+
+        seeds.builder импортирует locust (gevent monkey patching), поэтому он не импортируется
+        вместе со сценарием: асинхронному сидингу (python -m seeds) нужен чистый asyncio-процесс.
         """
-        self.builder = build_grpc_seeds_builder()
+        from seeds.builder import build_grpc_seeds_builder
+        return build_grpc_seeds_builder()
 
     @property
     @abstractmethod
@@ -42,6 +72,48 @@ class SeedsScenario(ABC):
         """
         ...
 
+    @property
+    def gateway(self) -> str:
+        """
+        Адрес gateway, в котором создаются данные сидинга.
+        Входит в отпечаток дампа: данные, созданные на другом стенде, не переиспользуются.
+        Должен соответствовать билдеру (по умолчанию используется gRPC-билдер).
+        """
+        return settings.gateway_grpc_client.client_url
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        Отпечаток сидинга: SHA-256 от плана и адреса gateway.
+        """
+        payload = f"{self.gateway}\n{self.plan.model_dump_json()}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def is_cached(self) -> bool:
+        """
+        Проверяет, можно ли переиспользовать сохранённый дамп вместо повторного сидинга.
+
+        Дамп переиспользуется, если кэш включён (SEEDS.CACHE), отпечаток совпадает
+        с текущим планом и gateway, а возраст дампа не превышает SEEDS.CACHE_TTL.
+        """
+        if not settings.seeds.cache:
+            return False
+
+        metadata = load_seeds_metadata(scenario=self.scenario)
+        if metadata is None or metadata.fingerprint != self.fingerprint:
+            return False
+
+        age = (datetime.now(timezone.utc) - metadata.created_at).total_seconds()
+        return age <= settings.seeds.cache_ttl
+
+    def invalidate(self) -> None:
+        """
+        Явно сбрасывает кэш: следующий вызов build() выполнит сидинг заново.
+        """
+        logger.info(f"[{self.scenario}] Invalidating cached seeding result.")
+        remove_seeds_metadata(scenario=self.scenario)
+        remove_seeds_checkpoint(scenario=self.scenario)
+
     def save(self, result: SeedsResult) -> None:
         """
         Сохраняет результат сидинга в файл.
@@ -50,32 +122,107 @@ class SeedsScenario(ABC):
         # Логируем начало сохранения
         logger.info(f"[{self.scenario}] Saving seeding result to file.")
         save_seeds_result(result=result, scenario=self.scenario)
+        # Дополнительно пишем построчный дамп для ленивой загрузки (SEEDS.LOADER=lazy)
+        save_seeds_result_jsonl(result=result, scenario=self.scenario)
         # Логируем успешное завершение
         logger.info(f"[{self.scenario}] Seeding result saved successfully.")
 
-    def load(self) -> SeedsResult:
+    def load(self) -> SeedsResult | LazySeedsResult | CompactSeedsResult:
         """
         Загружает результаты сидинга из файла.
-        :return: Объект SeedsResult, содержащий данные, загруженные из файла.
+
+        При SEEDS.LOADER=lazy дамп не разбирается целиком, а отображается в память,
+        и пользователи материализуются только при обращении.
+        При SEEDS.LOADER=compact идентификаторы хранятся в плоских массивах (см. CompactSeedsResult).
+        :return: Объект SeedsResult (или LazySeedsResult / CompactSeedsResult), содержащий данные, загруженные из файла.
         """
         # Логируем начало загрузки
         logger.info(f"[{self.scenario}] Loading seeding result from file.")
-        result = load_seeds_result(scenario=self.scenario)
+        if settings.seeds.loader == SeedsLoader.LAZY:
+            if not os.path.exists(get_seeds_jsonl_file(self.scenario)):
+                # Дамп мог остаться от запуска без построчного формата — конвертируем его один раз
+                save_seeds_result_jsonl(result=load_seeds_result(scenario=self.scenario), scenario=self.scenario)
+            result = load_lazy_seeds_result(scenario=self.scenario)
+        elif settings.seeds.loader == SeedsLoader.COMPACT:
+            result = load_compact_seeds_result(scenario=self.scenario)
+        else:
+            result = load_seeds_result(scenario=self.scenario)
         # Логируем успешную загрузку
         logger.info(f"[{self.scenario}] Seeding result loaded successfully.")
         return result
 
-    def build(self) -> None:
+    def checkpoint(self, user: SeedUserResult) -> None:
         """
-        Генерирует данные с помощью билдера, используя план сидинга, и сохраняет результат.
+        Дописывает созданного пользователя в чекпоинт сидинга.
+        :param user: Полностью созданный пользователь.
         """
+        append_seeds_checkpoint(user=user, scenario=self.scenario, fingerprint=self.fingerprint)
+
+    def prepare_build(self, force: bool) -> list[SeedUserResult] | None:
+        """
+        Проверяет кэш и подхватывает чекпоинт прерванного сидинга.
+
+        :param force: Выполнить сидинг, даже если есть подходящий сохранённый дамп.
+        :return: Уже созданные пользователи или None, если сидинг не нужен (дамп из кэша).
+        """
+        if not force and self.is_cached():
+            logger.info(f"[{self.scenario}] Reusing cached seeding result, fingerprint: {self.fingerprint}")
+            return None
+
         # Преобразуем план сидинга в JSON для логов (без значений по умолчанию)
         plan_json = self.plan.model_dump_json(indent=2, exclude_defaults=True)
         # Логируем начало генерации
         logger.info(f"[{self.scenario}] Starting seeding data generation for plan: {plan_json}")
-        # Запускаем генерацию
-        result = self.builder.build(self.plan)
+        # Подхватываем пользователей, созданных в прерванном запуске
+        completed = load_seeds_checkpoint(scenario=self.scenario, fingerprint=self.fingerprint)
+        if completed:
+            logger.info(f"[{self.scenario}] Resuming seeding from checkpoint: {len(completed)} users already created.")
+        return completed
+
+    def finish_build(self, result: SeedsResult) -> None:
+        """
+        Сохраняет результат сидинга с метаданными и удаляет ставший ненужным чекпоинт.
+        """
         # Логируем завершение генерации
         logger.info(f"[{self.scenario}] Seeding data generation completed.")
-        # Сохраняем результат
         self.save(result)
+        save_seeds_metadata(
+            metadata=SeedsMetadata(fingerprint=self.fingerprint, created_at=datetime.now(timezone.utc)),
+            scenario=self.scenario
+        )
+        remove_seeds_checkpoint(scenario=self.scenario)
+
+    def build(self, force: bool = False) -> None:
+        """
+        Генерирует данные с помощью билдера, используя план сидинга, и сохраняет результат.
+
+        Если для того же плана и gateway уже есть актуальный дамп (см. is_cached), сидинг пропускается.
+        Каждый созданный пользователь сразу дописывается в чекпоинт, поэтому прерванный
+        сидинг при повторном запуске продолжается с места остановки — если план и gateway
+        не изменились (чекпоинт хранит отпечаток сидинга). После сохранения
+        итогового результата чекпоинт удаляется.
+
+        :param force: Выполнить сидинг, даже если есть подходящий сохранённый дамп.
+        """
+        completed = self.prepare_build(force)
+        if completed is None:
+            return
+
+        result = self.builder.build(self.plan, completed=completed, on_user_built=self.checkpoint)
+        self.finish_build(result)
+
+    async def build_async(self, builder: "AsyncSeedsBuilder", force: bool = False) -> None:
+        """
+        То же, что build(), но через асинхронный билдер: все пользователи плана создаются
+        конкурентно в одном asyncio-процессе (см. python -m seeds). Кэш, чекпоинт и дамп общие с build(),
+        поэтому Locust затем переиспользует результат.
+
+        :param builder: Асинхронный билдер; его соединениями владеет вызывающий код.
+        :param force: Выполнить сидинг, даже если есть подходящий сохранённый дамп.
+        """
+        completed = self.prepare_build(force)
+        if completed is None:
+            return
+
+        result = await builder.build(self.plan, completed=completed, on_user_built=self.checkpoint)
+        self.finish_build(result)
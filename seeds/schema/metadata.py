@@ -0,0 +1,15 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class SeedsMetadata(BaseModel):
+    """
+    Метаданные сохранённого результата сидинга, используемые для его переиспользования.
+
+    Attributes:
+        fingerprint (str): Отпечаток плана сидинга и целевого gateway, для которого создавались данные.
+        created_at (datetime): Момент сохранения результата сидинга.
+    """
+    fingerprint: str
+    created_at: datetime
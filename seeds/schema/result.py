@@ -1,6 +1,6 @@
 import random
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class SeedCardResult(BaseModel):
@@ -73,9 +73,12 @@ class SeedsResult(BaseModel):
 
     users: list[SeedUserResult] = Field(default_factory=list)
 
+    # Номер следующего пользователя для get_next_user (вместо O(n) удаления из начала списка)
+    _next_index: int = PrivateAttr(default=0)
+
     def get_next_user(self) -> SeedUserResult:
         """
-        Возвращает и удаляет первого пользователя из списка.
+        Возвращает следующего ещё не выданного пользователя за O(1).
 
         Используется в случае, когда на каждый виртуальный юзер нужен новый тестовый пользователь.
         Удобно при строго последовательной раздаче пользователей в тестовых сценариях.
@@ -83,7 +86,12 @@ class SeedsResult(BaseModel):
         Returns:
             SeedUserResult: Следующий пользователь из списка.
         """
-        return self.users.pop(0)
+        if self._next_index >= len(self.users):
+            raise IndexError("no more seed users")
+
+        user = self.users[self._next_index]
+        self._next_index += 1
+        return user
 
     def get_random_user(self) -> SeedUserResult:
         """
@@ -95,3 +103,19 @@ class SeedsResult(BaseModel):
             SeedUserResult: Случайный пользователь.
         """
         return random.choice(self.users)
+
+    def shard(self, index: int, count: int) -> "SeedsResult":
+        """
+        Возвращает непересекающуюся часть пользователей для одного из count потребителей.
+
+        Пользователи раздаются через один (index, index + count, ...), поэтому шарды
+        получаются равными по размеру с точностью до одного пользователя.
+
+        Args:
+            index (int): Номер шарда, от 0 до count - 1.
+            count (int): Общее количество шардов.
+
+        Returns:
+            SeedsResult: Результат сидинга только с пользователями этого шарда.
+        """
+        return SeedsResult(users=self.users[index::count])
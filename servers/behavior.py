@@ -0,0 +1,73 @@
+import math
+import random
+
+from config import settings
+from tools.config.stand_in import LatencyDistribution
+
+
+class StandInBehavior:
+    """
+    Поведение stand-in сервера: искусственная задержка ответа и доля ошибок.
+
+    Общее для HTTP и gRPC серверов, чтобы оба протокола при одинаковых настройках
+    давали одинаковую нагрузку "со стороны сервиса".
+    """
+
+    def __init__(
+            self,
+            distribution: LatencyDistribution = LatencyDistribution.CONSTANT,
+            latency_ms: float = 0.0,
+            latency_spread_ms: float = 0.0,
+            latency_sigma: float = 0.5,
+            error_rate: float = 0.0
+    ):
+        """
+        :param distribution: Распределение задержки.
+        :param latency_ms: Задержка (constant), центр (uniform), среднее (exponential) или медиана (lognormal) в мс.
+        :param latency_spread_ms: Полуширина интервала для uniform в мс.
+        :param latency_sigma: Параметр sigma для lognormal.
+        :param error_rate: Доля ответов с ошибкой.
+        """
+        self.distribution = distribution
+        self.latency_ms = latency_ms
+        self.latency_spread_ms = latency_spread_ms
+        self.latency_sigma = latency_sigma
+        self.error_rate = error_rate
+
+    def latency(self) -> float:
+        """
+        Задержка очередного ответа в секундах.
+        """
+        if self.latency_ms <= 0 and self.distribution != LatencyDistribution.UNIFORM:
+            return 0.0
+
+        match self.distribution:
+            case LatencyDistribution.UNIFORM:
+                latency = random.uniform(self.latency_ms - self.latency_spread_ms, self.latency_ms + self.latency_spread_ms)
+            case LatencyDistribution.EXPONENTIAL:
+                latency = random.expovariate(1 / self.latency_ms)
+            case LatencyDistribution.LOGNORMAL:
+                latency = random.lognormvariate(math.log(self.latency_ms), self.latency_sigma)
+            case _:
+                latency = self.latency_ms
+
+        return max(latency, 0.0) / 1000
+
+    def failed(self) -> bool:
+        """
+        Нужно ли ответить на очередной запрос ошибкой.
+        """
+        return self.error_rate > 0 and random.random() < self.error_rate
+
+
+def build_stand_in_behavior() -> StandInBehavior:
+    """
+    Создаёт поведение stand-in сервера по настройкам STAND_IN.
+    """
+    return StandInBehavior(
+        distribution=settings.stand_in.latency_distribution,
+        latency_ms=settings.stand_in.latency_ms,
+        latency_spread_ms=settings.stand_in.latency_spread_ms,
+        latency_sigma=settings.stand_in.latency_sigma,
+        error_rate=settings.stand_in.error_rate
+    )
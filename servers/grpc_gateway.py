@@ -0,0 +1,313 @@
+"""
+Stand-in grpc-gateway: реализует сервисы contracts/services/gateway/* на заранее подготовленных
+сообщениях с настраиваемой задержкой и долей ошибок (секция STAND_IN в .env).
+
+Запуск: python -m servers.grpc_gateway
+"""
+import asyncio
+from typing import Any
+
+import grpc
+from google.protobuf.message import Message
+from grpc import aio
+
+from clients.http.gateway.accounts.schema import AccountType
+from clients.http.gateway.cards.schema import CardType
+from clients.http.gateway.operations.schema import OperationType
+from config import settings
+from contracts.services.accounts.account_pb2 import AccountStatus
+from contracts.services.accounts.account_pb2 import AccountType as ProtoAccountType
+from contracts.services.cards.card_pb2 import Card, CardPaymentSystem, CardStatus
+from contracts.services.cards.card_pb2 import CardType as ProtoCardType
+from contracts.services.documents.contracts.contract_pb2 import Contract
+from contracts.services.documents.receipts.receipt_pb2 import Receipt
+from contracts.services.documents.tariffs.tariff_pb2 import Tariff
+from contracts.services.gateway.accounts import accounts_gateway_service_pb2_grpc
+from contracts.services.gateway.accounts.account_pb2 import AccountView
+from contracts.services.gateway.accounts.rpc_get_accounts_pb2 import GetAccountsResponse
+from contracts.services.gateway.accounts.rpc_open_credit_card_account_pb2 import OpenCreditCardAccountResponse
+from contracts.services.gateway.accounts.rpc_open_debit_card_account_pb2 import OpenDebitCardAccountResponse
+from contracts.services.gateway.accounts.rpc_open_deposit_account_pb2 import OpenDepositAccountResponse
+from contracts.services.gateway.accounts.rpc_open_savings_account_pb2 import OpenSavingsAccountResponse
+from contracts.services.gateway.cards import cards_gateway_service_pb2_grpc
+from contracts.services.gateway.cards.rpc_issue_physical_card_pb2 import IssuePhysicalCardResponse
+from contracts.services.gateway.cards.rpc_issue_virtual_card_pb2 import IssueVirtualCardResponse
+from contracts.services.gateway.documents import documents_gateway_service_pb2_grpc
+from contracts.services.gateway.documents.rpc_get_contract_document_pb2 import GetContractDocumentResponse
+from contracts.services.gateway.documents.rpc_get_tariff_document_pb2 import GetTariffDocumentResponse
+from contracts.services.gateway.operations import operations_gateway_service_pb2_grpc
+from contracts.services.gateway.operations.rpc_get_operation_pb2 import GetOperationResponse
+from contracts.services.gateway.operations.rpc_get_operation_receipt_pb2 import GetOperationReceiptResponse
+from contracts.services.gateway.operations.rpc_get_operations_pb2 import GetOperationsResponse
+from contracts.services.gateway.operations.rpc_get_operations_summary_pb2 import GetOperationsSummaryResponse
+from contracts.services.gateway.operations.rpc_make_bill_payment_operation_pb2 import MakeBillPaymentOperationResponse
+from contracts.services.gateway.operations.rpc_make_cash_withdrawal_operation_pb2 import (
+    MakeCashWithdrawalOperationResponse
+)
+from contracts.services.gateway.operations.rpc_make_cashback_operation_pb2 import MakeCashbackOperationResponse
+from contracts.services.gateway.operations.rpc_make_fee_operation_pb2 import MakeFeeOperationResponse
+from contracts.services.gateway.operations.rpc_make_purchase_operation_pb2 import MakePurchaseOperationResponse
+from contracts.services.gateway.operations.rpc_make_top_up_operation_pb2 import MakeTopUpOperationResponse
+from contracts.services.gateway.operations.rpc_make_transfer_operation_pb2 import MakeTransferOperationResponse
+from contracts.services.gateway.users import users_gateway_service_pb2_grpc
+from contracts.services.gateway.users.rpc_create_user_pb2 import CreateUserResponse
+from contracts.services.gateway.users.rpc_get_user_pb2 import GetUserResponse
+from contracts.services.operations.operation_pb2 import Operation, OperationStatus
+from contracts.services.operations.operation_pb2 import OperationType as ProtoOperationType
+from contracts.services.operations.operations_summary_pb2 import OperationsSummary
+from contracts.services.users.user_pb2 import User
+from logger import get_logger
+from servers.behavior import StandInBehavior, build_stand_in_behavior
+from servers.payloads import StandInData, build_stand_in_data
+
+logger = get_logger("STAND_IN_GRPC_GATEWAY")
+
+
+def build_user_message(user: dict[str, Any]) -> User:
+    return User(
+        id=user["id"],
+        email=user["email"],
+        last_name=user["lastName"],
+        first_name=user["firstName"],
+        middle_name=user["middleName"],
+        phone_number=user["phoneNumber"]
+    )
+
+
+def build_card_message(card: dict[str, Any]) -> Card:
+    return Card(
+        id=card["id"],
+        pin=card["pin"],
+        cvv=card["cvv"],
+        type=ProtoCardType.Value(f"CARD_TYPE_{card['type']}"),
+        status=CardStatus.Value(f"CARD_STATUS_{card['status']}"),
+        account_id=card["accountId"],
+        card_number=card["cardNumber"],
+        card_holder=card["cardHolder"],
+        expiry_date=card["expiryDate"],
+        payment_system=CardPaymentSystem.Value(f"CARD_PAYMENT_SYSTEM_{card['paymentSystem']}")
+    )
+
+
+def build_account_message(account: dict[str, Any]) -> AccountView:
+    return AccountView(
+        id=account["id"],
+        type=ProtoAccountType.Value(f"ACCOUNT_TYPE_{account['type']}"),
+        cards=[build_card_message(card) for card in account["cards"]],
+        status=AccountStatus.Value(f"ACCOUNT_STATUS_{account['status']}"),
+        balance=account["balance"]
+    )
+
+
+def build_operation_message(operation: dict[str, Any]) -> Operation:
+    return Operation(
+        id=operation["id"],
+        type=ProtoOperationType.Value(f"OPERATION_TYPE_{operation['type']}"),
+        status=OperationStatus.Value(f"OPERATION_STATUS_{operation['status']}"),
+        amount=operation["amount"],
+        card_id=operation["cardId"],
+        category=operation["category"],
+        created_at=operation["createdAt"],
+        account_id=operation["accountId"]
+    )
+
+
+class StandInServicer:
+    """
+    Общая часть stand-in сервисов: задержка и инъекция ошибок перед отдачей готового ответа.
+
+    Сервер работает на grpc.aio, поэтому задержка — asyncio.sleep: медленные ответы
+    не занимают потоки пула, как было бы в синхронном grpc.server из grpc_server.py.
+    """
+
+    def __init__(self, behavior: StandInBehavior, data: StandInData):
+        self.behavior = behavior
+        self.data = data
+
+    async def respond(self, context: aio.ServicerContext, response: Message) -> Message:
+        latency = self.behavior.latency()
+        if latency:
+            await asyncio.sleep(latency)
+
+        if self.behavior.failed():
+            await context.abort(grpc.StatusCode.INTERNAL, "Stand-in injected error")
+
+        return response
+
+
+class UsersGatewayServicer(StandInServicer, users_gateway_service_pb2_grpc.UsersGatewayServiceServicer):
+    def __init__(self, behavior: StandInBehavior, data: StandInData):
+        super().__init__(behavior, data)
+        user = build_user_message(data.user)
+        self.get_user_response = GetUserResponse(user=user)
+        self.create_user_response = CreateUserResponse(user=user)
+
+    async def GetUser(self, request, context):
+        return await self.respond(context, self.get_user_response)
+
+    async def CreateUser(self, request, context):
+        return await self.respond(context, self.create_user_response)
+
+
+class AccountsGatewayServicer(StandInServicer, accounts_gateway_service_pb2_grpc.AccountsGatewayServiceServicer):
+    def __init__(self, behavior: StandInBehavior, data: StandInData):
+        super().__init__(behavior, data)
+        accounts = {account_type: build_account_message(account) for account_type, account in data.accounts.items()}
+        self.get_accounts_response = GetAccountsResponse(
+            accounts=[build_account_message(account) for account in data.account_list]
+        )
+        self.open_deposit_account_response = OpenDepositAccountResponse(account=accounts[AccountType.DEPOSIT])
+        self.open_savings_account_response = OpenSavingsAccountResponse(account=accounts[AccountType.SAVINGS])
+        self.open_debit_card_account_response = OpenDebitCardAccountResponse(account=accounts[AccountType.DEBIT_CARD])
+        self.open_credit_card_account_response = OpenCreditCardAccountResponse(account=accounts[AccountType.CREDIT_CARD])
+
+    async def GetAccounts(self, request, context):
+        return await self.respond(context, self.get_accounts_response)
+
+    async def OpenDepositAccount(self, request, context):
+        return await self.respond(context, self.open_deposit_account_response)
+
+    async def OpenSavingsAccount(self, request, context):
+        return await self.respond(context, self.open_savings_account_response)
+
+    async def OpenDebitCardAccount(self, request, context):
+        return await self.respond(context, self.open_debit_card_account_response)
+
+    async def OpenCreditCardAccount(self, request, context):
+        return await self.respond(context, self.open_credit_card_account_response)
+
+
+class CardsGatewayServicer(StandInServicer, cards_gateway_service_pb2_grpc.CardsGatewayServiceServicer):
+    def __init__(self, behavior: StandInBehavior, data: StandInData):
+        super().__init__(behavior, data)
+        self.issue_virtual_card_response = IssueVirtualCardResponse(card=build_card_message(data.cards[CardType.VIRTUAL]))
+        self.issue_physical_card_response = IssuePhysicalCardResponse(card=build_card_message(data.cards[CardType.PHYSICAL]))
+
+    async def IssueVirtualCard(self, request, context):
+        return await self.respond(context, self.issue_virtual_card_response)
+
+    async def IssuePhysicalCard(self, request, context):
+        return await self.respond(context, self.issue_physical_card_response)
+
+
+class DocumentsGatewayServicer(StandInServicer, documents_gateway_service_pb2_grpc.DocumentsGatewayServiceServicer):
+    def __init__(self, behavior: StandInBehavior, data: StandInData):
+        super().__init__(behavior, data)
+        self.get_tariff_document_response = GetTariffDocumentResponse(
+            tariff=Tariff(url=data.document_url, document=data.document)
+        )
+        self.get_contract_document_response = GetContractDocumentResponse(
+            contract=Contract(url=data.document_url, document=data.document)
+        )
+
+    async def GetTariffDocument(self, request, context):
+        return await self.respond(context, self.get_tariff_document_response)
+
+    async def GetContractDocument(self, request, context):
+        return await self.respond(context, self.get_contract_document_response)
+
+
+class OperationsGatewayServicer(StandInServicer, operations_gateway_service_pb2_grpc.OperationsGatewayServiceServicer):
+    def __init__(self, behavior: StandInBehavior, data: StandInData):
+        super().__init__(behavior, data)
+        operations = {
+            operation_type: build_operation_message(operation)
+            for operation_type, operation in data.operations.items()
+        }
+        self.get_operation_response = GetOperationResponse(operation=operations[OperationType.PURCHASE])
+        self.get_operations_response = GetOperationsResponse(
+            operations=[build_operation_message(operation) for operation in data.operation_list]
+        )
+        self.get_operation_receipt_response = GetOperationReceiptResponse(
+            receipt=Receipt(url=data.document_url, document=data.document)
+        )
+        self.get_operations_summary_response = GetOperationsSummaryResponse(
+            summary=OperationsSummary(
+                spent_amount=data.summary["spentAmount"],
+                received_amount=data.summary["receivedAmount"],
+                cashback_amount=data.summary["cashbackAmount"]
+            )
+        )
+        self.make_fee_operation_response = MakeFeeOperationResponse(operation=operations[OperationType.FEE])
+        self.make_top_up_operation_response = MakeTopUpOperationResponse(operation=operations[OperationType.TOP_UP])
+        self.make_cashback_operation_response = MakeCashbackOperationResponse(operation=operations[OperationType.CASHBACK])
+        self.make_purchase_operation_response = MakePurchaseOperationResponse(operation=operations[OperationType.PURCHASE])
+        self.make_transfer_operation_response = MakeTransferOperationResponse(operation=operations[OperationType.TRANSFER])
+        self.make_bill_payment_operation_response = MakeBillPaymentOperationResponse(
+            operation=operations[OperationType.BILL_PAYMENT]
+        )
+        self.make_cash_withdrawal_operation_response = MakeCashWithdrawalOperationResponse(
+            operation=operations[OperationType.CASH_WITHDRAWAL]
+        )
+
+    async def GetOperation(self, request, context):
+        return await self.respond(context, self.get_operation_response)
+
+    async def GetOperations(self, request, context):
+        return await self.respond(context, self.get_operations_response)
+
+    async def GetOperationReceipt(self, request, context):
+        return await self.respond(context, self.get_operation_receipt_response)
+
+    async def GetOperationsSummary(self, request, context):
+        return await self.respond(context, self.get_operations_summary_response)
+
+    async def MakeFeeOperation(self, request, context):
+        return await self.respond(context, self.make_fee_operation_response)
+
+    async def MakeTopUpOperation(self, request, context):
+        return await self.respond(context, self.make_top_up_operation_response)
+
+    async def MakeCashbackOperation(self, request, context):
+        return await self.respond(context, self.make_cashback_operation_response)
+
+    async def MakePurchaseOperation(self, request, context):
+        return await self.respond(context, self.make_purchase_operation_response)
+
+    async def MakeTransferOperation(self, request, context):
+        return await self.respond(context, self.make_transfer_operation_response)
+
+    async def MakeBillPaymentOperation(self, request, context):
+        return await self.respond(context, self.make_bill_payment_operation_response)
+
+    async def MakeCashWithdrawalOperation(self, request, context):
+        return await self.respond(context, self.make_cash_withdrawal_operation_response)
+
+
+def build_stand_in_grpc_server() -> aio.Server:
+    """
+    Создаёт (но не запускает) grpc.aio-сервер stand-in gateway на STAND_IN.HOST:STAND_IN.GRPC_PORT
+    со всеми сервисами contracts/services/gateway/*.
+    """
+    behavior = build_stand_in_behavior()
+    data = build_stand_in_data()
+
+    server = aio.server()
+    users_gateway_service_pb2_grpc.add_UsersGatewayServiceServicer_to_server(
+        UsersGatewayServicer(behavior, data), server
+    )
+    accounts_gateway_service_pb2_grpc.add_AccountsGatewayServiceServicer_to_server(
+        AccountsGatewayServicer(behavior, data), server
+    )
+    cards_gateway_service_pb2_grpc.add_CardsGatewayServiceServicer_to_server(
+        CardsGatewayServicer(behavior, data), server
+    )
+    documents_gateway_service_pb2_grpc.add_DocumentsGatewayServiceServicer_to_server(
+        DocumentsGatewayServicer(behavior, data), server
+    )
+    operations_gateway_service_pb2_grpc.add_OperationsGatewayServiceServicer_to_server(
+        OperationsGatewayServicer(behavior, data), server
+    )
+    server.add_insecure_port(f"{settings.stand_in.host}:{settings.stand_in.grpc_port}")
+    return server
+
+
+async def serve():
+    server = build_stand_in_grpc_server()
+    await server.start()
+    logger.info(f"Stand-in grpc-gateway is listening on {settings.stand_in.host}:{settings.stand_in.grpc_port}")
+    await server.wait_for_termination()
+
+
+if __name__ == '__main__':
+    asyncio.run(serve())
@@ -0,0 +1,176 @@
+"""
+HTTP/2 без TLS (h2c, prior knowledge) для WSGI-приложений stand-in серверов.
+
+gevent.pywsgi говорит только на HTTP/1.1, а нагрузочный клиент с GATEWAY_HTTP_CLIENT.HTTP2=true
+по http сразу начинает соединение с преамбулы HTTP/2. Сервер распознаёт её и передаёт соединение
+сюда: кадры разбирает пакет h2 (тот же, что нужен httpx для HTTP/2), а каждый поток обрабатывается
+WSGI-приложением в отдельной greenlet — так же, как запрос HTTP/1.1.
+"""
+import io
+import socket
+from typing import Callable
+
+import gevent
+from gevent.event import Event
+from gevent.lock import Semaphore
+
+from logger import get_logger
+
+# Преамбула клиента HTTP/2 (RFC 9113, 3.4)
+H2_PREFACE = b"PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n"
+
+logger = get_logger("STAND_IN_H2C")
+
+
+def is_h2c_preface(sock: socket.socket) -> bool:
+    """
+    Проверяет, не начинается ли соединение с преамбулы HTTP/2. Данные из сокета не забираются.
+    """
+    while True:
+        data = sock.recv(len(H2_PREFACE), socket.MSG_PEEK)
+        if not data or not H2_PREFACE.startswith(data):
+            return False
+        if len(data) == len(H2_PREFACE):
+            return True
+        # Преамбула пришла не целиком: ждём остаток
+        gevent.sleep(0.001)
+
+
+class H2CConnection:
+    """
+    Одно соединение h2c: разбор кадров, вызов WSGI-приложения по потокам и отправка ответов
+    с учётом окна управления потоком.
+    """
+
+    def __init__(self, sock: socket.socket, address: tuple, application: Callable):
+        # Импорт здесь: h2 нужен только для HTTP/2 и ставится вместе с httpx[http2]
+        from h2.config import H2Configuration
+        from h2.connection import H2Connection
+
+        self.sock = sock
+        self.address = address
+        self.application = application
+        self.connection = H2Connection(H2Configuration(client_side=False, header_encoding="utf-8"))
+        self.requests: dict[int, tuple[dict[str, str], io.BytesIO]] = {}
+        self.lock = Semaphore()
+        self.window_updated = Event()
+
+    def flush(self) -> None:
+        data = self.connection.data_to_send()
+        if data:
+            self.sock.sendall(data)
+
+    def serve(self) -> None:
+        import h2.events
+        from h2.exceptions import ProtocolError
+
+        with self.lock:
+            self.connection.initiate_connection()
+            self.flush()
+
+        while True:
+            data = self.sock.recv(65536)
+            if not data:
+                return
+
+            with self.lock:
+                try:
+                    events = self.connection.receive_data(data)
+                except ProtocolError as error:
+                    logger.warning(f"HTTP/2 protocol error from {self.address}: {error}")
+                    self.flush()
+                    return
+                for event in events:
+                    if isinstance(event, h2.events.RequestReceived):
+                        self.requests[event.stream_id] = (dict(event.headers), io.BytesIO())
+                    elif isinstance(event, h2.events.DataReceived):
+                        if event.stream_id in self.requests:
+                            self.requests[event.stream_id][1].write(event.data)
+                        self.connection.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                    elif isinstance(event, h2.events.StreamEnded):
+                        if event.stream_id in self.requests:
+                            gevent.spawn(self.handle_stream, event.stream_id, *self.requests.pop(event.stream_id))
+                    elif isinstance(event, h2.events.StreamReset):
+                        self.requests.pop(event.stream_id, None)
+                    elif isinstance(event, h2.events.WindowUpdated):
+                        self.window_updated.set()
+                    elif isinstance(event, h2.events.ConnectionTerminated):
+                        self.flush()
+                        return
+                self.flush()
+
+    def build_environ(self, headers: dict[str, str], body: io.BytesIO) -> dict:
+        path, _, query = headers.get(":path", "/").partition("?")
+        environ = {
+            "REQUEST_METHOD": headers.get(":method", "GET"),
+            "PATH_INFO": path,
+            "QUERY_STRING": query,
+            "SERVER_PROTOCOL": "HTTP/2",
+            "REMOTE_ADDR": self.address[0] if self.address else "",
+            "wsgi.input": body,
+            "wsgi.url_scheme": "http",
+        }
+        for name, value in headers.items():
+            if not name.startswith(":"):
+                environ[f"HTTP_{name.upper().replace('-', '_')}"] = value
+        body.seek(0)
+        return environ
+
+    def handle_stream(self, stream_id: int, headers: dict[str, str], body: io.BytesIO) -> None:
+        response: dict = {}
+
+        def start_response(status: str, response_headers: list[tuple[str, str]], exc_info=None):
+            response["status"] = status.split(" ", 1)[0]
+            response["headers"] = [(name.lower(), value) for name, value in response_headers]
+
+        try:
+            content = b"".join(self.application(self.build_environ(headers, body), start_response))
+        except Exception:
+            logger.exception(f"Stream {stream_id} failed")
+            response = {"status": "500", "headers": []}
+            content = b""
+
+        with self.lock:
+            self.connection.send_headers(stream_id, [(":status", response["status"]), *response["headers"]])
+            self.flush()
+        self.send_body(stream_id, content)
+
+    def send_body(self, stream_id: int, content: bytes) -> None:
+        """
+        Отправляет тело ответа кадрами DATA, дожидаясь обновления окна, если оно исчерпано.
+        """
+        from h2.exceptions import StreamClosedError
+
+        view = memoryview(content)
+        try:
+            while True:
+                with self.lock:
+                    size = min(
+                        len(view),
+                        self.connection.local_flow_control_window(stream_id),
+                        self.connection.max_outbound_frame_size
+                    )
+                    if size or not view:
+                        self.connection.send_data(stream_id, bytes(view[:size]), end_stream=size == len(view))
+                        view = view[size:]
+                        self.flush()
+                        if not view:
+                            return
+                        continue
+                    self.window_updated.clear()
+                self.window_updated.wait()
+        except StreamClosedError:
+            # Клиент сбросил поток (например, по таймауту) — ответ больше не нужен
+            return
+
+
+def serve_h2c(sock: socket.socket, address: tuple, application: Callable) -> None:
+    """
+    Обслуживает соединение, начавшееся с преамбулы HTTP/2, до его закрытия клиентом.
+    """
+    try:
+        H2CConnection(sock, address, application).serve()
+    except ImportError:
+        logger.error("HTTP/2 client connected, but the h2 package is not installed: pip install h2")
+    except (ConnectionError, OSError):
+        return
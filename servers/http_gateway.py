@@ -0,0 +1,213 @@
+"""
+Stand-in http-gateway: отвечает на маршруты tools.routes.APIRouteTemplates заранее
+подготовленными телами с настраиваемой задержкой и долей ошибок (секция STAND_IN в .env).
+
+Запуск: python -m servers.http_gateway
+"""
+import socket
+from typing import Callable, Iterable
+
+import gevent
+from gevent.pywsgi import WSGIServer
+from pydantic import BaseModel
+
+from clients.http.gateway.accounts.schema import (
+    AccountType,
+    GetAccountsResponseSchema,
+    OpenCreditCardAccountResponseSchema,
+    OpenDebitCardAccountResponseSchema,
+    OpenDepositAccountResponseSchema,
+    OpenSavingsAccountResponseSchema
+)
+from clients.http.gateway.cards.schema import CardType, IssuePhysicalCardResponseSchema, IssueVirtualCardResponseSchema
+from clients.http.gateway.documents.schema import GetContractDocumentResponseSchema, GetTariffDocumentResponseSchema
+from clients.http.gateway.operations.schema import (
+    GetOperationReceiptResponseSchema,
+    GetOperationResponseSchema,
+    GetOperationsResponseSchema,
+    GetOperationsSummaryResponseSchema,
+    MakeBillPaymentOperationResponseSchema,
+    MakeCashbackOperationResponseSchema,
+    MakeCashWithdrawalOperationResponseSchema,
+    MakeFeeOperationResponseSchema,
+    MakePurchaseOperationResponseSchema,
+    MakeTopUpOperationResponseSchema,
+    MakeTransferOperationResponseSchema,
+    OperationType
+)
+from clients.http.gateway.users.schema import CreateUserResponseSchema, GetUserResponseSchema
+from config import settings
+from logger import get_logger
+from servers.behavior import StandInBehavior, build_stand_in_behavior
+from servers.h2c import is_h2c_preface, serve_h2c
+from servers.payloads import StandInData, build_document, build_stand_in_data
+from tools.routes import APIRouteTemplates, normalize_route
+
+logger = get_logger("STAND_IN_HTTP_GATEWAY")
+
+JSON_HEADERS = [("Content-Type", "application/json")]
+NOT_FOUND_BODY = b'{"detail":"Not Found"}'
+ERROR_BODY = b'{"detail":"Stand-in injected error"}'
+
+
+def dump(schema: type[BaseModel], payload: dict) -> bytes:
+    """
+    Проверяет ответ схемой клиента и сериализует его так же, как это сделал бы http-gateway.
+    """
+    return schema.model_validate(payload).model_dump_json(by_alias=True).encode()
+
+
+def build_http_responses(data: StandInData) -> dict[tuple[str, str], bytes]:
+    """
+    Готовые тела ответов по ключу (HTTP-метод, шаблон маршрута).
+    """
+    document = build_document(data)
+    return {
+        ("GET", APIRouteTemplates.USER): dump(GetUserResponseSchema, {"user": data.user}),
+        ("POST", APIRouteTemplates.USERS): dump(CreateUserResponseSchema, {"user": data.user}),
+
+        ("GET", APIRouteTemplates.ACCOUNTS): dump(GetAccountsResponseSchema, {"accounts": data.account_list}),
+        ("POST", APIRouteTemplates.OPEN_DEPOSIT_ACCOUNT): dump(
+            OpenDepositAccountResponseSchema, {"account": data.accounts[AccountType.DEPOSIT]}
+        ),
+        ("POST", APIRouteTemplates.OPEN_SAVINGS_ACCOUNT): dump(
+            OpenSavingsAccountResponseSchema, {"account": data.accounts[AccountType.SAVINGS]}
+        ),
+        ("POST", APIRouteTemplates.OPEN_DEBIT_CARD_ACCOUNT): dump(
+            OpenDebitCardAccountResponseSchema, {"account": data.accounts[AccountType.DEBIT_CARD]}
+        ),
+        ("POST", APIRouteTemplates.OPEN_CREDIT_CARD_ACCOUNT): dump(
+            OpenCreditCardAccountResponseSchema, {"account": data.accounts[AccountType.CREDIT_CARD]}
+        ),
+
+        ("POST", APIRouteTemplates.ISSUE_VIRTUAL_CARD): dump(
+            IssueVirtualCardResponseSchema, {"card": data.cards[CardType.VIRTUAL]}
+        ),
+        ("POST", APIRouteTemplates.ISSUE_PHYSICAL_CARD): dump(
+            IssuePhysicalCardResponseSchema, {"card": data.cards[CardType.PHYSICAL]}
+        ),
+
+        ("GET", APIRouteTemplates.TARIFF_DOCUMENT): dump(GetTariffDocumentResponseSchema, {"tariff": document}),
+        ("GET", APIRouteTemplates.CONTRACT_DOCUMENT): dump(GetContractDocumentResponseSchema, {"contract": document}),
+
+        ("GET", APIRouteTemplates.OPERATION): dump(
+            GetOperationResponseSchema, {"operation": data.operations[OperationType.PURCHASE]}
+        ),
+        ("GET", APIRouteTemplates.OPERATIONS): dump(GetOperationsResponseSchema, {"operations": data.operation_list}),
+        ("GET", APIRouteTemplates.OPERATION_RECEIPT): dump(GetOperationReceiptResponseSchema, {"receipt": document}),
+        ("GET", APIRouteTemplates.OPERATIONS_SUMMARY): dump(GetOperationsSummaryResponseSchema, {"summary": data.summary}),
+        ("POST", APIRouteTemplates.MAKE_FEE_OPERATION): dump(
+            MakeFeeOperationResponseSchema, {"operation": data.operations[OperationType.FEE]}
+        ),
+        ("POST", APIRouteTemplates.MAKE_TOP_UP_OPERATION): dump(
+            MakeTopUpOperationResponseSchema, {"operation": data.operations[OperationType.TOP_UP]}
+        ),
+        ("POST", APIRouteTemplates.MAKE_CASHBACK_OPERATION): dump(
+            MakeCashbackOperationResponseSchema, {"operation": data.operations[OperationType.CASHBACK]}
+        ),
+        ("POST", APIRouteTemplates.MAKE_TRANSFER_OPERATION): dump(
+            MakeTransferOperationResponseSchema, {"operation": data.operations[OperationType.TRANSFER]}
+        ),
+        ("POST", APIRouteTemplates.MAKE_PURCHASE_OPERATION): dump(
+            MakePurchaseOperationResponseSchema, {"operation": data.operations[OperationType.PURCHASE]}
+        ),
+        ("POST", APIRouteTemplates.MAKE_BILL_PAYMENT_OPERATION): dump(
+            MakeBillPaymentOperationResponseSchema, {"operation": data.operations[OperationType.BILL_PAYMENT]}
+        ),
+        ("POST", APIRouteTemplates.MAKE_CASH_WITHDRAWAL_OPERATION): dump(
+            MakeCashWithdrawalOperationResponseSchema, {"operation": data.operations[OperationType.CASH_WITHDRAWAL]}
+        ),
+    }
+
+
+class StandInHTTPGateway:
+    """
+    WSGI-приложение stand-in http-gateway.
+
+    Маршрут запроса приводится к шаблону через normalize_route (как имена в статистике Locust),
+    тело ответа берётся из заранее подготовленных байт. Задержка выполняется gevent.sleep,
+    поэтому медленные ответы не занимают сервер и он не становится узким местом замера.
+    """
+
+    def __init__(self, behavior: StandInBehavior, responses: dict[tuple[str, str], bytes]):
+        """
+        :param behavior: Задержка и доля ошибок.
+        :param responses: Тела ответов по ключу (HTTP-метод, шаблон маршрута).
+        """
+        self.behavior = behavior
+        self.responses = responses
+
+    def __call__(self, environ: dict, start_response: Callable) -> Iterable[bytes]:
+        body = self.responses.get((environ["REQUEST_METHOD"], normalize_route(environ["PATH_INFO"])))
+        # Тело запроса дочитывается, чтобы соединение keep-alive осталось пригодным для следующего запроса
+        environ["wsgi.input"].read()
+
+        if body is None:
+            return self.respond(start_response, "404 Not Found", NOT_FOUND_BODY)
+
+        latency = self.behavior.latency()
+        if latency:
+            gevent.sleep(latency)
+
+        if self.behavior.failed():
+            return self.respond(start_response, "500 Internal Server Error", ERROR_BODY)
+
+        return self.respond(start_response, "200 OK", body)
+
+    def respond(self, start_response: Callable, status: str, body: bytes) -> list[bytes]:
+        start_response(status, [*JSON_HEADERS, ("Content-Length", str(len(body)))])
+        return [body]
+
+
+def build_stand_in_http_gateway() -> StandInHTTPGateway:
+    """
+    Создаёт WSGI-приложение stand-in http-gateway по настройкам STAND_IN.
+    """
+    return StandInHTTPGateway(
+        behavior=build_stand_in_behavior(),
+        responses=build_http_responses(build_stand_in_data())
+    )
+
+
+class StandInWSGIServer(WSGIServer):
+    """
+    WSGI-сервер с TCP_NODELAY на принятых соединениях и поддержкой HTTP/2 без TLS.
+
+    Без TCP_NODELAY на keep-alive соединении ответ ждёт подтверждения предыдущего сегмента (Nagle +
+    delayed ACK) и каждый запрос после первого получает лишние ~40 мс.
+
+    Соединения, начинающиеся с преамбулы HTTP/2 (клиент с GATEWAY_HTTP_CLIENT.HTTP2=true, h2c
+    prior knowledge), обслуживаются тем же приложением по HTTP/2 (см. servers/h2c.py), остальные — pywsgi.
+    """
+
+    def handle(self, sock: socket.socket, address: tuple) -> None:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if is_h2c_preface(sock):
+            serve_h2c(sock, address, self.application)
+            sock.close()
+            return
+
+        super().handle(sock, address)
+
+
+def build_stand_in_http_server() -> WSGIServer:
+    """
+    Создаёт (но не запускает) HTTP-сервер stand-in gateway на STAND_IN.HOST:STAND_IN.HTTP_PORT.
+
+    Сервер отвечает и по HTTP/1.1, и по HTTP/2 без TLS (h2c prior knowledge).
+    """
+    return StandInWSGIServer(
+        (settings.stand_in.host, settings.stand_in.http_port),
+        build_stand_in_http_gateway(),
+        log=None
+    )
+
+
+def serve():
+    server = build_stand_in_http_server()
+    logger.info(f"Stand-in http-gateway is listening on {settings.stand_in.host}:{settings.stand_in.http_port}")
+    server.serve_forever()
+
+
+if __name__ == '__main__':
+    serve()
@@ -0,0 +1,65 @@
+"""
+Запуск stand-in серверов gateway отдельными процессами (для бенчмарков и калибровки генератора нагрузки).
+"""
+import os
+import socket
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+
+def wait_for_port(host: str, port: int, timeout: float = 15.0) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with socket.create_connection((host, port), timeout=1):
+                return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"Stand-in server on {host}:{port} did not start in {timeout}s")
+            time.sleep(0.1)
+
+
+@contextmanager
+def run_stand_in_servers(
+        http_address: tuple[str, int] | None = None,
+        grpc_address: tuple[str, int] | None = None
+) -> Iterator[None]:
+    """
+    Запускает stand-in серверы без задержки и ошибок и останавливает их при выходе из блока.
+
+    Серверы работают в отдельных процессах, поэтому их CPU не смешивается с CPU измеряемого клиента.
+    Остальные настройки STAND_IN (размеры ответов) берутся из окружения и .env.
+
+    :param http_address: Хост и порт stand-in http-gateway; None — не запускать.
+    :param grpc_address: Хост и порт stand-in grpc-gateway; None — не запускать.
+    """
+    servers = [
+        ("servers.http_gateway", "STAND_IN.HTTP_PORT", http_address),
+        ("servers.grpc_gateway", "STAND_IN.GRPC_PORT", grpc_address),
+    ]
+
+    processes = []
+    try:
+        for module, port_variable, address in servers:
+            if address is None:
+                continue
+
+            host, port = address
+            env = {
+                **os.environ,
+                "STAND_IN.HOST": host,
+                port_variable: str(port),
+                "STAND_IN.LATENCY_DISTRIBUTION": "constant",
+                "STAND_IN.LATENCY_MS": "0",
+                "STAND_IN.ERROR_RATE": "0",
+            }
+            processes.append(subprocess.Popen([sys.executable, "-m", module], env=env))
+            wait_for_port(host, port)
+        yield
+    finally:
+        for process in processes:
+            process.terminate()
+            process.wait()
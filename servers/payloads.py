@@ -0,0 +1,121 @@
+import base64
+import os
+import uuid
+from datetime import date, datetime, timezone
+from typing import Any
+
+from clients.http.gateway.accounts.schema import AccountStatus, AccountType
+from clients.http.gateway.cards.schema import CardPaymentSystem, CardStatus, CardType
+from clients.http.gateway.operations.schema import OperationStatus, OperationType
+from config import settings
+from tools.fakers import fake
+
+
+class StandInData:
+    """
+    Данные, которые отдают stand-in серверы gateway.
+
+    Сущности генерируются один раз при старте сервера в JSON-представлении http-gateway
+    (ключи с alias, значения enum без префиксов), а серверы строят из них готовые ответы:
+    HTTP — сериализованные схемами клиентов байты, gRPC — protobuf-сообщения.
+    Поэтому стоимость ответа не зависит от Faker и одинакова от запроса к запросу.
+    """
+
+    def __init__(self, accounts_count: int = 4, cards_per_account: int = 2, operations_count: int = 20, document_size: int = 1024):
+        """
+        :param accounts_count: Количество счетов в ответе получения списка счетов.
+        :param cards_per_account: Количество карт на каждом счёте.
+        :param operations_count: Количество операций в ответе получения списка операций.
+        :param document_size: Размер документа (тариф, договор, чек) в байтах.
+        """
+        self.user = build_user()
+        self.accounts = {
+            account_type: build_account(account_type, cards_per_account)
+            for account_type in AccountType
+        }
+        self.account_list = [
+            build_account(list(AccountType)[index % len(AccountType)], cards_per_account)
+            for index in range(accounts_count)
+        ]
+        self.cards = {card_type: build_card(card_type, self.accounts[AccountType.DEBIT_CARD]["id"]) for card_type in CardType}
+        self.operations = {operation_type: build_operation(operation_type) for operation_type in OperationType}
+        self.operation_list = [
+            build_operation(list(OperationType)[index % len(OperationType)])
+            for index in range(operations_count)
+        ]
+        self.summary = {
+            "spentAmount": fake.amount(),
+            "receivedAmount": fake.amount(),
+            "cashbackAmount": fake.amount()
+        }
+        self.document = os.urandom(document_size)
+        self.document_url = f"http://{settings.stand_in.host}:{settings.stand_in.http_port}/documents/{uuid.uuid4()}.pdf"
+
+
+def build_user() -> dict[str, Any]:
+    return {
+        "id": str(uuid.uuid4()),
+        "email": fake.email(),
+        "lastName": fake.last_name(),
+        "firstName": fake.first_name(),
+        "middleName": fake.middle_name(),
+        "phoneNumber": fake.phone_number()
+    }
+
+
+def build_card(card_type: CardType, account_id: str) -> dict[str, Any]:
+    return {
+        "id": str(uuid.uuid4()),
+        "pin": f"{fake.faker.random_int(0, 9999):04d}",
+        "cvv": f"{fake.faker.random_int(0, 999):03d}",
+        "type": card_type,
+        "status": CardStatus.ACTIVE,
+        "accountId": account_id,
+        "cardNumber": fake.faker.credit_card_number(),
+        "cardHolder": f"{fake.first_name()} {fake.last_name()}",
+        "expiryDate": date(date.today().year + 3, 12, 31).isoformat(),
+        "paymentSystem": fake.enum(CardPaymentSystem)
+    }
+
+
+def build_account(account_type: AccountType, cards_count: int) -> dict[str, Any]:
+    account_id = str(uuid.uuid4())
+    return {
+        "id": account_id,
+        "type": account_type,
+        "cards": [build_card(list(CardType)[index % len(CardType)], account_id) for index in range(cards_count)],
+        "status": AccountStatus.ACTIVE,
+        "balance": fake.amount()
+    }
+
+
+def build_operation(operation_type: OperationType) -> dict[str, Any]:
+    return {
+        "id": str(uuid.uuid4()),
+        "type": operation_type,
+        "status": OperationStatus.COMPLETED,
+        "amount": fake.amount(),
+        "cardId": str(uuid.uuid4()),
+        "category": fake.category(),
+        "createdAt": datetime.now(timezone.utc).isoformat(),
+        "accountId": str(uuid.uuid4())
+    }
+
+
+def build_document(data: StandInData) -> dict[str, str]:
+    """
+    Документ в JSON-представлении http-gateway: содержимое передаётся в base64.
+    """
+    return {"url": data.document_url, "document": base64.b64encode(data.document).decode()}
+
+
+def build_stand_in_data() -> StandInData:
+    """
+    Создаёт данные stand-in серверов по настройкам STAND_IN.
+    """
+    return StandInData(
+        accounts_count=settings.stand_in.accounts_count,
+        cards_per_account=settings.stand_in.cards_per_account,
+        operations_count=settings.stand_in.operations_count,
+        document_size=settings.stand_in.document_size
+    )
@@ -0,0 +1,13 @@
+from pydantic import BaseModel
+
+
+class FakersConfig(BaseModel):
+    # Брать ли тестовые данные из заранее сгенерированных пулов вместо вызова Faker на каждый запрос
+    pooled: bool = True
+
+    # Размер кольцевого буфера каждого пула (значений одного вида). Пулы заполняются в init без уступок
+    # управления (~0.1 мс на значение Faker), поэтому большой размер задерживает старт воркера
+    pool_size: int = 1_000
+
+    # Как часто (в секундах) фоновая greenlet Locust готовит новые поколения значений для пулов
+    refill_interval: float = 30.0
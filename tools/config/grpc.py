@@ -1,6 +1,15 @@
+from enum import StrEnum
+
 from pydantic import BaseModel
 
 
+class GRPCChannelPoolStrategy(StrEnum):
+    # Каналы выдаются по кругу
+    ROUND_ROBIN = "round_robin"
+    # Выдаётся канал, на котором сейчас меньше всего клиентов
+    LEAST_LOADED = "least_loaded"
+
+
 class GRPCClientConfig(BaseModel):
     # Порт gRPC-сервиса, к которому подключаемся (например, 9003)
     port: int
@@ -8,6 +17,13 @@ class GRPCClientConfig(BaseModel):
     # Хост (например, localhost или grpc-gateway.internal)
     host: str
 
+    # Сколько каналов (HTTP/2-соединений) держит процесс Locust для всех виртуальных пользователей.
+    # 0 — старое поведение: отдельный канал на каждый клиент.
+    channel_pool_size: int = 4
+
+    # Как клиенты распределяются по каналам пула
+    channel_pool_strategy: GRPCChannelPoolStrategy = GRPCChannelPoolStrategy.ROUND_ROBIN
+
     @property
     def client_url(self) -> str:
         """
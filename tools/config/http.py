@@ -1,4 +1,38 @@
-from pydantic import BaseModel, HttpUrl
+from enum import StrEnum
+
+from pydantic import BaseModel, HttpUrl, model_validator
+
+
+class HTTPConnectionModel(StrEnum):
+    # Один httpx.Client (и один пул соединений) на весь процесс Locust
+    SHARED = "shared"
+    # Отдельный httpx.Client на каждого виртуального пользователя, общий для всех его API-клиентов
+    PER_USER = "per_user"
+
+
+class HTTPTransportBackend(StrEnum):
+    # Стандартный транспорт httpx (httpcore, чистый Python, поддерживает HTTP/2)
+    HTTPX = "httpx"
+    # Транспорт на geventhttpclient (C-парсер, только HTTP/1.1) — дешевле по CPU под gevent
+    GEVENT = "gevent"
+
+
+class ResponseValidation(StrEnum):
+    # Полная валидация каждого ответа Pydantic-моделью
+    FULL = "full"
+    # Полная валидация 1 ответа из N, остальные — structural
+    SAMPLED = "sampled"
+    # Только разбор JSON и проверка обязательных полей, без приведения типов
+    STRUCTURAL = "structural"
+    # Без разбора заранее: JSON разбирается только при первом обращении к полю ответа
+    NONE = "none"
+
+
+class JSONCodecBackend(StrEnum):
+    # pydantic-core (Rust): всегда доступен вместе с Pydantic
+    PYDANTIC = "pydantic"
+    # orjson: быстрее разбирает JSON без валидации (необязательная зависимость)
+    ORJSON = "orjson"
 
 
 class HTTPClientConfig(BaseModel):
@@ -8,6 +42,49 @@ class HTTPClientConfig(BaseModel):
     # Таймаут для запросов в секундах (по умолчанию 100)
     timeout: float = 100.0
 
+    # Модель соединений нагрузочного клиента. per_user повторяет поведение браузеров и мобильных клиентов;
+    # в shared пул из max_connections соединений делят все пользователи процесса, и при нехватке соединений
+    # запросы ждут в очереди генератора, а ожидание попадает во время ответа gateway
+    connection_model: HTTPConnectionModel = HTTPConnectionModel.PER_USER
+
+    # Транспорт нагрузочного клиента. gevent работает только по HTTP/1.1 (HTTP2=true с ним — ошибка настроек),
+    # лимит соединений и POOL_TIMEOUT действуют, а MAX_KEEPALIVE_CONNECTIONS и KEEPALIVE_EXPIRY — нет
+    transport: HTTPTransportBackend = HTTPTransportBackend.HTTPX
+
+    # Использовать HTTP/2: запросы мультиплексируются потоками поверх небольшого числа соединений
+    http2: bool = False
+
+    # Максимум одновременных соединений в пуле (для per_user — на одного виртуального пользователя)
+    max_connections: int = 100
+
+    # Сколько секунд запрос ждёт свободное соединение пула. По истечении задача падает с PoolTimeout
+    # (видно в исключениях Locust), а не растягивает время ответа до общего таймаута
+    pool_timeout: float = 5.0
+
+    # Сколько простаивающих keep-alive соединений держать открытыми
+    max_keepalive_connections: int = 20
+
+    # Через сколько секунд простоя keep-alive соединение закрывается
+    keepalive_expiry: float = 5.0
+
+    # Уровень валидации ответов в нагрузочных клиентах (сценарий может переопределить его в TaskSet)
+    response_validation: ResponseValidation = ResponseValidation.FULL
+
+    # Для sampled: полностью валидируется 1 ответ из N
+    response_validation_sample_rate: int = 10
+
+    # Кодек JSON для тел запросов и разбора ответов без полной валидации
+    json_codec: JSONCodecBackend = JSONCodecBackend.PYDANTIC
+
+    # Трассировать ли установку соединения (фаза connect в context событий Locust)
+    trace_phases: bool = False
+
+    # Сколько событий запросов копить перед отправкой в Locust (0 — отправлять каждое сразу)
+    metrics_batch_size: int = 0
+
+    # Как часто (в секундах) отправлять в Locust неполную пачку событий
+    metrics_flush_interval: float = 1.0
+
     @property
     def client_url(self) -> str:
         """
@@ -20,4 +97,26 @@ class HTTPClientConfig(BaseModel):
         """
         return str(self.url)
 
+    @property
+    def http1(self) -> bool:
+        """
+        Разрешён ли HTTP/1.1.
+
+        По https версия протокола согласуется через ALPN. По http согласования нет,
+        поэтому в режиме HTTP/2 клиент сразу говорит на HTTP/2 (prior knowledge, h2c),
+        иначе httpx молча остался бы на HTTP/1.1.
+        """
+        return not (self.http2 and self.url.scheme == "http")
+
+    @model_validator(mode="after")
+    def check_transport(self) -> "HTTPClientConfig":
+        """
+        geventhttpclient умеет только HTTP/1.1, а httpx с собственным транспортом молча игнорирует http2,
+        поэтому такая комбинация запускала бы тест по HTTP/1.1 под видом HTTP/2.
+        """
+        if self.transport == HTTPTransportBackend.GEVENT and self.http2:
+            raise ValueError("TRANSPORT=gevent supports only HTTP/1.1, set HTTP2=false or TRANSPORT=httpx")
+
+        return self
+
 
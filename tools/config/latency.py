@@ -0,0 +1,18 @@
+from pydantic import BaseModel
+
+
+class LatencyConfig(BaseModel):
+    # Записывать ли время ответа в HDR-гистограммы по маршрутам (в дополнение к статистике Locust)
+    hdr_histograms: bool = False
+
+    # Точность гистограмм — количество значащих цифр (1..5)
+    hdr_significant_figures: int = 3
+
+    # Максимальное записываемое время ответа в секундах (большие значения записываются как максимум)
+    hdr_highest_trackable: float = 60.0
+
+    # Ожидаемый интервал между запросами в мс для коррекции coordinated omission в закрытой модели (0 — выключено)
+    hdr_expected_interval: float = 0
+
+    # Каталог, куда мастер (или локальный процесс) сохраняет гистограммы по окончании теста
+    hdr_report_dir: str = "reports/hdr"
@@ -1,9 +1,45 @@
+from enum import StrEnum
+
 from pydantic import BaseModel
 
 
+class LocustLoadModel(StrEnum):
+    # Закрытая модель: каждый виртуальный пользователь ждёт ответа и паузу между задачами
+    CLOSED = "closed"
+    # Открытая модель: задачи запускаются с заданной частотой независимо от времени ответа
+    OPEN = "open"
+
+
+class ArrivalRateMode(StrEnum):
+    # Запуски через равные интервалы 1 / arrival_rate
+    CONSTANT = "constant"
+    # Частота линейно меняется от arrival_rate до arrival_rate_end за arrival_ramp_duration, затем держится
+    RAMP = "ramp"
+    # Пуассоновский поток: экспоненциальные интервалы со средней частотой arrival_rate
+    POISSON = "poisson"
+
+
 class LocustUserConfig(BaseModel):
     # Минимальное время ожидания между задачами (в секундах)
     wait_time_min: float = 1
 
     # Максимальное время ожидания между задачами (в секундах)
     wait_time_max: float = 3
+
+    # Модель нагрузки. В открытой модели -u задаёт пул виртуальных пользователей (максимум одновременных задач)
+    load_model: LocustLoadModel = LocustLoadModel.CLOSED
+
+    # Целевая частота запуска задач в секунду — суммарно на весь запуск (делится между воркерами)
+    arrival_rate: float = 10
+
+    # Форма потока запусков
+    arrival_rate_mode: ArrivalRateMode = ArrivalRateMode.CONSTANT
+
+    # Конечная частота для режима ramp
+    arrival_rate_end: float = 100
+
+    # Длительность разгона для режима ramp (в секундах)
+    arrival_ramp_duration: float = 60
+
+    # На сколько секунд запуск может опоздать (все пользователи пула заняты), прежде чем он считается пропущенным
+    arrival_tolerance: float = 0.1
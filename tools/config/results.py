@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+
+
+class ResultsConfig(BaseModel):
+    # Сохранять ли статистику каждого запуска в локальную базу результатов (SQLite)
+    store: bool = False
+
+    # Путь к файлу базы результатов (общий для всех сценариев)
+    path: str = "reports/results.sqlite3"
+
+    # Длина интервала статистики по маршрутам в секундах
+    interval: float = 10.0
@@ -0,0 +1,33 @@
+from enum import StrEnum
+
+from pydantic import BaseModel
+
+
+class SaturationAction(StrEnum):
+    # Предупреждение в логе, пометка в профиле отчёта report.html и JSON-отчёт
+    FLAG = "flag"
+    # То же, плюс запись в исключениях Locust (вкладка Exceptions в report.html) и код завершения 1
+    FAIL = "fail"
+
+
+class SaturationConfig(BaseModel):
+    # Следить ли за насыщением генератора нагрузки: CPU процесса Locust и задержка цикла событий gevent
+    guard: bool = False
+
+    # Период замера в секундах (каждый замер — загрузка CPU и максимальная задержка цикла за период)
+    sample_interval: float = 1.0
+
+    # Порог загрузки CPU процесса в процентах одного ядра (цикл gevent однопоточный)
+    cpu_threshold: float = 90
+
+    # Порог задержки цикла gevent в мс: настолько позже запланированного просыпается greenlet
+    loop_lag_threshold: float = 50
+
+    # Доля замеров сверх порога, начиная с которой воркер считается насыщенным (0.05 — 5% времени теста)
+    tolerance: float = 0.05
+
+    # Что делать с насыщенным запуском
+    action: SaturationAction = SaturationAction.FLAG
+
+    # Каталог, куда мастер (или локальный процесс) сохраняет отчёт о насыщении по окончании теста
+    report_dir: str = "reports/saturation"
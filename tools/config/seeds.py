@@ -0,0 +1,55 @@
+from enum import StrEnum
+
+from pydantic import BaseModel
+
+
+class SeedsLoader(StrEnum):
+    # Полная загрузка JSON-дампа в Pydantic-модели
+    MODEL = "model"
+    # Ленивая загрузка: JSONL-дамп отображается в память (mmap), пользователи разбираются при обращении
+    LAZY = "lazy"
+    # Компактная загрузка: идентификаторы в плоских массивах с таблицами смещений
+    COMPACT = "compact"
+
+
+class SeedsDispenserStrategy(StrEnum):
+    # Случайный пользователь на каждый запрос
+    RANDOM = "random"
+    # Пользователи выдаются по кругу
+    ROUND_ROBIN = "round_robin"
+    # Пользователь выдаётся одному виртуальному пользователю и возвращается в on_stop
+    EXCLUSIVE = "exclusive"
+    # Взвешенный случайный выбор с «горячими» пользователями (распределение Ципфа)
+    WEIGHTED = "weighted"
+    # Виртуальный пользователь закрепляется за одним пользователем сидинга
+    STICKY = "sticky"
+
+
+class SeedsConfig(BaseModel):
+    # Сколько пользователей сидинга создаётся одновременно.
+    # Цепочка внутри одного пользователя (user -> account -> cards -> operations)
+    # всегда выполняется последовательно, параллелятся только разные пользователи.
+    # Значение 1 включает строго последовательный режим.
+    concurrency: int = 10
+
+    # Каталог дампов сидинга (результат, построчный дамп, чекпоинт, метаданные)
+    dumps_dir: str = "./dumps"
+
+    # Переиспользовать ли уже сохранённый дамп, если он создан для того же плана и того же gateway
+    cache: bool = True
+
+    # Сколько секунд сохранённый дамп считается актуальным (данные на стенде могут быть удалены)
+    cache_ttl: float = 3600
+
+    # Способ загрузки результата сидинга в процессы Locust
+    loader: SeedsLoader = SeedsLoader.MODEL
+
+    # Стратегия раздачи пользователей сидинга виртуальным пользователям.
+    # Если не задана, используется стратегия по умолчанию конкретного сценария.
+    dispenser: SeedsDispenserStrategy | None = None
+
+    # Сколько секунд ждать возврата пользователя при стратегии exclusive, если свободных нет
+    dispenser_timeout: float = 0
+
+    # Перекос распределения Ципфа для стратегии weighted (0 — равномерно)
+    dispenser_skew: float = 1.0
@@ -0,0 +1,34 @@
+from enum import StrEnum
+
+from pydantic import BaseModel
+
+
+class LatencyDistribution(StrEnum):
+    CONSTANT = "constant"  # Всегда STAND_IN.LATENCY_MS
+    UNIFORM = "uniform"  # Равномерно в LATENCY_MS ± LATENCY_SPREAD_MS
+    EXPONENTIAL = "exponential"  # Экспоненциально со средним LATENCY_MS
+    LOGNORMAL = "lognormal"  # Логнормально с медианой LATENCY_MS и параметром LATENCY_SIGMA (длинный хвост)
+
+
+class StandInConfig(BaseModel):
+    # Адрес, на котором слушают stand-in серверы gateway (servers/)
+    host: str = "127.0.0.1"
+
+    # Порты по умолчанию совпадают с http-gateway и grpc-gateway, чтобы клиенты работали без перенастройки
+    http_port: int = 8003
+    grpc_port: int = 9003
+
+    # Распределение искусственной задержки ответа и его параметры в миллисекундах
+    latency_distribution: LatencyDistribution = LatencyDistribution.CONSTANT
+    latency_ms: float = 0.0
+    latency_spread_ms: float = 0.0
+    latency_sigma: float = 0.5
+
+    # Доля ответов с ошибкой (HTTP 500 / gRPC INTERNAL), от 0 до 1
+    error_rate: float = 0.0
+
+    # Размеры ответов: число счетов в списке, карт на счёт, операций в списке и размер документа в байтах
+    accounts_count: int = 4
+    cards_per_account: int = 2
+    operations_count: int = 20
+    document_size: int = 1024
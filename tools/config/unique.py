@@ -0,0 +1,13 @@
+from pydantic import BaseModel
+
+
+class UniqueConfig(BaseModel):
+    # Номер генератора уникальных ключей (0..1023). Если не задан, в распределённом запуске Locust
+    # он берётся из номера воркера (мастер — 0, воркер — его номер + 1), в локальном запуске
+    # Locust и вне Locust — из PID процесса.
+    worker_id: int | None = None
+
+    # Каталог, где по каждому номеру генератора хранится граница выданных номеров телефонов:
+    # повторный запуск с тем же номером не выдаст номера, уже выданные прошлым запуском.
+    # Пустое значение отключает сохранение
+    state_dir: str = "./.unique"
@@ -1,9 +1,34 @@
-import time
+import random
+from typing import Any, Callable, Hashable
 
 from faker import Faker
 from faker.providers.python import TEnum
 from google.protobuf.internal.enum_type_wrapper import EnumTypeWrapper
 
+from config import settings
+from tools.unique import unique
+
+# Категории покупок, из которых выбирает Fake.category
+CATEGORIES = [
+    "gas",
+    "taxi",
+    "tolls",
+    "water",
+    "beauty",
+    "mobile",
+    "travel",
+    "parking",
+    "catalog",
+    "internet",
+    "satellite",
+    "education",
+    "government",
+    "healthcare",
+    "restaurants",
+    "electricity",
+    "supermarkets",
+]
+
 
 class Fake:
     """
@@ -36,12 +61,13 @@ class Fake:
 
     def email(self) -> str:
         """
-        Генерирует случайный email.
+        Генерирует уникальный email.
 
-        Если не указан, будет использован случайный домен.
-        :return: Случайный email.
+        Уникальность обеспечивает префикс из генератора ключей (tools/unique.py),
+        а не время: email не совпадут ни в одном такте часов, ни на разных воркерах.
+        :return: Уникальный email.
         """
-        return f"{time.time()}.{self.faker.email()}"
+        return f"{unique.next_key()}.{self.faker.email()}"
 
     def category(self) -> str:
         """
@@ -52,25 +78,7 @@ class Fake:
 
         :return: Случайная категория (например, 'gas', 'taxi', 'supermarkets' и т.д.).
         """
-        return self.faker.random_element([
-            "gas",
-            "taxi",
-            "tolls",
-            "water",
-            "beauty",
-            "mobile",
-            "travel",
-            "parking",
-            "catalog",
-            "internet",
-            "satellite",
-            "education",
-            "government",
-            "healthcare",
-            "restaurants",
-            "electricity",
-            "supermarkets",
-        ])
+        return self.faker.random_element(CATEGORIES)
 
     def last_name(self) -> str:
         """
@@ -98,11 +106,11 @@ class Fake:
 
     def phone_number(self) -> str:
         """
-        Генерирует случайный номер телефона.
+        Генерирует уникальный номер телефона из генератора ключей (tools/unique.py).
 
-        :return: Случайный номер телефона.
+        :return: Уникальный номер телефона в формате E.164 (не длиннее 15 цифр).
         """
-        return self.faker.phone_number()
+        return unique.next_phone_number()
 
     def float(self, start: int = 1, end: int = 100) -> float:
         """
@@ -123,5 +131,141 @@ class Fake:
         return self.float(1, 1000)
 
 
-# Создаем экземпляр класса Fake с использованием Faker
-fake = Fake(faker=Faker())
+class FakePool:
+    """
+    Кольцевой буфер заранее сгенерированных значений одного вида.
+
+    Выдача значения — чтение по индексу без вызова Faker. Когда буфер пройден целиком,
+    на его место встаёт следующее поколение, подготовленное через refill() (вне пути запроса);
+    если оно не готово, значения идут по кругу повторно.
+    """
+    __slots__ = ("generate", "size", "values", "spare", "cursor")
+
+    # По сколько значений генерировать за раз при пополнении, уступая управление между порциями
+    REFILL_CHUNK = 500
+
+    def __init__(self, generate: Callable[[int], list[Any]], size: int):
+        """
+        :param generate: Функция, создающая список из заданного количества значений.
+        :param size: Размер буфера.
+        """
+        self.generate = generate
+        self.size = size
+        self.values = generate(size)
+        self.spare: list[Any] | None = None
+        self.cursor = 0
+
+    def next(self) -> Any:
+        value = self.values[self.cursor]
+        self.cursor += 1
+        if self.cursor == self.size:
+            self.cursor = 0
+            if self.spare is not None:
+                self.values, self.spare = self.spare, None
+        return value
+
+    def refill(self, pause: Callable[[], None] | None = None) -> None:
+        """
+        Готовит следующее поколение значений, если оно ещё не подготовлено.
+
+        :param pause: Вызывается между порциями генерации (например, gevent.sleep), чтобы не занимать цикл надолго.
+        """
+        if self.spare is not None:
+            return
+
+        spare: list[Any] = []
+        while len(spare) < self.size:
+            spare.extend(self.generate(min(self.REFILL_CHUNK, self.size - len(spare))))
+            if pause is not None:
+                pause()
+        self.spare = spare
+
+
+class PooledFake(Fake):
+    """
+    Fake, выдающий значения из пулов (FakePool), заполненных пачками заранее.
+
+    Интерфейс совпадает с Fake, поэтому схемы Pydantic (default_factory) и gRPC-клиенты
+    используют его без изменений. Простые значения (суммы, категории, enum) генерируются
+    пачкой через random.choices/random.uniform, значения Faker (имена, телефоны, email) —
+    циклом по Faker, но один раз на пачку, а не на каждый запрос. Уникальные значения
+    (префикс email, телефон) пулам не подлежат и берутся из генератора ключей.
+    """
+
+    def __init__(self, faker: Faker, size: int):
+        """
+        :param faker: Экземпляр Faker для генерации значений пулов.
+        :param size: Размер каждого пула.
+        """
+        super().__init__(faker)
+        self.size = size
+        self.pools: dict[Hashable, FakePool] = {}
+
+    def pool(self, key: Hashable, generate: Callable[[int], list[Any]]) -> FakePool:
+        """
+        Возвращает пул по ключу, создавая его при первом обращении.
+        """
+        pool = self.pools.get(key)
+        if pool is None:
+            pool = self.pools[key] = FakePool(generate, self.size)
+        return pool
+
+    def warm_up(self) -> None:
+        """
+        Заполняет пулы значений Faker заранее, чтобы первые запросы не ждали генерации пачки.
+        """
+        self.email(), self.first_name(), self.last_name(), self.category(), self.amount()
+
+    def refill(self, pause: Callable[[], None] | None = None) -> None:
+        """
+        Готовит следующее поколение значений для всех пулов.
+
+        :param pause: Вызывается между порциями генерации (см. FakePool.refill).
+        """
+        for pool in list(self.pools.values()):
+            pool.refill(pause)
+
+    def enum(self, value: type[TEnum]) -> TEnum:
+        return self.pool(value, lambda count: random.choices(list(value), k=count)).next()
+
+    def proto_enum(self, value: EnumTypeWrapper) -> int:
+        return self.pool(value, lambda count: random.choices(value.values(), k=count)).next()
+
+    def email(self) -> str:
+        emails = self.pool("email", lambda count: [self.faker.email() for _ in range(count)])
+        return f"{unique.next_key()}.{emails.next()}"
+
+    def category(self) -> str:
+        return self.pool("category", lambda count: random.choices(CATEGORIES, k=count)).next()
+
+    def last_name(self) -> str:
+        return self.pool("last_name", lambda count: [self.faker.last_name() for _ in range(count)]).next()
+
+    def first_name(self) -> str:
+        return self.pool("first_name", lambda count: [self.faker.first_name() for _ in range(count)]).next()
+
+    def middle_name(self) -> str:
+        # Отчество генерируется так же, как имя (см. Fake.middle_name), поэтому пул общий
+        return self.first_name()
+
+    def float(self, start: int = 1, end: int = 100) -> float:
+        return self.pool(
+            ("float", start, end),
+            lambda count: [round(random.uniform(start, end), 2) for _ in range(count)]
+        ).next()
+
+
+def build_fake() -> Fake:
+    """
+    Создаёт генератор тестовых данных согласно настройкам FAKERS.
+
+    :return: PooledFake, если включены пулы, иначе Fake.
+    """
+    if settings.fakers.pooled:
+        return PooledFake(faker=Faker(), size=settings.fakers.pool_size)
+
+    return Fake(faker=Faker())
+
+
+# Создаем экземпляр генератора тестовых данных с использованием Faker
+fake = build_fake()
@@ -0,0 +1,119 @@
+from contextvars import ContextVar
+
+from hdrh.histogram import HdrHistogram
+
+# Опоздание запуска текущей задачи относительно запланированного момента (мс).
+# Выставляется расписанием открытой модели (tools/locust/arrival.py) в greenlet виртуального
+# пользователя и читается хуками HTTP и интерцептором gRPC при старте запроса.
+LAUNCH_LAG: ContextVar[float] = ContextVar("launch_lag", default=0.0)
+
+
+class RouteLatencyHistograms:
+    """
+    Пара HDR-гистограмм одного маршрута: измеренное время ответа и время с коррекцией
+    coordinated omission. Значения хранятся в микросекундах.
+    """
+    __slots__ = ("uncorrected", "corrected")
+
+    def __init__(self, highest_trackable: int, significant_figures: int):
+        self.uncorrected = HdrHistogram(1, highest_trackable, significant_figures)
+        self.corrected = HdrHistogram(1, highest_trackable, significant_figures)
+
+
+class LatencyHistograms:
+    """
+    HDR-гистограммы времени ответа по маршрутам (ключ — "<request_type> <name>", как в статистике Locust).
+
+    В отличие от статистики Locust значения не округляются до крупных корзин, а гистограммы
+    разных процессов складываются без потери точности (encode/merge), поэтому перцентили
+    хвоста (p99, p99.9) на мастере совпадают с перцентилями объединённых данных.
+
+    Коррекция coordinated omission:
+    - открытая модель: к времени ответа прибавляется опоздание запуска (launch_lag),
+      то есть задержка считается от запланированного, а не от фактического старта;
+    - закрытая модель: при заданном expected_interval пропущенные из-за долгого ответа
+      запросы восстанавливаются HdrHistogram.record_corrected_value.
+    """
+
+    def __init__(self, significant_figures: int = 3, highest_trackable: float = 60.0, expected_interval: float = 0):
+        """
+        :param significant_figures: Точность гистограмм (значащие цифры).
+        :param highest_trackable: Максимальное записываемое значение в секундах.
+        :param expected_interval: Ожидаемый интервал между запросами в мс (0 — без коррекции закрытой модели).
+        """
+        self.significant_figures = significant_figures
+        self.highest_trackable = int(highest_trackable * 1_000_000)
+        self.expected_interval = int(expected_interval * 1000)
+        self.routes: dict[str, RouteLatencyHistograms] = {}
+
+    def get(self, key: str) -> RouteLatencyHistograms:
+        histograms = self.routes.get(key)
+        if histograms is None:
+            histograms = self.routes[key] = RouteLatencyHistograms(self.highest_trackable, self.significant_figures)
+        return histograms
+
+    def record(self, key: str, response_time: float, launch_lag: float = 0.0) -> None:
+        """
+        Записывает время ответа маршрута.
+
+        :param key: Маршрут ("<request_type> <name>").
+        :param response_time: Измеренное время ответа в мс.
+        :param launch_lag: Опоздание запуска в мс (открытая модель).
+        """
+        histograms = self.get(key)
+        value = min(max(int(response_time * 1000), 1), self.highest_trackable)
+        corrected = min(value + int(launch_lag * 1000), self.highest_trackable)
+
+        histograms.uncorrected.record_value(value)
+        if self.expected_interval > 0:
+            histograms.corrected.record_corrected_value(corrected, self.expected_interval)
+        else:
+            histograms.corrected.record_value(corrected)
+
+    def encode(self) -> dict[str, dict[str, str]]:
+        """
+        Сериализует гистограммы в сжатый формат HdrHistogram (base64), пригодный для передачи и сохранения.
+        """
+        return {
+            key: {
+                "uncorrected": histograms.uncorrected.encode().decode(),
+                "corrected": histograms.corrected.encode().decode(),
+            }
+            for key, histograms in self.routes.items()
+        }
+
+    def merge(self, encoded: dict[str, dict[str, str]]) -> None:
+        """
+        Добавляет гистограммы, сериализованные encode() (например, присланные воркером).
+        """
+        for key, data in encoded.items():
+            histograms = self.get(key)
+            histograms.uncorrected.decode_and_add(data["uncorrected"])
+            histograms.corrected.decode_and_add(data["corrected"])
+
+    def reset(self) -> None:
+        self.routes.clear()
+
+    def summary(self, percentiles: tuple[float, ...] = (50, 90, 99, 99.9)) -> list[str]:
+        """
+        Строки с перцентилями (мс) по маршрутам: измеренные и с коррекцией.
+        """
+        lines = [
+            f"{'Route':<60} {'Count':>8} "
+            + " ".join(f"{'p' + format(p, 'g'):>16}" for p in percentiles)
+            + f" {'max':>16}"
+        ]
+        for key in sorted(self.routes):
+            histograms = self.routes[key]
+            values = [
+                f"{histograms.uncorrected.get_value_at_percentile(p) / 1000:>7.1f}/"
+                f"{histograms.corrected.get_value_at_percentile(p) / 1000:<8.1f}"
+                for p in percentiles
+            ]
+            maximum = (
+                f"{histograms.uncorrected.get_max_value() / 1000:>7.1f}/"
+                f"{histograms.corrected.get_max_value() / 1000:<8.1f}"
+            )
+            lines.append(f"{key:<60} {histograms.uncorrected.get_total_count():>8} {' '.join(values)} {maximum}")
+
+        return lines
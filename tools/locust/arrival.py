@@ -0,0 +1,304 @@
+import random
+import time
+from typing import Any, Callable
+
+from locust import User
+from locust.env import Environment
+from locust.rpc import Message
+from locust.runners import MasterRunner, WorkerRunner
+
+from config import settings
+from logger import get_logger
+from tools.config.locust import ArrivalRateMode
+from tools.latency import LAUNCH_LAG
+
+# Тип сообщения, которым мастер сообщает воркеру его долю общей частоты запусков
+ARRIVAL_RATE_SHARE_MESSAGE = "arrival_rate_share"
+
+# Ключ, под которым воркер отправляет мастеру счётчики запусков в отчёте статистики
+ARRIVAL_REPORT_KEY = "arrival"
+
+logger = get_logger("LOCUST_ARRIVAL")
+
+
+class ArrivalStats:
+    """
+    Счётчики открытой модели: состоявшиеся и пропущенные запуски задач.
+
+    Пропуски считаются отдельно от статистики запросов Locust: это не запросы, и в числе
+    неудач они исказили бы долю ошибок и срабатывание --exit-code-on-error.
+    """
+
+    def __init__(self):
+        self.launched = 0
+        self.missed = 0
+
+    @property
+    def missed_ratio(self) -> float:
+        scheduled = self.launched + self.missed
+        return self.missed / scheduled if scheduled else 0.0
+
+    def encode(self) -> dict[str, int]:
+        return {"launched": self.launched, "missed": self.missed}
+
+    def merge(self, data: dict[str, int]) -> None:
+        self.launched += data.get("launched", 0)
+        self.missed += data.get("missed", 0)
+
+
+class ArrivalScheduler:
+    """
+    Расписание запусков задач для открытой модели нагрузки (один на процесс Locust).
+
+    Расписание — это последовательность запланированных моментов (слотов) с заданной частотой.
+    Освободившийся виртуальный пользователь забирает ближайший слот и ждёт до него, поэтому
+    частота запусков не зависит от времени ответа. Если слот прошёл больше чем на tolerance
+    секунд, а свободных пользователей не было, он считается пропущенным и учитывается в stats.
+    """
+
+    def __init__(
+            self,
+            mode: ArrivalRateMode,
+            rate: float,
+            rate_end: float,
+            ramp_duration: float,
+            tolerance: float
+    ):
+        """
+        :param mode: Форма потока запусков.
+        :param rate: Частота запусков в секунду (для ramp — начальная).
+        :param rate_end: Конечная частота для режима ramp.
+        :param ramp_duration: Длительность разгона для режима ramp в секундах.
+        :param tolerance: Допустимое опоздание запуска в секундах.
+        """
+        self.mode = mode
+        self.rate = rate
+        self.rate_end = rate_end
+        self.ramp_duration = ramp_duration
+        self.tolerance = tolerance
+        # Доля общей частоты, приходящаяся на этот процесс (в распределённом запуске её присылает мастер)
+        self.share = 1.0
+        self.started_at: float | None = None
+        self.next_slot: float | None = None
+        # Счётчики текущего теста и ещё не отправленные мастеру (сбрасываются в разные моменты)
+        self.stats = ArrivalStats()
+        self.unreported = ArrivalStats()
+
+    def set_share(self, share: float) -> None:
+        """
+        Меняет долю частоты процесса во время теста.
+
+        Уже запланированный слот рассчитан по прежней частоте, поэтому при её росте
+        он переносится не дальше одного интервала по новой частоте.
+        """
+        self.share = share
+        if self.next_slot is not None:
+            now = time.monotonic()
+            self.next_slot = min(self.next_slot, now + 1 / self.rate_at(now - self.started_at))
+
+    def reset(self) -> None:
+        self.started_at = None
+        self.next_slot = None
+        self.stats = ArrivalStats()
+
+    def rate_at(self, elapsed: float) -> float:
+        """
+        Частота запусков этого процесса через elapsed секунд после начала теста.
+        """
+        rate = self.rate
+        if self.mode == ArrivalRateMode.RAMP:
+            progress = min(elapsed / self.ramp_duration, 1.0) if self.ramp_duration > 0 else 1.0
+            rate = self.rate + (self.rate_end - self.rate) * progress
+
+        return max(rate * self.share, 1e-3)
+
+    def advance(self) -> None:
+        rate = self.rate_at(self.next_slot - self.started_at)
+        interval = random.expovariate(rate) if self.mode == ArrivalRateMode.POISSON else 1 / rate
+        self.next_slot += interval
+
+    def claim(self) -> tuple[float, int]:
+        """
+        Забирает ближайший слот, пропуская те, что безнадёжно опоздали.
+
+        :return: Запланированный момент запуска (time.monotonic) и количество пропущенных перед ним слотов.
+        """
+        now = time.monotonic()
+        if self.next_slot is None:
+            self.started_at = self.next_slot = now
+
+        missed = 0
+        while self.next_slot < now - self.tolerance:
+            missed += 1
+            self.advance()
+
+        slot = self.next_slot
+        self.advance()
+        for stats in (self.stats, self.unreported):
+            stats.launched += 1
+            stats.missed += missed
+        return slot, missed
+
+
+def build_arrival_scheduler() -> ArrivalScheduler:
+    """
+    Создаёт расписание запусков по настройкам LOCUST_USER.
+    """
+    return ArrivalScheduler(
+        mode=settings.locust_user.arrival_rate_mode,
+        rate=settings.locust_user.arrival_rate,
+        rate_end=settings.locust_user.arrival_rate_end,
+        ramp_duration=settings.locust_user.arrival_ramp_duration,
+        tolerance=settings.locust_user.arrival_tolerance
+    )
+
+
+def get_arrival_scheduler(environment: Environment) -> ArrivalScheduler:
+    """
+    Возвращает расписание запусков процесса (создаёт его при первом обращении).
+    """
+    scheduler = getattr(environment, "arrival_scheduler", None)
+    if scheduler is None:
+        scheduler = environment.arrival_scheduler = build_arrival_scheduler()
+
+    return scheduler
+
+
+def check_missed_launches(environment: Environment, stats: ArrivalStats) -> None:
+    """
+    Пишет итог открытой модели в лог и, если были пропущенные запуски, помечает запуск.
+
+    Итог доступен следующим обработчикам test_stop как environment.arrival_report
+    (база результатов сохраняет число пропусков запуска).
+
+    :param environment: Среда выполнения Locust.
+    :param stats: Счётчики всего запуска (в распределённом — сумма отчётов воркеров, полученных к test_stop).
+    """
+    environment.arrival_report = stats.encode()
+    if not stats.launched and not stats.missed:
+        return
+
+    logger.info(f"Open model: {stats.launched} launches, {stats.missed} missed")
+    if not stats.missed:
+        return
+
+    message = (
+        f"Open model missed {stats.missed} of {stats.launched + stats.missed} scheduled launches "
+        f"({stats.missed_ratio:.1%}): all virtual users were busy"
+    )
+    logger.warning(f"{message}. The achieved rate is below LOCUST_USER.ARRIVAL_RATE, raise the number of users")
+    # Профиль выводится в шапке report.html, поэтому пометка попадает в отчёт без изменения статистики запросов
+    environment.profile = f"{environment.profile} | {message}" if environment.profile else message
+
+
+def arrival_rate() -> Callable[[User], float]:
+    """
+    Функция ожидания (wait_time) для открытой модели нагрузки.
+
+    Вместо паузы после задачи виртуальный пользователь ждёт ближайшего слота общего
+    расписания процесса. Запланированное время запуска сохраняется в `user.intended_start`
+    (time.monotonic), а опоздание запуска — в LAUNCH_LAG, откуда его берут хуки метрик
+    для коррекции coordinated omission.
+
+    :return: Функция, вычисляющая паузу до следующего запуска.
+    """
+
+    def wait_time(user: User) -> float:
+        slot, _ = get_arrival_scheduler(user.environment).claim()
+        user.intended_start = slot
+        delay = slot - time.monotonic()
+        # Если слот уже прошёл, задача стартует сразу, но с опозданием относительно расписания
+        LAUNCH_LAG.set(max(-delay, 0.0) * 1000)
+        return max(delay, 0.0)
+
+    return wait_time
+
+
+def setup_arrival_rate(environment: Environment) -> None:
+    """
+    Подключает расписание запусков открытой модели к жизненному циклу теста.
+
+    - Мастер сообщает каждому воркеру его долю частоты (1 / число воркеров), так что
+      LOCUST_USER.ARRIVAL_RATE — общая частота всего запуска. Доли пересчитываются и рассылаются
+      в test_start, после каждого распределения пользователей (spawning_complete — в том числе
+      после отключения или пропажи воркера) и при подключении воркера во время теста, если
+      включено перераспределение пользователей (--enable-rebalancing): без него новый воркер
+      пользователей не получает и в долях не учитывается до следующего распределения.
+    - Пропущенные запуски не попадают в статистику запросов: воркер отправляет мастеру счётчики
+      запусков в отчётах статистики, а мастер (или локальный процесс) в test_stop пишет итог в лог
+      и при пропусках помечает запуск в шапке report.html (см. check_missed_launches).
+    - Воркер и локальный процесс сбрасывают расписание в test_stop.
+
+    :param environment: Среда выполнения Locust.
+    """
+    runner = environment.runner
+
+    if isinstance(runner, MasterRunner):
+        running = False
+        nodes: dict[str, ArrivalStats] = {}
+
+        def send_shares(connected_worker_id: str | None = None):
+            # Подключающийся воркер попадает в runner.clients только после события worker_connect
+            worker_ids = {
+                *(worker.id for worker in [*runner.clients.ready, *runner.clients.spawning, *runner.clients.running]),
+                *([connected_worker_id] if connected_worker_id else [])
+            }
+            for worker_id in worker_ids:
+                runner.send_message(ARRIVAL_RATE_SHARE_MESSAGE, {"share": 1 / len(worker_ids)}, client_id=worker_id)
+            logger.info(f"Arrival rate split between {len(worker_ids)} workers")
+
+        def on_test_start(**kwargs):
+            nonlocal running
+            running = True
+            nodes.clear()
+            send_shares()
+
+        def on_test_stop(**kwargs):
+            nonlocal running
+            running = False
+            total = ArrivalStats()
+            for stats in nodes.values():
+                total.merge(stats.encode())
+            check_missed_launches(environment, total)
+
+        def on_worker_report(client_id: str, data: dict[str, Any]):
+            if ARRIVAL_REPORT_KEY in data:
+                nodes.setdefault(client_id, ArrivalStats()).merge(data[ARRIVAL_REPORT_KEY])
+
+        def on_spawning_complete(**kwargs):
+            send_shares()
+
+        def on_worker_connect(client_id: str, **kwargs):
+            # Сообщение уходит раньше spawn, поэтому новый воркер не стартует с полной частотой
+            if running and runner.rebalancing_enabled():
+                send_shares(connected_worker_id=client_id)
+
+        environment.events.test_start.add_listener(on_test_start)
+        environment.events.test_stop.add_listener(on_test_stop)
+        environment.events.spawning_complete.add_listener(on_spawning_complete)
+        environment.events.worker_connect.add_listener(on_worker_connect)
+        environment.events.worker_report.add_listener(on_worker_report)
+        return
+
+    if isinstance(runner, WorkerRunner):
+        def on_share(environment: Environment, msg: Message, **kwargs):
+            get_arrival_scheduler(environment).set_share(msg.data["share"])
+
+        def on_report_to_master(client_id: str, data: dict[str, Any]):
+            scheduler = get_arrival_scheduler(environment)
+            data[ARRIVAL_REPORT_KEY] = scheduler.unreported.encode()
+            scheduler.unreported = ArrivalStats()
+
+        runner.register_message(ARRIVAL_RATE_SHARE_MESSAGE, on_share)
+        environment.events.report_to_master.add_listener(on_report_to_master)
+
+    def on_test_stop(**kwargs):
+        scheduler = get_arrival_scheduler(environment)
+        if isinstance(runner, WorkerRunner):
+            if scheduler.stats.launched or scheduler.stats.missed:
+                logger.info(f"Open model: {scheduler.stats.launched} launches, {scheduler.stats.missed} missed")
+        else:
+            check_missed_launches(environment, scheduler.stats)
+        scheduler.reset()
+
+    environment.events.test_stop.add_listener(on_test_stop)
@@ -0,0 +1,62 @@
+import time
+
+import gevent
+from locust.env import Environment
+from locust.runners import MasterRunner
+
+from config import settings
+from logger import get_logger
+from tools.fakers import PooledFake, fake
+
+logger = get_logger("LOCUST_FAKERS")
+
+
+def refill_fake_pools(pooled_fake: PooledFake, interval: float) -> None:
+    """
+    Фоновая greenlet: раз в interval секунд готовит новые поколения значений для пулов.
+
+    Генерация идёт порциями с gevent.sleep(0) между ними, чтобы не задерживать виртуальных пользователей.
+    """
+    while True:
+        gevent.sleep(interval)
+        pooled_fake.refill(pause=lambda: gevent.sleep(0))
+
+
+def setup_fake_pools(environment: Environment) -> None:
+    """
+    Подготавливает пулы тестовых данных (FAKERS.POOLED) в процессах, где работают виртуальные пользователи.
+
+    Пулы заполняются сразу при инициализации, а на время теста запускается их фоновое пополнение.
+    На мастере распределённого запуска ничего не делается: запросы выполняют воркеры.
+
+    :param environment: Среда выполнения Locust.
+    """
+    if not isinstance(fake, PooledFake) or isinstance(environment.runner, MasterRunner):
+        return
+
+    # Заполнение идёт без уступок управления: иначе воркер начал бы обрабатывать сообщения мастера
+    # (spawn, шарды сидинга) раньше init-хуков сценария. Пока оно идёт, кэшированные часы gevent стоят,
+    # поэтому после него их нужно обновить — иначе таймер --run-time сработает раньше на время заполнения
+    started_at = time.perf_counter()
+    fake.warm_up()
+    gevent.get_hub().loop.update_now()
+    logger.info(
+        f"Fake data pools are ready: {len(fake.pools)} pools of {fake.size} values "
+        f"in {time.perf_counter() - started_at:.1f}s"
+    )
+
+    refresher: gevent.Greenlet | None = None
+
+    def start(**kwargs):
+        nonlocal refresher
+        if refresher is None and settings.fakers.refill_interval > 0:
+            refresher = gevent.spawn(refill_fake_pools, fake, settings.fakers.refill_interval)
+
+    def stop(**kwargs):
+        nonlocal refresher
+        if refresher is not None:
+            refresher.kill(block=False)
+            refresher = None
+
+    environment.events.test_start.add_listener(start)
+    environment.events.test_stop.add_listener(stop)
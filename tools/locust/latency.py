@@ -0,0 +1,90 @@
+import json
+import os
+from datetime import datetime
+from typing import Any
+
+from locust.env import Environment
+from locust.runners import MasterRunner, WorkerRunner
+
+from config import settings
+from logger import get_logger
+from tools.latency import LatencyHistograms
+
+# Ключ, под которым воркер отправляет мастеру свои гистограммы в отчёте статистики
+LATENCY_HISTOGRAMS_REPORT_KEY = "latency_histograms"
+
+logger = get_logger("LOCUST_LATENCY")
+
+
+def build_latency_histograms() -> LatencyHistograms:
+    """
+    Создаёт набор HDR-гистограмм по настройкам LATENCY.
+    """
+    return LatencyHistograms(
+        significant_figures=settings.latency.hdr_significant_figures,
+        highest_trackable=settings.latency.hdr_highest_trackable,
+        expected_interval=settings.latency.hdr_expected_interval
+    )
+
+
+def save_latency_histograms(histograms: LatencyHistograms) -> str:
+    """
+    Сохраняет гистограммы в LATENCY.HDR_REPORT_DIR в формате JSON: {маршрут: {uncorrected, corrected}},
+    где значения — сжатые гистограммы HdrHistogram (их можно декодировать и объединять любой реализацией HDR).
+
+    :return: Путь к сохранённому файлу.
+    """
+    os.makedirs(settings.latency.hdr_report_dir, exist_ok=True)
+    path = os.path.join(settings.latency.hdr_report_dir, f"{datetime.now():%Y-%m-%d-%Hh%Mm%Ss}.json")
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(histograms.encode(), file, indent=2)
+
+    return path
+
+
+def setup_latency_histograms(environment: Environment) -> None:
+    """
+    Подключает HDR-гистограммы времени ответа к событиям Locust.
+
+    - Воркер и локальный процесс записывают каждое событие request (HTTP-хук и gRPC-интерцептор
+      передают в context опоздание запуска launch_lag для коррекции coordinated omission).
+    - Воркер с каждым отчётом статистики отправляет мастеру накопленные гистограммы и обнуляет их.
+    - Мастер складывает гистограммы воркеров; по окончании теста мастер (или локальный процесс)
+      пишет перцентили в лог и сохраняет гистограммы в LATENCY.HDR_REPORT_DIR.
+
+    :param environment: Среда выполнения Locust.
+    """
+    histograms = build_latency_histograms()
+    environment.latency_histograms = histograms
+    runner = environment.runner
+
+    if not isinstance(runner, MasterRunner):
+        def on_request(request_type: str, name: str, response_time: float, context: dict | None, **kwargs):
+            if response_time is not None:
+                histograms.record(f"{request_type} {name}", response_time, (context or {}).get("launch_lag", 0.0))
+
+        environment.events.request.add_listener(on_request)
+
+    if isinstance(runner, WorkerRunner):
+        def on_report_to_master(client_id: str, data: dict[str, Any]):
+            data[LATENCY_HISTOGRAMS_REPORT_KEY] = histograms.encode()
+            histograms.reset()
+
+        environment.events.report_to_master.add_listener(on_report_to_master)
+        return
+
+    if isinstance(runner, MasterRunner):
+        def on_worker_report(client_id: str, data: dict[str, Any]):
+            histograms.merge(data.get(LATENCY_HISTOGRAMS_REPORT_KEY, {}))
+
+        environment.events.worker_report.add_listener(on_worker_report)
+
+    def on_test_stop(**kwargs):
+        if not histograms.routes:
+            return
+
+        logger.info("HDR latency percentiles, ms (measured/corrected):\n" + "\n".join(histograms.summary()))
+        logger.info(f"HDR histograms saved to {save_latency_histograms(histograms)}")
+        histograms.reset()
+
+    environment.events.test_stop.add_listener(on_test_stop)
@@ -0,0 +1,290 @@
+import os
+import time
+from datetime import datetime
+from typing import Any
+
+import gevent
+from locust.env import Environment
+from locust.runners import WorkerRunner
+from locust.stats import RequestStats, StatsEntry, calculate_response_time_percentile, diff_response_time_dicts
+
+from config import settings
+from logger import get_logger
+from tools.results import ResultsStore, build_results_store
+from tools.revision import PROJECT_ROOT, get_git_revision
+
+# Перцентили, которые сохраняются по каждому маршруту (колонки p50, p90, p95, p99)
+RESULTS_PERCENTILES = (50, 90, 95, 99)
+
+# Параметры командной строки Locust, которые сохраняются вместе с запуском
+RUN_OPTIONS = ("locustfile", "config", "num_users", "spawn_rate", "run_time", "host", "tags", "expect_workers")
+
+logger = get_logger("LOCUST_RESULTS")
+
+
+class RouteSnapshot:
+    """
+    Счётчики маршрута на момент начала интервала — от них считается прирост за интервал.
+    """
+
+    def __init__(self, entry: StatsEntry | None = None):
+        self.requests = entry.num_requests if entry else 0
+        self.failures = entry.num_failures if entry else 0
+        self.total_response_time = entry.total_response_time if entry else 0.0
+        self.content_length = entry.total_content_length if entry else 0
+        self.response_times = dict(entry.response_times) if entry else {}
+
+
+def is_request_entry(entry: StatsEntry) -> bool:
+    """
+    Запись статистики относится к реальным запросам, а не создана одним stats.log_error
+    (такая запись без запросов с одними ошибками исказила бы протокол, маршруты и долю ошибок).
+    """
+    return entry.num_requests > 0
+
+
+def get_request_entries(stats: RequestStats) -> list[tuple[tuple[str, str], StatsEntry]]:
+    return [(key, entry) for key, entry in list(stats.entries.items()) if is_request_entry(entry)]
+
+
+def get_route(entry: StatsEntry) -> str:
+    """
+    Маршрут в том же виде, что и ключ HDR-гистограмм: "<тип запроса> <имя>".
+    """
+    return f"{entry.method} {entry.name}"
+
+
+def get_route_stats(
+        requests: int,
+        failures: int,
+        duration: float,
+        content_length: int,
+        total_response_time: float,
+        response_times: dict[int, int]
+) -> dict[str, Any]:
+    """
+    Статистика маршрута в колонках ROUTE_STATS_COLUMNS. Перцентили и максимум считаются по бакетам
+    Locust (время ответа округлено до 1-2 значащих цифр), как и в report.html.
+    """
+    count = sum(response_times.values())
+    percentiles = {
+        f"p{percent}": calculate_response_time_percentile(response_times, count, percent / 100) if count else None
+        for percent in RESULTS_PERCENTILES
+    }
+    return {
+        "requests": requests,
+        "failures": failures,
+        "rps": requests / duration if duration > 0 else 0.0,
+        "bytes": content_length,
+        "avg": total_response_time / requests if requests else None,
+        **percentiles,
+        "max": max(response_times) if response_times else None,
+    }
+
+
+class RouteStatsRecorder:
+    """
+    Раз в RESULTS.INTERVAL снимает прирост статистики Locust по каждому маршруту и дописывает его в базу.
+
+    Работает на мастере (или в локальном процессе), где статистика воркеров уже собрана, поэтому
+    в базу попадают данные всего теста. Если статистику сбросили (кнопка Reset в web UI),
+    прирост считается от нуля.
+    """
+
+    def __init__(self, store: ResultsStore, stats: RequestStats, run_id: int, interval: float):
+        self.store = store
+        self.stats = stats
+        self.run_id = run_id
+        self.interval = interval
+        self.started_at = time.time()
+        self.interval_started_at = self.started_at
+        self.snapshots: dict[tuple[str, str], RouteSnapshot] = {}
+        self.greenlet: gevent.Greenlet | None = None
+
+    def start(self) -> None:
+        self.snapshots = {key: RouteSnapshot(entry) for key, entry in get_request_entries(self.stats)}
+        self.greenlet = gevent.spawn(self.run)
+
+    def stop(self) -> None:
+        if self.greenlet is not None:
+            self.greenlet.kill()
+            self.greenlet = None
+        self.flush()
+
+    def run(self) -> None:
+        while True:
+            gevent.sleep(self.interval)
+            self.flush()
+
+    def flush(self) -> None:
+        now = time.time()
+        duration = now - self.interval_started_at
+        rows = []
+        for key, entry in get_request_entries(self.stats):
+            snapshot = self.snapshots.get(key)
+            if snapshot is None or entry.num_requests < snapshot.requests:
+                snapshot = RouteSnapshot()
+
+            requests = entry.num_requests - snapshot.requests
+            failures = entry.num_failures - snapshot.failures
+            if requests == 0 and failures == 0:
+                continue
+
+            rows.append({
+                "started_at": self.interval_started_at,
+                "duration": duration,
+                "route": get_route(entry),
+                **get_route_stats(
+                    requests=requests,
+                    failures=failures,
+                    duration=duration,
+                    content_length=entry.total_content_length - snapshot.content_length,
+                    total_response_time=entry.total_response_time - snapshot.total_response_time,
+                    response_times=diff_response_time_dicts(entry.response_times, snapshot.response_times)
+                )
+            })
+            self.snapshots[key] = RouteSnapshot(entry)
+
+        self.interval_started_at = now
+        if rows:
+            self.store.add_intervals(self.run_id, rows)
+
+
+def get_scenario_name(locustfile: str | None) -> str:
+    """
+    Имя сценария по пути к его файлу: ./scenarios/grpc/gateway/new_user_get_documents/scenario.py
+    → grpc/gateway/new_user_get_documents.
+    """
+    if not locustfile:
+        return "unknown"
+
+    parts = os.path.normpath(locustfile).removesuffix(".py").split(os.sep)
+    if "scenarios" not in parts:
+        return parts[-1]
+
+    parts = parts[len(parts) - parts[::-1].index("scenarios"):]
+    return "/".join(parts[:-1] if parts[-1] == "scenario" and len(parts) > 1 else parts)
+
+
+def read_conf(path: str | None) -> dict[str, str]:
+    """
+    Параметры из v1.0.conf сценария (формат Locust: key = value).
+    """
+    if not path:
+        return {}
+
+    path = path if os.path.isabs(path) or os.path.exists(path) else os.path.join(PROJECT_ROOT, path)
+    if not os.path.exists(path):
+        return {}
+
+    conf = {}
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            key, separator, value = line.partition("=")
+            if separator and not line.lstrip().startswith("#"):
+                conf[key.strip()] = value.strip()
+
+    return conf
+
+
+def build_run_params(environment: Environment) -> dict[str, Any]:
+    """
+    Параметры запуска: v1.0.conf, значимые параметры командной строки и модель нагрузки LOCUST_USER.
+    """
+    options = environment.parsed_options
+    return {
+        "conf": read_conf(getattr(options, "config", None)),
+        "options": {option: getattr(options, option, None) for option in RUN_OPTIONS},
+        "locust_user": settings.locust_user.model_dump(mode="json"),
+    }
+
+
+def save_run_totals(environment: Environment, store: ResultsStore, run_id: int, duration: float) -> None:
+    """
+    Сохраняет итоги запуска: статистику маршрутов за весь тест, ошибки, протоколы, признак насыщения
+    и пропущенные запуски открытой модели.
+
+    Протокол, маршруты и итоговые запросы/ошибки считаются только по записям реальных запросов.
+    """
+    stats = environment.stats
+    entries = [entry for _, entry in get_request_entries(stats)]
+    requests = sum(entry.num_requests for entry in entries)
+    routes = [
+        {
+            "route": get_route(entry),
+            **get_route_stats(
+                requests=entry.num_requests,
+                failures=entry.num_failures,
+                duration=duration,
+                content_length=entry.total_content_length,
+                total_response_time=entry.total_response_time,
+                response_times=entry.response_times
+            )
+        }
+        for entry in entries
+    ]
+    errors = [(f"{error.method} {error.name}", str(error.error), error.occurrences) for error in stats.errors.values()]
+
+    # Отчёт контроля насыщения появляется, только если включён SATURATION.GUARD,
+    # итог открытой модели — только при LOCUST_USER.LOAD_MODEL=open
+    saturation = getattr(environment, "saturation_report", None)
+    arrival = getattr(environment, "arrival_report", None)
+    store.finish_run(
+        run_id,
+        finished_at=datetime.now().isoformat(timespec="seconds"),
+        summary={
+            "protocol": ",".join(sorted({entry.method for entry in entries})),
+            "duration": duration,
+            "requests": requests,
+            "failures": sum(entry.num_failures for entry in entries),
+            "rps": requests / duration if duration > 0 else 0.0,
+            "saturated": None if saturation is None else int(saturation["saturated"]),
+            "missed_launches": None if arrival is None else arrival["missed"],
+        },
+        routes=routes,
+        errors=errors
+    )
+
+
+def setup_results_store(environment: Environment) -> None:
+    """
+    Подключает сохранение результатов запуска в базу RESULTS.PATH (см. tools/results.py).
+
+    - По началу теста мастер (или локальный процесс) регистрирует запуск: сценарий, параметры, ревизию git.
+    - Раз в RESULTS.INTERVAL в базу дописывается прирост статистики по каждому маршруту.
+    - По окончании теста сохраняются последний интервал, итоги по маршрутам, ошибки и признак насыщения.
+
+    Воркеры ничего не пишут: их статистика приходит мастеру в стандартных отчётах Locust.
+
+    :param environment: Среда выполнения Locust.
+    """
+    if isinstance(environment.runner, WorkerRunner):
+        return
+
+    store: ResultsStore | None = None
+    recorder: RouteStatsRecorder | None = None
+
+    def on_test_start(**kwargs):
+        nonlocal store, recorder
+        store = store or build_results_store()
+        run_id = store.start_run(
+            scenario=get_scenario_name(getattr(environment.parsed_options, "locustfile", None)),
+            started_at=datetime.now().isoformat(timespec="seconds"),
+            revision=get_git_revision(),
+            params=build_run_params(environment)
+        )
+        recorder = RouteStatsRecorder(store, environment.stats, run_id, settings.results.interval)
+        recorder.start()
+
+    def on_test_stop(**kwargs):
+        nonlocal recorder
+        if recorder is None:
+            return
+
+        recorder.stop()
+        save_run_totals(environment, store, recorder.run_id, time.time() - recorder.started_at)
+        logger.info(f"Run {recorder.run_id} saved to {settings.results.path}")
+        recorder = None
+
+    environment.events.test_start.add_listener(on_test_start)
+    environment.events.test_stop.add_listener(on_test_stop)
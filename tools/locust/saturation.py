@@ -0,0 +1,282 @@
+import json
+import os
+import time
+from datetime import datetime
+from typing import Any
+
+import gevent
+import psutil
+from locust.env import Environment
+from locust.runners import MasterRunner, WorkerRunner
+
+from config import settings
+from logger import get_logger
+from tools.config.saturation import SaturationAction
+
+# Ключ, под которым воркер отправляет мастеру замеры насыщения в отчёте статистики
+SATURATION_REPORT_KEY = "saturation"
+
+# Как часто проверяется задержка цикла gevent внутри одного замера (в секундах)
+LOOP_LAG_PROBE_INTERVAL = 0.05
+
+logger = get_logger("LOCUST_SATURATION")
+
+
+class SaturationStats:
+    """
+    Накопленные замеры насыщения одного процесса Locust (воркера или локального процесса).
+    """
+
+    def __init__(self):
+        self.samples = 0
+        self.saturated = 0
+        self.requests = 0
+        self.cpu_seconds = 0.0
+        self.cpu_max = 0.0
+        self.loop_lag_max = 0.0
+
+    @property
+    def saturated_ratio(self) -> float:
+        return self.saturated / self.samples if self.samples else 0.0
+
+    @property
+    def rps_per_core(self) -> float:
+        """
+        Запросов в секунду на одно полностью занятое ядро: запросы / процессорное время процесса.
+        """
+        return self.requests / self.cpu_seconds if self.cpu_seconds else 0.0
+
+    def encode(self) -> dict[str, float]:
+        return {
+            "samples": self.samples,
+            "saturated": self.saturated,
+            "requests": self.requests,
+            "cpu_seconds": self.cpu_seconds,
+            "cpu_max": self.cpu_max,
+            "loop_lag_max": self.loop_lag_max,
+        }
+
+    def merge(self, data: dict[str, float]) -> None:
+        self.samples += data.get("samples", 0)
+        self.saturated += data.get("saturated", 0)
+        self.requests += data.get("requests", 0)
+        self.cpu_seconds += data.get("cpu_seconds", 0.0)
+        self.cpu_max = max(self.cpu_max, data.get("cpu_max", 0.0))
+        self.loop_lag_max = max(self.loop_lag_max, data.get("loop_lag_max", 0.0))
+
+    def summary(self) -> dict[str, float]:
+        return {
+            **self.encode(),
+            "saturated_ratio": self.saturated_ratio,
+            "rps_per_core": self.rps_per_core,
+        }
+
+
+class SaturationMonitor:
+    """
+    Замеряет загрузку CPU процесса Locust и задержку цикла событий gevent.
+
+    Фоновая greenlet раз в LOOP_LAG_PROBE_INTERVAL засыпает и смотрит, насколько позже она проснулась:
+    если цикл gevent не успевает обслуживать виртуальных пользователей, задержка растёт раньше,
+    чем CPU доходит до 100%, и вся она попадает во время ответа. Раз в sample_interval
+    записывается замер; он считается насыщенным, если CPU или задержка превысили порог.
+    """
+
+    def __init__(self, sample_interval: float, cpu_threshold: float, loop_lag_threshold: float):
+        """
+        :param sample_interval: Период замера в секундах.
+        :param cpu_threshold: Порог загрузки CPU в процентах одного ядра.
+        :param loop_lag_threshold: Порог задержки цикла gevent в мс.
+        """
+        self.sample_interval = sample_interval
+        self.cpu_threshold = cpu_threshold
+        self.loop_lag_threshold = loop_lag_threshold
+        self.process = psutil.Process()
+        self.stats = SaturationStats()
+        self.cpu_times = self.process.cpu_times()
+        self.greenlet: gevent.Greenlet | None = None
+
+    def on_request(self, **kwargs) -> None:
+        self.stats.requests += 1
+
+    def start(self) -> None:
+        self.stop()
+        self.process.cpu_percent()  # Первый вызов только запоминает точку отсчёта
+        self.cpu_times = self.process.cpu_times()
+        self.greenlet = gevent.spawn(self.run)
+
+    def stop(self) -> None:
+        if self.greenlet is None:
+            return
+
+        self.greenlet.kill()
+        self.greenlet = None
+        # Процессорное время неполного последнего периода тоже учитывается, иначе RPS на ядро завышается
+        self.stats.cpu_seconds += self.spent_cpu_seconds()
+
+    def spent_cpu_seconds(self) -> float:
+        """
+        Процессорное время процесса (user + system) с предыдущего вызова.
+        """
+        previous, self.cpu_times = self.cpu_times, self.process.cpu_times()
+        return (self.cpu_times.user + self.cpu_times.system) - (previous.user + previous.system)
+
+    def run(self) -> None:
+        while True:
+            sample_started_at = time.perf_counter()
+            loop_lag = 0.0
+            while time.perf_counter() - sample_started_at < self.sample_interval:
+                probe_started_at = time.perf_counter()
+                gevent.sleep(LOOP_LAG_PROBE_INTERVAL)
+                loop_lag = max(loop_lag, (time.perf_counter() - probe_started_at - LOOP_LAG_PROBE_INTERVAL) * 1000)
+
+            self.record(cpu=self.process.cpu_percent(), cpu_seconds=self.spent_cpu_seconds(), loop_lag=loop_lag)
+
+    def record(self, cpu: float, cpu_seconds: float, loop_lag: float) -> None:
+        self.stats.samples += 1
+        self.stats.cpu_seconds += cpu_seconds
+        self.stats.cpu_max = max(self.stats.cpu_max, cpu)
+        self.stats.loop_lag_max = max(self.stats.loop_lag_max, loop_lag)
+        if cpu > self.cpu_threshold or loop_lag > self.loop_lag_threshold:
+            self.stats.saturated += 1
+
+
+def build_saturation_monitor() -> SaturationMonitor:
+    """
+    Создаёт монитор насыщения по настройкам SATURATION.
+    """
+    return SaturationMonitor(
+        sample_interval=settings.saturation.sample_interval,
+        cpu_threshold=settings.saturation.cpu_threshold,
+        loop_lag_threshold=settings.saturation.loop_lag_threshold
+    )
+
+
+def save_saturation_report(report: dict[str, Any]) -> str:
+    """
+    Сохраняет отчёт о насыщении в SATURATION.REPORT_DIR в формате JSON.
+
+    :return: Путь к сохранённому файлу.
+    """
+    os.makedirs(settings.saturation.report_dir, exist_ok=True)
+    path = os.path.join(settings.saturation.report_dir, f"{datetime.now():%Y-%m-%d-%Hh%Mm%Ss}.json")
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+
+    return path
+
+
+def check_saturation(environment: Environment, nodes: dict[str, SaturationStats]) -> dict[str, Any]:
+    """
+    Оценивает замеры воркеров по окончании теста, сохраняет отчёт и помечает (или проваливает) насыщенный запуск.
+
+    :param environment: Среда выполнения Locust.
+    :param nodes: Замеры по воркерам (для локального запуска — один процесс).
+    :return: Отчёт о насыщении.
+    """
+    config = settings.saturation
+    total = SaturationStats()
+    for stats in nodes.values():
+        total.merge(stats.encode())
+
+    saturated_nodes = [node for node, stats in nodes.items() if stats.saturated_ratio > config.tolerance]
+    report = {
+        "saturated": bool(saturated_nodes),
+        "saturated_nodes": saturated_nodes,
+        "thresholds": {
+            "cpu": config.cpu_threshold,
+            "loop_lag": config.loop_lag_threshold,
+            "tolerance": config.tolerance,
+        },
+        "total": total.summary(),
+        "nodes": {node: stats.summary() for node, stats in nodes.items()},
+    }
+
+    logger.info(
+        f"Load generator: {total.requests} requests, {total.cpu_seconds:.1f} CPU seconds, "
+        f"{total.rps_per_core:.0f} RPS per core, max CPU {total.cpu_max:.0f}%, "
+        f"max loop lag {total.loop_lag_max:.1f} ms"
+    )
+    logger.info(f"Saturation report saved to {save_saturation_report(report)}")
+
+    # Итог доступен следующим обработчикам test_stop (база результатов сохраняет признак насыщения запуска)
+    environment.saturation_report = report
+
+    if not saturated_nodes:
+        return report
+
+    message = (
+        f"Load generator saturated on {', '.join(saturated_nodes)}: CPU > {config.cpu_threshold:.0f}% "
+        f"or gevent loop lag > {config.loop_lag_threshold:.0f} ms in more than {config.tolerance:.0%} of samples"
+    )
+    logger.warning(f"{message}. Response times include generator queueing, add workers or lower the load")
+
+    # Профиль выводится в шапке report.html, поэтому пометка попадает в отчёт без изменения статистики запросов
+    environment.profile = f"{environment.profile} | {message}" if environment.profile else message
+
+    if config.action == SaturationAction.FAIL:
+        details = "\n".join(
+            f"{node}: saturated {stats.saturated_ratio:.0%} of samples, max CPU {stats.cpu_max:.0f}%, "
+            f"max loop lag {stats.loop_lag_max:.1f} ms"
+            for node, stats in nodes.items()
+        )
+        environment.runner.log_exception("saturation guard", message, details)
+        if environment.process_exit_code is None:
+            environment.process_exit_code = 1
+
+    return report
+
+
+def setup_saturation_guard(environment: Environment) -> None:
+    """
+    Подключает контроль насыщения генератора нагрузки к событиям Locust.
+
+    - Воркер и локальный процесс замеряют CPU и задержку цикла gevent на время теста
+      и считают выполненные запросы (для RPS на ядро).
+    - Воркер с каждым отчётом статистики отправляет мастеру накопленные замеры и обнуляет их.
+    - По окончании теста мастер (или локальный процесс) оценивает замеры каждого воркера,
+      сохраняет отчёт в SATURATION.REPORT_DIR и при насыщении помечает запуск (SATURATION.ACTION).
+
+    :param environment: Среда выполнения Locust.
+    """
+    runner = environment.runner
+    nodes: dict[str, SaturationStats] = {}
+
+    if not isinstance(runner, MasterRunner):
+        monitor = build_saturation_monitor()
+        environment.events.request.add_listener(monitor.on_request)
+
+        def on_test_start(**kwargs):
+            monitor.stats = SaturationStats()
+            monitor.start()
+
+        environment.events.test_start.add_listener(on_test_start)
+        environment.events.test_stop.add_listener(lambda **kwargs: monitor.stop())
+        environment.events.quitting.add_listener(lambda **kwargs: monitor.stop())
+
+    if isinstance(runner, WorkerRunner):
+        def on_report_to_master(client_id: str, data: dict[str, Any]):
+            data[SATURATION_REPORT_KEY] = monitor.stats.encode()
+            monitor.stats = SaturationStats()
+
+        environment.events.report_to_master.add_listener(on_report_to_master)
+        return
+
+    if isinstance(runner, MasterRunner):
+        def on_test_start(**kwargs):
+            nodes.clear()
+
+        def on_worker_report(client_id: str, data: dict[str, Any]):
+            if SATURATION_REPORT_KEY in data:
+                nodes.setdefault(client_id, SaturationStats()).merge(data[SATURATION_REPORT_KEY])
+
+        environment.events.test_start.add_listener(on_test_start)
+        environment.events.worker_report.add_listener(on_worker_report)
+
+    def on_test_stop(**kwargs):
+        if isinstance(runner, MasterRunner):
+            check_saturation(environment, nodes)
+        else:
+            check_saturation(environment, {"local": monitor.stats})
+
+    environment.events.test_stop.add_listener(on_test_stop)
@@ -0,0 +1,165 @@
+from typing import Any, Hashable
+
+from locust.env import Environment
+from locust.rpc import Message
+from locust.runners import MasterRunner, WorkerRunner
+
+from config import settings
+from logger import get_logger
+from seeds.compact import CompactSeedsResult
+from seeds.dispensers import build_seeds_dispenser
+from seeds.dumps import load_seeds_result
+from seeds.scenario import SeedsScenario
+from seeds.schema.result import SeedsResult
+from tools.config.seeds import SeedsLoader, SeedsDispenserStrategy
+
+# Тип сообщения, которым мастер раздаёт воркерам их часть пользователей сидинга
+SEEDS_SHARD_MESSAGE = "seeds_shard"
+
+logger = get_logger("LOCUST_SEEDS")
+
+
+class SeedsShardMissingError(Exception):
+    """
+    Воркер не получил от мастера свой шард пользователей сидинга.
+    """
+
+
+class PendingSeedsDispenser:
+    """
+    Раздатчик воркера до получения шарда: вместо AttributeError в on_start сценария
+    сообщает, что шард не пришёл.
+    """
+
+    def __init__(self, scenario: str):
+        self.scenario = scenario
+
+    def acquire(self, key: Hashable | None = None) -> Any:
+        raise SeedsShardMissingError(
+            f"[{self.scenario}] This worker has not received its seeds shard from the master. "
+            f"Make sure the master runs the same scenario and seeding finished before the test started"
+        )
+
+    def release(self, key: Hashable | None = None) -> None:
+        pass
+
+
+def build_seeds_shard(users: list[dict[str, Any]]) -> SeedsResult | CompactSeedsResult:
+    """
+    Собирает результат сидинга из пользователей, присланных мастером.
+
+    Шард уже находится в памяти воркера, поэтому при SEEDS.LOADER=lazy используется обычная модель.
+
+    :param users: Пользователи шарда в формате SeedUserResult.
+    :return: Результат сидинга в представлении, выбранном в настройках.
+    """
+    if settings.seeds.loader == SeedsLoader.COMPACT:
+        return CompactSeedsResult.from_dicts(users)
+
+    return SeedsResult.model_validate({"users": users})
+
+
+def set_environment_seeds(
+        environment: Environment,
+        seeds: SeedsResult | CompactSeedsResult,
+        dispenser: SeedsDispenserStrategy
+) -> None:
+    """
+    Сохраняет результат сидинга в окружении вместе с раздатчиком пользователей.
+
+    Стратегия из SEEDS.DISPENSER, если задана, имеет приоритет над стратегией сценария.
+    """
+    environment.seeds = seeds
+    environment.seeds_dispenser = build_seeds_dispenser(
+        seeds,
+        strategy=settings.seeds.dispenser or dispenser,
+        timeout=settings.seeds.dispenser_timeout,
+        skew=settings.seeds.dispenser_skew
+    )
+
+
+def setup_seeds(
+        environment: Environment,
+        seeds_scenario: SeedsScenario,
+        dispenser: SeedsDispenserStrategy = SeedsDispenserStrategy.RANDOM
+) -> None:
+    """
+    Подготавливает данные сидинга для текущего процесса Locust.
+
+    - Локальный запуск: сидинг выполняется и загружается в этом же процессе, как раньше.
+    - Мастер: сидинг выполняется один раз, а при старте теста каждый воркер получает
+      непересекающийся шард пользователей сообщением SEEDS_SHARD_MESSAGE. Если во время
+      теста подключается новый воркер (или переподключается старый), пользователи
+      перераспределяются между всеми воркерами и шарды рассылаются заново.
+    - Воркер: сам сидинг не запускает и не читает дамп, а ждёт свой шард от мастера.
+      Мастер отправляет шарды в test_start и при подключении воркера, то есть до сообщений
+      spawn, поэтому к моменту on_start виртуальных пользователей environment.seeds уже заполнен.
+      Пока шард не получен, acquire раздатчика падает с понятной ошибкой SeedsShardMissingError.
+
+    :param environment: Окружение Locust из события init.
+    :param seeds_scenario: Сидинг-сценарий, данные которого нужны нагрузочному сценарию.
+    :param dispenser: Стратегия раздачи пользователей по умолчанию для этого сценария.
+    """
+    runner = environment.runner
+
+    if isinstance(runner, WorkerRunner):
+        environment.seeds = None
+        environment.seeds_dispenser = PendingSeedsDispenser(seeds_scenario.scenario)
+
+        def on_seeds_shard(environment: Environment, msg: Message, **kwargs):
+            set_environment_seeds(environment, build_seeds_shard(msg.data["users"]), dispenser)
+            logger.info(
+                f"[{seeds_scenario.scenario}] Received seeds shard {msg.data['index'] + 1}/{msg.data['count']} "
+                f"with {len(msg.data['users'])} users"
+            )
+
+        runner.register_message(SEEDS_SHARD_MESSAGE, on_seeds_shard)
+        return
+
+    # Генерация данных, если они ещё не созданы (или устарели)
+    seeds_scenario.build()
+
+    if isinstance(runner, MasterRunner):
+        result = load_seeds_result(scenario=seeds_scenario.scenario)
+
+        running = False
+
+        def send_seeds_shards(connected_worker_id: str | None = None):
+            # Подключающийся воркер попадает в runner.clients только после события worker_connect
+            worker_ids = sorted({
+                *(worker.id for worker in [*runner.clients.ready, *runner.clients.spawning, *runner.clients.running]),
+                *([connected_worker_id] if connected_worker_id else [])
+            })
+            for index, worker_id in enumerate(worker_ids):
+                shard = result.shard(index=index, count=len(worker_ids))
+                runner.send_message(
+                    SEEDS_SHARD_MESSAGE,
+                    {"index": index, "count": len(worker_ids), "users": shard.model_dump(mode="json")["users"]},
+                    client_id=worker_id
+                )
+            logger.info(f"[{seeds_scenario.scenario}] Sent {len(result.users)} seed users to {len(worker_ids)} workers")
+
+        def on_test_start(**kwargs):
+            nonlocal running
+            running = True
+            send_seeds_shards()
+
+        def on_test_stop(**kwargs):
+            nonlocal running
+            running = False
+
+        def on_worker_connect(client_id: str, **kwargs):
+            # Воркер, подключившийся во время теста, получит spawn сразу после подключения.
+            # Шарды пересобираются на всех воркеров: пользователи, уже выданные виртуальным
+            # пользователям по старому шарду, остаются у них до ближайшего release
+            if running:
+                logger.info(f"[{seeds_scenario.scenario}] Worker {client_id} connected during the test, resharding")
+                send_seeds_shards(connected_worker_id=client_id)
+
+        environment.events.test_start.add_listener(on_test_start)
+        environment.events.test_stop.add_listener(on_test_stop)
+        environment.events.worker_connect.add_listener(on_worker_connect)
+        return
+
+    # Загружаем сгенерированных пользователей в окружение Locust
+    set_environment_seeds(environment, seeds_scenario.load(), dispenser)
@@ -0,0 +1,30 @@
+from locust.env import Environment
+from locust.runners import MasterRunner, WorkerRunner
+
+from config import settings
+from logger import get_logger
+from tools.unique import UniqueKeyGenerator, unique
+
+logger = get_logger("LOCUST_UNIQUE")
+
+
+def setup_unique_worker_id(environment: Environment) -> None:
+    """
+    Назначает генератору уникальных ключей номер, не пересекающийся с другими процессами запуска.
+
+    Мастер получает номер 0, воркер — свой номер у мастера плюс один. Номер выдаётся мастером
+    при подключении воркера, поэтому к событию init он уже известен. Локальный запуск
+    оставляет номер по PID, а явно заданный UNIQUE.WORKER_ID не переопределяется.
+
+    :param environment: Среда выполнения Locust.
+    """
+    if settings.unique.worker_id is not None:
+        return
+
+    if isinstance(environment.runner, MasterRunner):
+        unique.set_worker_id(0)
+    elif isinstance(environment.runner, WorkerRunner):
+        worker_index = environment.runner.worker_index
+        if worker_index >= UniqueKeyGenerator.MAX_WORKER_ID:
+            logger.warning(f"Worker index {worker_index} exceeds unique key worker ids, keys may collide")
+        unique.set_worker_id(worker_index % UniqueKeyGenerator.MAX_WORKER_ID + 1)
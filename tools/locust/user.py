@@ -1,16 +1,52 @@
-from locust import User, between
+import gevent
+from locust import User, between, events
+from locust.env import Environment
 
 from config import settings  # ← импорт глобального объекта настроек
+from tools.config.locust import LocustLoadModel
+from tools.locust.arrival import arrival_rate, setup_arrival_rate
+from tools.locust.fakers import setup_fake_pools
+from tools.locust.latency import setup_latency_histograms
+from tools.locust.results import setup_results_store
+from tools.locust.saturation import setup_saturation_guard
+from tools.locust.unique import setup_unique_worker_id
 
 
 class LocustBaseUser(User):
     """
     Базовый виртуальный пользователь Locust, от которого наследуются все сценарии.
     Содержит общие настройки, которые могут быть переопределены при необходимости.
+
+    Модель нагрузки задаётся LOCUST_USER.LOAD_MODEL: в закрытой модели между задачами
+    случайная пауза, в открытой задачи запускаются по общему расписанию с частотой
+    LOCUST_USER.ARRIVAL_RATE (см. tools/locust/arrival.py).
     """
     host: str = "localhost"
     abstract = True
-    wait_time = between(
+    wait_time = arrival_rate() if settings.locust_user.load_model == LocustLoadModel.OPEN else between(
         min_wait=settings.locust_user.wait_time_min,
         max_wait=settings.locust_user.wait_time_max
     )
+
+    def on_start(self) -> None:
+        # В открытой модели первая задача тоже ждёт своего слота, иначе весь пул стартует одновременно
+        if settings.locust_user.load_model == LocustLoadModel.OPEN:
+            gevent.sleep(self.wait_time())
+
+
+# Уникальные ключи, пулы тестовых данных, расписание открытой модели, HDR-гистограммы, контроль насыщения
+# генератора и база результатов нужны всем сценариям, поэтому подключаются вместе с базовым пользователем.
+# Слушатель регистрируется при импорте LocustBaseUser, то есть раньше init-хуков сидинга в сценариях.
+@events.init.add_listener
+def init_locust_base_user(environment: Environment, **kwargs):
+    setup_unique_worker_id(environment)
+    setup_fake_pools(environment)
+    if settings.locust_user.load_model == LocustLoadModel.OPEN:
+        setup_arrival_rate(environment)
+    if settings.latency.hdr_histograms:
+        setup_latency_histograms(environment)
+    if settings.saturation.guard:
+        setup_saturation_guard(environment)
+    # Подключается после контроля насыщения: его отчёт нужен к моменту сохранения итогов запуска
+    if settings.results.store:
+        setup_results_store(environment)
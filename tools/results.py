@@ -0,0 +1,310 @@
+"""
+База результатов запусков сценариев (SQLite).
+
+Каждый запуск Locust с RESULTS.STORE=true пишет в RESULTS.PATH:
+- runs — метаданные запуска: сценарий, параметры v1.0.conf и командной строки, ревизия git,
+  протоколы, итоги, признак насыщения генератора (если включён SATURATION.GUARD)
+  и число пропущенных запусков открытой модели;
+- route_intervals — статистика по маршрутам за каждый интервал RESULTS.INTERVAL:
+  запросы, ошибки, RPS, байты, среднее, перцентили и максимум времени ответа;
+- route_totals — та же статистика за весь запуск (перцентили интервалов не складываются);
+- route_errors — ошибки по маршрутам за весь запуск.
+
+Запросы: python -m tools.results runs [--scenario ...]
+         python -m tools.results routes RUN_ID
+         python -m tools.results intervals RUN_ID [--route ...]
+         python -m tools.results trend SCENARIO ROUTE [--metric p95]
+"""
+import argparse
+import json
+import os
+import sqlite3
+from typing import Any, Iterable, Sequence
+
+from config import settings
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    scenario TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    finished_at TEXT,
+    revision TEXT NOT NULL,
+    protocol TEXT,
+    params TEXT NOT NULL,
+    duration REAL,
+    requests INTEGER,
+    failures INTEGER,
+    rps REAL,
+    saturated INTEGER,
+    missed_launches INTEGER
+);
+CREATE INDEX IF NOT EXISTS runs_scenario ON runs (scenario, started_at);
+
+CREATE TABLE IF NOT EXISTS route_intervals (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    started_at REAL NOT NULL,
+    duration REAL NOT NULL,
+    route TEXT NOT NULL,
+    requests INTEGER NOT NULL,
+    failures INTEGER NOT NULL,
+    rps REAL NOT NULL,
+    bytes INTEGER NOT NULL,
+    avg REAL,
+    p50 REAL,
+    p90 REAL,
+    p95 REAL,
+    p99 REAL,
+    max REAL
+);
+CREATE INDEX IF NOT EXISTS route_intervals_run ON route_intervals (run_id, route, started_at);
+
+CREATE TABLE IF NOT EXISTS route_totals (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    route TEXT NOT NULL,
+    requests INTEGER NOT NULL,
+    failures INTEGER NOT NULL,
+    rps REAL NOT NULL,
+    bytes INTEGER NOT NULL,
+    avg REAL,
+    p50 REAL,
+    p90 REAL,
+    p95 REAL,
+    p99 REAL,
+    max REAL,
+    PRIMARY KEY (run_id, route)
+);
+CREATE INDEX IF NOT EXISTS route_totals_route ON route_totals (route, run_id);
+
+CREATE TABLE IF NOT EXISTS route_errors (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    route TEXT NOT NULL,
+    error TEXT NOT NULL,
+    occurrences INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS route_errors_run ON route_errors (run_id);
+"""
+
+# Колонки runs, добавленные после первой версии схемы: в существующую базу они добавляются при открытии
+RUNS_ADDED_COLUMNS = {"missed_launches": "INTEGER"}
+
+# Колонки статистики маршрута — общие для интервалов и итогов запуска
+ROUTE_STATS_COLUMNS = ("requests", "failures", "rps", "bytes", "avg", "p50", "p90", "p95", "p99", "max")
+TREND_METRICS = ROUTE_STATS_COLUMNS
+
+
+class ResultsStore:
+    """
+    Обёртка над файлом SQLite с результатами запусков.
+
+    Файл открывается в режиме WAL: запись интервалов (одна транзакция на интервал) не блокирует
+    чтение, поэтому базу можно запрашивать во время теста.
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: Путь к файлу базы; каталог создаётся при необходимости.
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.connection = sqlite3.connect(path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+        self.migrate()
+
+    def migrate(self) -> None:
+        columns = {row["name"] for row in self.connection.execute("PRAGMA table_info(runs)")}
+        with self.connection:
+            for column, column_type in RUNS_ADDED_COLUMNS.items():
+                if column not in columns:
+                    self.connection.execute(f"ALTER TABLE runs ADD COLUMN {column} {column_type}")
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def start_run(self, scenario: str, started_at: str, revision: str, params: dict[str, Any]) -> int:
+        """
+        Регистрирует запуск.
+
+        :return: Идентификатор запуска.
+        """
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO runs (scenario, started_at, revision, params) VALUES (?, ?, ?, ?)",
+                (scenario, started_at, revision, json.dumps(params, default=str))
+            )
+        return cursor.lastrowid
+
+    def add_intervals(self, run_id: int, rows: Iterable[dict[str, Any]]) -> None:
+        """
+        Добавляет статистику интервала: строки с ключами started_at, duration, route и ROUTE_STATS_COLUMNS.
+        """
+        columns = ("started_at", "duration", "route", *ROUTE_STATS_COLUMNS)
+        with self.connection:
+            self.connection.executemany(
+                f"INSERT INTO route_intervals (run_id, {', '.join(columns)}) "
+                f"VALUES (?, {', '.join('?' * len(columns))})",
+                [(run_id, *(row[column] for column in columns)) for row in rows]
+            )
+
+    def finish_run(
+            self,
+            run_id: int,
+            finished_at: str,
+            summary: dict[str, Any],
+            routes: Iterable[dict[str, Any]],
+            errors: Iterable[tuple[str, str, int]]
+    ) -> None:
+        """
+        Сохраняет итоги запуска.
+
+        :param summary: Значения колонок runs: protocol, duration, requests, failures, rps, saturated,
+            missed_launches.
+        :param routes: Итоги по маршрутам: строки с ключами route и ROUTE_STATS_COLUMNS.
+        :param errors: Ошибки: (маршрут, текст ошибки, количество).
+        """
+        columns = ("route", *ROUTE_STATS_COLUMNS)
+        with self.connection:
+            self.connection.execute(
+                "UPDATE runs SET finished_at = ?, protocol = ?, duration = ?, requests = ?, failures = ?, rps = ?, "
+                "saturated = ?, missed_launches = ? WHERE id = ?",
+                (
+                    finished_at,
+                    summary["protocol"],
+                    summary["duration"],
+                    summary["requests"],
+                    summary["failures"],
+                    summary["rps"],
+                    summary["saturated"],
+                    summary["missed_launches"],
+                    run_id
+                )
+            )
+            self.connection.executemany(
+                f"INSERT OR REPLACE INTO route_totals (run_id, {', '.join(columns)}) "
+                f"VALUES (?, {', '.join('?' * len(columns))})",
+                [(run_id, *(row[column] for column in columns)) for row in routes]
+            )
+            self.connection.executemany(
+                "INSERT INTO route_errors (run_id, route, error, occurrences) VALUES (?, ?, ?, ?)",
+                [(run_id, *error) for error in errors]
+            )
+
+    def get_runs(self, scenario: str | None = None, limit: int = 20) -> list[sqlite3.Row]:
+        query = (
+            "SELECT id, scenario, started_at, revision, protocol, duration, requests, failures, rps, saturated, "
+            "missed_launches FROM runs"
+        )
+        params: tuple = ()
+        if scenario:
+            query += " WHERE scenario LIKE ?"
+            params = (f"%{scenario}%",)
+        return self.connection.execute(f"{query} ORDER BY id DESC LIMIT ?", (*params, limit)).fetchall()
+
+    def get_run_routes(self, run_id: int) -> list[sqlite3.Row]:
+        return self.connection.execute(
+            f"SELECT route, {', '.join(ROUTE_STATS_COLUMNS)} FROM route_totals WHERE run_id = ? ORDER BY route",
+            (run_id,)
+        ).fetchall()
+
+    def get_run_errors(self, run_id: int) -> list[sqlite3.Row]:
+        return self.connection.execute(
+            "SELECT route, error, occurrences FROM route_errors WHERE run_id = ? ORDER BY occurrences DESC",
+            (run_id,)
+        ).fetchall()
+
+    def get_run_intervals(self, run_id: int, route: str | None = None) -> list[sqlite3.Row]:
+        query = f"SELECT started_at, route, {', '.join(ROUTE_STATS_COLUMNS)} FROM route_intervals WHERE run_id = ?"
+        params: tuple = (run_id,)
+        if route:
+            query += " AND route = ?"
+            params += (route,)
+        return self.connection.execute(f"{query} ORDER BY started_at, route", params).fetchall()
+
+    def get_route_trend(self, scenario: str, route: str, metric: str, limit: int = 20) -> list[sqlite3.Row]:
+        """
+        Значение метрики маршрута по последним запускам сценария (от новых к старым).
+        """
+        if metric not in TREND_METRICS:
+            raise ValueError(f"Unknown metric {metric!r}, expected one of {', '.join(TREND_METRICS)}")
+
+        return self.connection.execute(
+            f"SELECT runs.id, runs.started_at, runs.revision, runs.saturated, route_totals.{metric} AS value "
+            "FROM route_totals JOIN runs ON runs.id = route_totals.run_id "
+            "WHERE runs.scenario LIKE ? AND route_totals.route = ? ORDER BY runs.id DESC LIMIT ?",
+            (f"%{scenario}%", route, limit)
+        ).fetchall()
+
+
+def build_results_store() -> ResultsStore:
+    """
+    Открывает базу результатов по настройкам RESULTS.
+    """
+    return ResultsStore(settings.results.path)
+
+
+def print_rows(rows: Sequence[sqlite3.Row], as_json: bool) -> None:
+    if as_json:
+        print(json.dumps([dict(row) for row in rows], indent=2, ensure_ascii=False))
+        return
+    if not rows:
+        print("No rows")
+        return
+
+    columns = rows[0].keys()
+    values = [
+        [f"{value:.1f}" if isinstance(value, float) else ("" if value is None else str(value)) for value in row]
+        for row in rows
+    ]
+    widths = [max(len(column), *(len(row[index]) for row in values)) for index, column in enumerate(columns)]
+    print("  ".join(column.ljust(width) for column, width in zip(columns, widths)))
+    for row in values:
+        print("  ".join(value.ljust(width) for value, width in zip(row, widths)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--path", default=settings.results.path, help="Файл базы результатов")
+    parser.add_argument("--json", action="store_true", help="Вывести строки в JSON")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    runs = commands.add_parser("runs", help="Последние запуски")
+    runs.add_argument("--scenario", help="Подстрока имени сценария")
+    runs.add_argument("--limit", type=int, default=20)
+
+    routes = commands.add_parser("routes", help="Итоги запуска по маршрутам и ошибки")
+    routes.add_argument("run_id", type=int)
+
+    intervals = commands.add_parser("intervals", help="Статистика запуска по интервалам")
+    intervals.add_argument("run_id", type=int)
+    intervals.add_argument("--route", help="Маршрут, например \"HTTP GET /api/v1/users/{user_id}\"")
+
+    trend = commands.add_parser("trend", help="Метрика маршрута по последним запускам сценария")
+    trend.add_argument("scenario", help="Подстрока имени сценария")
+    trend.add_argument("route", help="Маршрут, например \"HTTP GET /api/v1/users/{user_id}\"")
+    trend.add_argument("--metric", choices=TREND_METRICS, default="p95")
+    trend.add_argument("--limit", type=int, default=20)
+
+    args = parser.parse_args()
+    store = ResultsStore(args.path)
+    try:
+        match args.command:
+            case "runs":
+                print_rows(store.get_runs(args.scenario, args.limit), args.json)
+            case "routes":
+                print_rows(store.get_run_routes(args.run_id), args.json)
+                errors = store.get_run_errors(args.run_id)
+                if errors and not args.json:
+                    print()
+                    print_rows(errors, as_json=False)
+            case "intervals":
+                print_rows(store.get_run_intervals(args.run_id, args.route), args.json)
+            case "trend":
+                print_rows(store.get_route_trend(args.scenario, args.route, args.metric, args.limit), args.json)
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
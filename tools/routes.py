@@ -1,4 +1,6 @@
+import re
 from enum import StrEnum
+from functools import lru_cache
 
 
 class APIRoutes(StrEnum):
@@ -7,3 +9,75 @@ class APIRoutes(StrEnum):
     ACCOUNTS = "/api/v1/accounts"
     DOCUMENTS = "/api/v1/documents"
     OPERATIONS = "/api/v1/operations"
+
+
+class APIRouteTemplates(StrEnum):
+    """
+    Реестр шаблонов маршрутов http-gateway.
+
+    Шаблон используется дважды: через .format(...) из него строится URL запроса,
+    а сам шаблон (с плейсхолдерами) передаётся как route в extensions и становится
+    именем запроса в статистике Locust. Так одна ручка — одна строка статистики,
+    сколько бы разных идентификаторов ни было в URL.
+    """
+    USERS = APIRoutes.USERS
+    USER = f"{APIRoutes.USERS}/{{user_id}}"
+
+    ACCOUNTS = APIRoutes.ACCOUNTS
+    OPEN_DEPOSIT_ACCOUNT = f"{APIRoutes.ACCOUNTS}/open-deposit-account"
+    OPEN_SAVINGS_ACCOUNT = f"{APIRoutes.ACCOUNTS}/open-savings-account"
+    OPEN_DEBIT_CARD_ACCOUNT = f"{APIRoutes.ACCOUNTS}/open-debit-card-account"
+    OPEN_CREDIT_CARD_ACCOUNT = f"{APIRoutes.ACCOUNTS}/open-credit-card-account"
+
+    ISSUE_VIRTUAL_CARD = f"{APIRoutes.CARDS}/issue-virtual-card"
+    ISSUE_PHYSICAL_CARD = f"{APIRoutes.CARDS}/issue-physical-card"
+
+    TARIFF_DOCUMENT = f"{APIRoutes.DOCUMENTS}/tariff-document/{{account_id}}"
+    CONTRACT_DOCUMENT = f"{APIRoutes.DOCUMENTS}/contract-document/{{account_id}}"
+
+    OPERATIONS = APIRoutes.OPERATIONS
+    OPERATION = f"{APIRoutes.OPERATIONS}/{{operation_id}}"
+    OPERATION_RECEIPT = f"{APIRoutes.OPERATIONS}/operation-receipt/{{operation_id}}"
+    OPERATIONS_SUMMARY = f"{APIRoutes.OPERATIONS}/operations-summary"
+    MAKE_FEE_OPERATION = f"{APIRoutes.OPERATIONS}/make-fee-operation"
+    MAKE_TOP_UP_OPERATION = f"{APIRoutes.OPERATIONS}/make-top-up-operation"
+    MAKE_CASHBACK_OPERATION = f"{APIRoutes.OPERATIONS}/make-cashback-operation"
+    MAKE_TRANSFER_OPERATION = f"{APIRoutes.OPERATIONS}/make-transfer-operation"
+    MAKE_PURCHASE_OPERATION = f"{APIRoutes.OPERATIONS}/make-purchase-operation"
+    MAKE_BILL_PAYMENT_OPERATION = f"{APIRoutes.OPERATIONS}/make-bill-payment-operation"
+    MAKE_CASH_WITHDRAWAL_OPERATION = f"{APIRoutes.OPERATIONS}/make-cash-withdrawal-operation"
+
+
+# Шаблоны, скомпилированные в регулярные выражения: плейсхолдер {name} совпадает с одним сегментом пути.
+# Статические шаблоны идут первыми, чтобы /operations/operations-summary не попал под /operations/{operation_id}.
+ROUTE_TEMPLATE_PATTERNS = [
+    (re.compile("^" + re.sub(r"\\\{\w+\\}", "[^/]+", re.escape(template)) + "$"), template)
+    for template in sorted(APIRouteTemplates, key=lambda template: template.count("{"))
+]
+
+# Сегмент пути, похожий на идентификатор: число, UUID или длинная hex-строка
+ID_SEGMENT_PATTERN = re.compile(
+    r"^(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}|[0-9a-fA-F]{16,})$"
+)
+
+
+@lru_cache(maxsize=1024)
+def normalize_route(route: str) -> str:
+    """
+    Приводит маршрут к шаблону из APIRouteTemplates, чтобы ограничить количество строк статистики.
+
+    - Известный шаблон возвращается как есть.
+    - Конкретный путь (например, /api/v1/operations/<uuid>) сопоставляется с шаблоном.
+    - Неизвестный путь возвращается с сегментами-идентификаторами, заменёнными на {id}.
+
+    :param route: Логическое имя маршрута из extensions или путь запроса.
+    :return: Шаблон маршрута с плейсхолдерами.
+    """
+    if route in APIRouteTemplates._value2member_map_:
+        return route
+
+    for pattern, template in ROUTE_TEMPLATE_PATTERNS:
+        if pattern.match(route):
+            return template
+
+    return "/".join("{id}" if ID_SEGMENT_PATTERN.match(segment) else segment for segment in route.split("/"))
@@ -0,0 +1,177 @@
+import os
+import threading
+import time
+
+from config import settings
+from logger import get_logger
+
+logger = get_logger("UNIQUE")
+
+
+class UniqueKeyGenerator:
+    """
+    Генератор уникальных 64-битных ключей по схеме Snowflake:
+
+        | 41 бит — миллисекунды от EPOCH_MS | 10 бит — номер генератора | 12 бит — счётчик |
+
+    Ключи разных процессов не пересекаются, если у процессов разные номера генератора
+    (в Locust — номер воркера). Внутри процесса ключи строго возрастают: при исчерпании
+    счётчика в текущей миллисекунде или при переводе часов назад генератор переходит
+    к следующей «логической» миллисекунде, а не ждёт — вызов никогда не блокируется.
+    """
+
+    # 2024-01-01T00:00:00Z: 41 бит миллисекунд хватает примерно на 69 лет
+    EPOCH_MS = 1_704_067_200_000
+
+    WORKER_ID_BITS = 10
+    SEQUENCE_BITS = 12
+    MAX_WORKER_ID = (1 << WORKER_ID_BITS) - 1
+    MAX_SEQUENCE = (1 << SEQUENCE_BITS) - 1
+
+    # Номер телефона по E.164 (не длиннее 15 цифр): код страны + 4 цифры номера генератора
+    # + 10 цифр логических миллисекунд от EPOCH_MS (повторяются раз в ~115 дней)
+    PHONE_COUNTRY_CODE = "7"
+    PHONE_SEQUENCE_MODULO = 10 ** 10
+    # Сколько логических миллисекунд номеров телефонов резервируется в файле состояния за раз
+    PHONE_RESERVE_BLOCK = 10_000
+
+    def __init__(self, worker_id: int, state_dir: str | None = None):
+        """
+        :param worker_id: Номер генератора (0..1023), уникальный среди одновременно работающих процессов.
+        :param state_dir: Каталог, где хранится верхняя граница выданных номеров телефонов
+            по каждому номеру генератора; None — не сохранять.
+        """
+        self.worker_id = 0
+        self.state_dir = state_dir
+        self.last_timestamp = 0
+        self.sequence = 0
+        self.phone_timestamp = 0
+        self.phone_reserved = 0
+        self.lock = threading.Lock()
+        self.set_worker_id(worker_id)
+
+    def set_worker_id(self, worker_id: int) -> None:
+        """
+        Меняет номер генератора (например, когда воркер Locust узнал свой номер у мастера).
+        """
+        if not 0 <= worker_id <= self.MAX_WORKER_ID:
+            raise ValueError(f"Unique key worker id must be in 0..{self.MAX_WORKER_ID}, got {worker_id}")
+
+        with self.lock:
+            if worker_id != self.worker_id:
+                # Граница выданных номеров своя у каждого номера генератора
+                self.phone_timestamp = 0
+                self.phone_reserved = 0
+            self.worker_id = worker_id
+
+    def get_phone_state_file(self) -> str:
+        return os.path.join(self.state_dir, f"phone-{self.worker_id}")
+
+    def load_phone_high_water(self) -> int:
+        """
+        Верхняя граница номеров телефонов, зарезервированных прошлыми запусками с тем же номером генератора.
+        """
+        try:
+            with open(self.get_phone_state_file(), encoding="utf-8") as file:
+                return int(file.read().strip() or 0)
+        except FileNotFoundError:
+            return 0
+        except ValueError:
+            logger.warning(f"Unique phone state {self.get_phone_state_file()} is corrupted, ignoring it")
+            return 0
+
+    def save_phone_high_water(self, timestamp: int) -> None:
+        os.makedirs(self.state_dir, exist_ok=True)
+        path = self.get_phone_state_file()
+        with open(f"{path}.tmp", "w", encoding="utf-8") as file:
+            file.write(str(timestamp))
+        os.replace(f"{path}.tmp", path)
+
+    def reserve_phone_numbers(self) -> None:
+        """
+        Резервирует следующий блок логических миллисекунд для номеров телефонов.
+
+        Граница записывается до выдачи номеров, поэтому следующий запуск с тем же номером
+        генератора продолжает с неё, даже если этот забежал вперёд часов или упал.
+        """
+        if self.state_dir is None:
+            self.phone_reserved = self.phone_timestamp + self.PHONE_RESERVE_BLOCK
+            return
+
+        if self.phone_reserved == 0:
+            self.phone_timestamp = max(self.phone_timestamp, self.load_phone_high_water())
+        self.phone_reserved = self.phone_timestamp + self.PHONE_RESERVE_BLOCK
+        self.save_phone_high_water(self.phone_reserved)
+
+    def next_id(self) -> int:
+        """
+        Возвращает следующий уникальный ключ.
+
+        :return: 64-битное целое.
+        """
+        with self.lock:
+            timestamp = max(time.time_ns() // 1_000_000 - self.EPOCH_MS, self.last_timestamp)
+            if timestamp == self.last_timestamp:
+                self.sequence = (self.sequence + 1) & self.MAX_SEQUENCE
+                if self.sequence == 0:
+                    timestamp += 1
+            else:
+                self.sequence = 0
+            self.last_timestamp = timestamp
+
+            return (
+                    (timestamp << (self.WORKER_ID_BITS + self.SEQUENCE_BITS))
+                    | (self.worker_id << self.SEQUENCE_BITS)
+                    | self.sequence
+            )
+
+    def next_phone_number(self) -> str:
+        """
+        Возвращает следующий уникальный номер телефона в формате E.164.
+
+        Каждый номер занимает свою логическую миллисекунду: если номера запрашивают чаще,
+        генератор забегает вперёд, а не повторяется. Номера разных процессов не пересекаются
+        за счёт номера генератора, как и ключи next_id, а номера повторных запусков с тем же
+        номером генератора — за счёт границы, сохранённой в UNIQUE.STATE_DIR.
+
+        :return: Номер вида +7GGGGTTTTTTTTTT (15 цифр).
+        """
+        with self.lock:
+            self.phone_timestamp = max(self.phone_timestamp + 1, time.time_ns() // 1_000_000 - self.EPOCH_MS)
+            if self.phone_timestamp >= self.phone_reserved:
+                self.reserve_phone_numbers()
+            return (
+                f"+{self.PHONE_COUNTRY_CODE}{self.worker_id:04d}"
+                f"{self.phone_timestamp % self.PHONE_SEQUENCE_MODULO:010d}"
+            )
+
+    def next_key(self) -> str:
+        """
+        Возвращает следующий уникальный ключ в компактном виде (base36, до 13 символов).
+        """
+        value = self.next_id()
+        digits = []
+        while value:
+            value, digit = divmod(value, 36)
+            digits.append("0123456789abcdefghijklmnopqrstuvwxyz"[digit])
+        return "".join(reversed(digits)) or "0"
+
+
+def build_unique_key_generator() -> UniqueKeyGenerator:
+    """
+    Создаёт генератор уникальных ключей процесса.
+
+    Номер генератора берётся из UNIQUE.WORKER_ID, а если он не задан — из PID процесса
+    (воркеры Locust затем переопределяют его своим номером, см. tools/locust/unique.py).
+
+    :return: UniqueKeyGenerator.
+    """
+    worker_id = settings.unique.worker_id
+    if worker_id is None:
+        worker_id = os.getpid() & UniqueKeyGenerator.MAX_WORKER_ID
+
+    return UniqueKeyGenerator(worker_id=worker_id, state_dir=settings.unique.state_dir or None)
+
+
+# Генератор уникальных ключей процесса
+unique = build_unique_key_generator()